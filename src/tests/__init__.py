@@ -0,0 +1,8 @@
+#!/usr/bin/env python3
+import os
+import sys
+
+# Tests import the package from the source tree, and widgets are created on
+# the offscreen platform when there is no display
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
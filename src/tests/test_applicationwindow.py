@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+import os
+import unittest
+
+try:
+    from PySide6 import QtCore, QtGui, QtWidgets
+    from __feature__ import snake_case
+    from xside import widgets
+except ImportError:
+    widgets = None
+
+# Platform() reads the desktop session, that a test run may not have
+for name in ('DESKTOP_SESSION', 'XDG_SESSION_DESKTOP', 'XDG_CURRENT_DESKTOP'):
+    os.environ.setdefault(name, 'gnome')
+
+EVENTS = 50
+
+
+@unittest.skipIf(widgets is None, 'PySide6 is not installed')
+class TestRestyleCount(unittest.TestCase):
+    """The central widget is only restyled when its style sheet changes"""
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.app = (
+            QtWidgets.QApplication.instance() or QtWidgets.QApplication([]))
+
+    def setUp(self) -> None:
+        self.window = widgets.ApplicationWindow(server_side_decoration=True)
+        self.window.show()
+        self.app.process_events()
+
+    def tearDown(self) -> None:
+        self.window.close()
+        self.window.delete_later()
+        self.app.process_events()
+
+    def send_events(self) -> None:
+        for number in range(EVENTS):
+            size = QtCore.QSize(300 + number, 300 + number)
+            QtWidgets.QApplication.send_event(
+                self.window, QtGui.QResizeEvent(size, size))
+            QtWidgets.QApplication.send_event(
+                self.window, QtGui.QWindowStateChangeEvent(
+                    QtCore.Qt.WindowNoState))
+
+    def test_resize_and_state_events_skip_restyles(self) -> None:
+        skipped = self.window.restyle_count()['skipped']
+        self.send_events()
+
+        count = self.window.restyle_count()
+        self.assertEqual(count['applied'], 1)
+        self.assertGreaterEqual(count['skipped'], skipped + EVENTS * 2)
+
+    def test_new_style_sheet_is_applied_once(self) -> None:
+        self.window.set_style_sheet('QLabel { color: red; }')
+        applied = self.window.restyle_count()['applied']
+        self.send_events()
+
+        self.assertEqual(applied, 2)
+        self.assertEqual(self.window.restyle_count()['applied'], applied)
+        self.assertIn(
+            'color: red', self.window.central_widget().style_sheet())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+import os
+import unittest
+
+try:
+    from PIL import Image, ImageStat
+    from xside.adds.blur import BLUR_QUALITY_TIERS, Blur, benchmark
+except ImportError:
+    Blur = None
+
+# Typical window size of the frame-rate target, in the lowest tier
+TARGET_SIZE = (800, 600)
+TARGET_MILLISECONDS = 16
+
+
+@unittest.skipIf(Blur is None, 'Pillow is not installed')
+class TestBlur(unittest.TestCase):
+    """Output of each quality tier"""
+    def test_size_and_mode(self) -> None:
+        for quality in BLUR_QUALITY_TIERS:
+            for mode in ('RGBA', 'RGB'):
+                for size in ((101, 37), (64, 64), (3, 3), (1, 1)):
+                    with self.subTest(quality=quality, mode=mode, size=size):
+                        image = Image.new(mode, size, 'red')
+                        blurred = Blur(5, quality).apply(image)
+                        self.assertEqual(blurred.size, size)
+                        self.assertEqual(blurred.mode, mode)
+
+    def test_solid_color_is_kept(self) -> None:
+        image = Image.new('RGBA', (120, 80), (40, 80, 120, 255))
+        for quality in BLUR_QUALITY_TIERS:
+            with self.subTest(quality=quality):
+                blurred = Blur(10, quality).apply(image)
+                for band, value in zip(
+                        ImageStat.Stat(blurred).mean, (40, 80, 120, 255)):
+                    self.assertAlmostEqual(band, value, delta=1)
+
+    def test_detail_is_blurred(self) -> None:
+        image = Image.new('L', (128, 128))
+        image.putdata([
+            255 * ((x // 4 + y // 4) % 2)
+            for y in range(128) for x in range(128)])
+        image = image.convert('RGBA')
+        detail = ImageStat.Stat(image).stddev[0]
+        for quality in BLUR_QUALITY_TIERS:
+            with self.subTest(quality=quality):
+                blurred = Blur(8, quality).apply(image)
+                self.assertLess(ImageStat.Stat(blurred).stddev[0], detail / 4)
+
+    def test_unknown_quality(self) -> None:
+        with self.assertRaises(ValueError):
+            Blur(5, 'ultra')
+
+    @unittest.skipUnless(
+        os.environ.get('XSIDE_BENCHMARK'),
+        'Set XSIDE_BENCHMARK=1 to check the blur time target')
+    def test_frame_rate_target(self) -> None:
+        milliseconds = benchmark((TARGET_SIZE,), radius=15, repeat=5)[
+            TARGET_SIZE]['low']
+        self.assertLess(milliseconds, TARGET_MILLISECONDS)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+import os
+import unittest
+
+try:
+    from PySide6 import QtCore, QtGui, QtWidgets
+    from __feature__ import snake_case
+    from xside import widgets
+except ImportError:
+    widgets = None
+
+# Platform() reads the desktop session, that a test run may not have
+for name in ('DESKTOP_SESSION', 'XDG_SESSION_DESKTOP', 'XDG_CURRENT_DESKTOP'):
+    os.environ.setdefault(name, 'gnome')
+
+EVENTS = 50
+
+
+@unittest.skipIf(widgets is None, 'PySide6 is not installed')
+class TestUniqueConnections(unittest.TestCase):
+    """..."""
+    def test_reconnect_replaces_the_connection(self) -> None:
+        timer = QtCore.QTimer()
+        calls = []
+        connections = widgets.UniqueConnections()
+        for number in range(EVENTS):
+            connections.connect(
+                'timeout', timer.timeout, lambda n=number: calls.append(n))
+
+        timer.timeout.emit()
+        self.assertEqual(calls, [EVENTS - 1])
+        self.assertEqual(timer.receivers(QtCore.SIGNAL('timeout()')), 1)
+        self.assertEqual(len(connections), 1)
+
+    def test_disconnect_all(self) -> None:
+        timer = QtCore.QTimer()
+        connections = widgets.UniqueConnections()
+        connections.connect('a', timer.timeout, lambda: None)
+        connections.connect('b', timer.timeout, lambda: None)
+        connections.disconnect_all()
+
+        self.assertEqual(timer.receivers(QtCore.SIGNAL('timeout()')), 0)
+        self.assertFalse(connections.is_connected('a'))
+
+
+@unittest.skipIf(widgets is None, 'PySide6 is not installed')
+class TestEventConnections(unittest.TestCase):
+    """Slots connected from event handlers are connected once"""
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.app = (
+            QtWidgets.QApplication.instance() or QtWidgets.QApplication([]))
+
+    def setUp(self) -> None:
+        self.window = widgets.ApplicationWindow()
+        self.window.show()
+        self.app.process_events()
+
+    def tearDown(self) -> None:
+        self.window.close()
+        self.window.delete_later()
+        self.app.process_events()
+
+    def test_maximize_button_after_resize_events(self) -> None:
+        button = widgets.ControlButton(self.window, 1)
+        signal = QtCore.SIGNAL('clicked(bool)')
+        for number in range(EVENTS):
+            size = QtCore.QSize(300 + number, 300 + number)
+            QtWidgets.QApplication.send_event(
+                self.window, QtGui.QResizeEvent(size, size))
+
+        self.assertEqual(button.receivers(signal), 1)
+
+    def test_hover_timer_after_hover_enter_events(self) -> None:
+        timer = self.window._ApplicationWindow__timer
+        point = QtCore.QPointF(1, 1)
+        for _ in range(EVENTS):
+            QtWidgets.QApplication.send_event(
+                self.window, QtGui.QHoverEvent(
+                    QtCore.QEvent.HoverEnter, point, point,
+                    QtCore.QPointF(0, 0)))
+
+        self.assertEqual(timer.receivers(QtCore.SIGNAL('timeout()')), 1)
+        self.assertTrue(timer.is_single_shot())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+import os
+import unittest
+
+try:
+    import shiboken6
+    from PySide6 import QtCore, QtWidgets
+    from __feature__ import snake_case
+    from xside import widgets
+    from xside.widgets.contextmenu import (
+        ContextMenuButton, ContextMenuButtonPool)
+except ImportError:
+    widgets = None
+
+# Platform() reads the desktop session, that a test run may not have
+for name in ('DESKTOP_SESSION', 'XDG_SESSION_DESKTOP', 'XDG_CURRENT_DESKTOP'):
+    os.environ.setdefault(name, 'gnome')
+
+
+@unittest.skipIf(widgets is None, 'PySide6 is not installed')
+class TestContextMenuButtonPool(unittest.TestCase):
+    """Action buttons go back to the pool of the toplevel"""
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.app = (
+            QtWidgets.QApplication.instance() or QtWidgets.QApplication([]))
+
+    def setUp(self) -> None:
+        self.window = widgets.ApplicationWindow()
+        self.pool = ContextMenuButtonPool.pool(self.window)
+
+    def tearDown(self) -> None:
+        if shiboken6.isValid(self.window):
+            self.window.close()
+            self.window.delete_later()
+        self.app.process_events()
+
+    def open_menu(self, actions: int) -> 'widgets.ContextMenu':
+        menu = widgets.ContextMenu(self.window)
+        for number in range(actions):
+            menu.add_action(f'Action {number}', lambda: None)
+        menu.exec(QtCore.QPoint(10, 10))
+        menu.close()
+        return menu
+
+    def buttons(self, menu: 'widgets.ContextMenu') -> list:
+        return menu.find_children(ContextMenuButton)
+
+    def test_clear(self) -> None:
+        menu = self.open_menu(3)
+        buttons = self.buttons(menu)
+        self.assertEqual(len(buttons), 3)
+
+        menu.clear()
+        self.assertEqual(len(self.pool), 3)
+        self.assertEqual(self.buttons(menu), [])
+        self.assertCountEqual(self.buttons(self.open_menu(3)), buttons)
+        self.assertEqual(len(self.pool), 0)
+
+    def test_deleted_menu(self) -> None:
+        menu = self.open_menu(3)
+        buttons = self.buttons(menu)
+        shiboken6.delete(menu)
+
+        self.assertEqual(len(self.pool), 3)
+        self.assertTrue(all(shiboken6.isValid(x) for x in buttons))
+        reused = self.buttons(self.open_menu(2))
+        self.assertEqual(len(reused), 2)
+        self.assertTrue(all(x in buttons for x in reused))
+        self.assertEqual(len(self.pool), 1)
+
+    def test_deleted_later_menu(self) -> None:
+        menu = self.open_menu(2)
+        menu.delete_later()
+        self.app.send_posted_events(None, QtCore.QEvent.DeferredDelete)
+
+        self.assertEqual(len(self.pool), 2)
+
+    def test_deleted_toplevel(self) -> None:
+        menu = self.open_menu(2)
+        released = self.buttons(menu)
+        menu.clear()
+        menu = self.open_menu(1)
+        buttons = self.buttons(menu)
+        pooled = [x for x in released if x not in buttons]
+        self.assertEqual(len(pooled), 1)
+        shiboken6.delete(self.window)
+        self.app.send_posted_events(None, QtCore.QEvent.DeferredDelete)
+
+        # The closed pool deleted its buttons, and the buttons of a menu
+        # deleted after the toplevel are deleted with the menu
+        self.assertFalse(shiboken6.isValid(pooled[0]))
+        shiboken6.delete(menu)
+        self.assertEqual(len(self.pool), 0)
+        self.assertFalse(any(shiboken6.isValid(x) for x in buttons))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+import unittest
+
+try:
+    from PySide6 import QtCore
+    from __feature__ import snake_case
+    from xside.adds.governor import QualityGovernor
+except ImportError:
+    QualityGovernor = None
+
+SLOW = {'capture': 20.0, 'blur': 100.0}
+FAST = {'capture': 5.0, 'blur': 10.0}
+
+
+@unittest.skipIf(QualityGovernor is None, 'PySide6 is not installed')
+class TestQualityGovernor(unittest.TestCase):
+    """Tier changes under slow and fast updates"""
+    def setUp(self) -> None:
+        self.governor = QualityGovernor(budget=100.0, samples=3, tier='high')
+        self.tiers = []
+        self.governor.quality_tier_changed_signal.connect(self.tiers.append)
+
+    def record(self, timings: dict, count: int) -> None:
+        for _ in range(count):
+            self.governor.record(timings)
+
+    def test_slow_updates_step_down(self) -> None:
+        self.record(SLOW, 2)
+        self.assertEqual(self.governor.tier(), 'high')
+
+        self.record(SLOW, 1)
+        self.assertEqual(self.governor.tier(), 'medium')
+        self.assertEqual(self.governor.last_timings(), SLOW)
+
+        self.record(SLOW, 6)
+        self.assertEqual(self.governor.tier(), 'minimal')
+        self.assertEqual(self.governor.blur_quality(), 'low')
+        self.assertEqual(self.governor.radius_scale(), 0.5)
+        self.assertEqual(self.governor.min_interval(), 1000)
+
+        # There is no cheaper tier
+        self.record(SLOW, 3)
+        self.assertEqual(self.governor.tier(), 'minimal')
+
+    def test_fast_updates_step_back_up(self) -> None:
+        self.record(SLOW, 6)
+        self.assertEqual(self.governor.tier(), 'low')
+
+        self.record(FAST, 3)
+        self.assertEqual(self.governor.tier(), 'medium')
+        self.record(FAST, 3)
+        self.assertEqual(self.governor.tier(), 'high')
+
+        # Never above the tier that was set
+        self.record(FAST, 3)
+        self.assertEqual(self.governor.tier(), 'high')
+
+    def test_mixed_updates_keep_the_tier(self) -> None:
+        self.record(SLOW, 2)
+        self.record(FAST, 1)
+        self.record({'blur': 70.0}, 3)
+        self.assertEqual(self.governor.tier(), 'high')
+        self.assertEqual(self.tiers, [])
+
+    def test_signal_on_each_change(self) -> None:
+        self.record(SLOW, 6)
+        self.record(FAST, 3)
+        self.governor.set_tier('low')
+        self.governor.set_tier('low')
+
+        self.assertEqual(self.tiers, ['medium', 'low', 'medium', 'low'])
+
+    def test_disabled(self) -> None:
+        self.record(SLOW, 3)
+        self.governor.set_enabled(False)
+        self.assertEqual(self.governor.tier(), 'high')
+
+        self.record(SLOW, 6)
+        self.assertEqual(self.governor.tier(), 'high')
+        self.assertEqual(self.tiers, ['medium', 'high'])
+
+    def test_unknown_tier(self) -> None:
+        with self.assertRaises(ValueError):
+            self.governor.set_tier('ultra')
+
+
+if __name__ == '__main__':
+    unittest.main()
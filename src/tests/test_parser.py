@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+try:
+    from PySide6 import QtCore
+    from __feature__ import snake_case
+    from xside.modules import parser
+except ImportError:
+    parser = None
+
+
+def _write(path: str, text: str) -> str:
+    # Write a file, and its directories
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as desktop_file:
+        desktop_file.write(text)
+    return path
+
+
+def _entry(name: str, **keys) -> str:
+    # Desktop file text with a "[Desktop Entry]" group
+    lines = ['[Desktop Entry]', 'Type=Application', f'Name={name}']
+    lines += [f'{key}={value}' for key, value in keys.items()]
+    return '\n'.join(lines) + '\n'
+
+
+@unittest.skipIf(parser is None, 'PySide6 is not installed')
+class TestDesktopFileLocates(unittest.TestCase):
+    """Desktop file IDs and shadowing between data dirs"""
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.user = os.path.join(self.directory, 'home', 'applications')
+        self.system = os.path.join(self.directory, 'usr', 'applications')
+        os.makedirs(self.user)
+        os.makedirs(self.system)
+        self.locates = parser.DesktopFileLocates([self.user, self.system])
+
+    def test_subdirectory_ids(self) -> None:
+        foo = _write(
+            os.path.join(self.system, 'kde4', 'foo.desktop'), _entry('Foo'))
+        bar = _write(
+            os.path.join(self.system, 'kde4', 'net', 'bar.desktop'),
+            _entry('Bar'))
+        _write(os.path.join(self.system, 'kde4', 'foo.desktop~'), '')
+
+        self.assertEqual(
+            self.locates.desktop_file_ids,
+            {'kde4-foo.desktop': foo, 'kde4-net-bar.desktop': bar})
+
+    def test_user_entry_shadows_system_entry(self) -> None:
+        user_foo = _write(
+            os.path.join(self.user, 'foo.desktop'), _entry('User Foo'))
+        system_foo = _write(
+            os.path.join(self.system, 'foo.desktop'), _entry('Foo'))
+        system_bar = _write(
+            os.path.join(self.system, 'bar.desktop'), _entry('Bar'))
+
+        self.assertEqual(
+            self.locates.desktop_file_ids,
+            {'foo.desktop': user_foo, 'bar.desktop': system_bar})
+        self.assertEqual(
+            sorted(self.locates.ulrs),
+            sorted([user_foo, system_foo, system_bar]))
+        self.assertEqual(
+            sorted(self.locates.ulrs_by_priority),
+            sorted([user_foo, system_bar]))
+
+    def test_subdirectory_entry_is_shadowed_by_its_id(self) -> None:
+        # "kde4/foo.desktop" is shadowed by "kde4-foo.desktop", not by
+        # "foo.desktop"
+        user_foo = _write(
+            os.path.join(self.user, 'foo.desktop'), _entry('Foo'))
+        user_kde_foo = _write(
+            os.path.join(self.user, 'kde4-foo.desktop'), _entry('Foo'))
+        system_kde_foo = _write(
+            os.path.join(self.system, 'kde4', 'foo.desktop'), _entry('Foo'))
+
+        self.assertEqual(
+            self.locates.desktop_file_ids,
+            {'foo.desktop': user_foo, 'kde4-foo.desktop': user_kde_foo})
+        self.assertNotIn(system_kde_foo, self.locates.ulrs_by_priority)
+
+
+@unittest.skipIf(parser is None, 'PySide6 is not installed')
+class TestDesktopFile(unittest.TestCase):
+    """Escapes, localized keys and groups of a desktop file"""
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def desktop_file(
+            self, text: str, name: str = 'foo') -> 'parser.DesktopFile':
+        return parser.DesktopFile(_write(
+            os.path.join(self.directory, f'{name}.desktop'), text))
+
+    def test_escapes(self) -> None:
+        desktop_file = self.desktop_file(_entry(
+            'Foo', Comment='One\\sTwo\\nThree\\tFour\\\\s'))
+        self.assertEqual(
+            desktop_file.value('Comment'), 'One Two\nThree\tFour\\s')
+
+    def test_escaped_separator_in_list_values(self) -> None:
+        desktop_file = self.desktop_file(_entry(
+            'Foo', Keywords='semi\\;colon;new\\nline;last', Actions='a;b;'))
+        self.assertEqual(
+            desktop_file.values('Keywords'),
+            ['semi;colon', 'new\nline', 'last'])
+        self.assertEqual(desktop_file.values('Actions'), ['a', 'b'])
+        self.assertEqual(desktop_file.values('MimeType'), [])
+
+    def test_localized_keys(self) -> None:
+        desktop_file = self.desktop_file(
+            _entry('Foo') + 'Name[de]=Föö\nName[de_AT]=Fu\n'
+            'Name[sr@latin]=Fo\n')
+        self.assertEqual(desktop_file.value('Name', locale='de'), 'Föö')
+        self.assertEqual(
+            desktop_file.value('Name', locale='de_DE.UTF-8'), 'Föö')
+        self.assertEqual(
+            desktop_file.value('Name', locale='de_AT.UTF-8'), 'Fu')
+        self.assertEqual(
+            desktop_file.value('Name', locale='sr_RS@latin'), 'Fo')
+        self.assertEqual(desktop_file.value('Name', locale='fr_FR'), 'Foo')
+        self.assertEqual(desktop_file.value('Name', locale=''), 'Foo')
+        self.assertEqual(desktop_file.value('Name', locale='C'), 'Foo')
+
+    def test_value_line_that_starts_with_a_bracket(self) -> None:
+        desktop_file = self.desktop_file(
+            _entry('Foo') + '[not=a header]\nComment=Bar\n\n'
+            '[Desktop Action new]\nName=New\n')
+        self.assertEqual(
+            desktop_file.groups, ['[Desktop Entry]', '[Desktop Action new]'])
+        self.assertEqual(desktop_file.value('Comment'), 'Bar')
+        self.assertEqual(
+            desktop_file.group('[Desktop Entry]')['[not'], 'a header]')
+        self.assertEqual(
+            desktop_file.value('Name', '[Desktop Action new]'), 'New')
+        self.assertEqual(desktop_file.group('[Missing]'), {})
+
+    def test_sort_by_unescaped_name(self) -> None:
+        # Sorted by their raw names, "A\sz" would go after "A[b"
+        escaped = self.desktop_file(_entry('A\\sz'), 'escaped')
+        bracket = self.desktop_file(_entry('A[b'), 'bracket')
+        localized = self.desktop_file(
+            _entry('A~') + 'Name[de]=Aa\n', 'localized')
+        unnamed = self.desktop_file('[Desktop Entry]\nType=Link\n', 'a')
+
+        self.assertEqual(escaped.sort_key, 'a z')
+        self.assertEqual(unnamed.sort_key, 'a')
+        self.assertEqual(
+            [x.url for x in sorted([localized, bracket, unnamed, escaped])],
+            [x.url for x in (unnamed, escaped, bracket, localized)])
+        self.assertEqual(str(escaped), '<DesktopFile: A z>')
+
+
+@unittest.skipIf(parser is None, 'PySide6 is not installed')
+class TestDesktopFileIndex(unittest.TestCase):
+    """Cache file and lookups of the index"""
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.cache_path = os.path.join(self.directory, 'cache', 'index.cache')
+        self.foo = _write(
+            os.path.join(self.directory, 'foo.desktop'),
+            _entry(
+                'Foo', Exec='env A=1 /usr/bin/foo %u',
+                Categories='Network;WebBrowser;'))
+        self.bar = _write(
+            os.path.join(self.directory, 'bar.desktop'),
+            _entry('Bar', Exec='"/opt/bar/bar" --new', Categories='Office;'))
+        self.urls = [self.foo, self.bar]
+
+    def test_cache_hit(self) -> None:
+        parser.DesktopFileIndex(self.urls, self.cache_path)
+        self.assertTrue(os.path.isfile(self.cache_path))
+
+        # Same size and modification time, so the cached content is used
+        stat = os.stat(self.foo)
+        _write(self.foo, _entry(
+            'Fox', Exec='env A=1 /usr/bin/foo %u',
+            Categories='Network;WebBrowser;'))
+        os.utime(self.foo, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        index = parser.DesktopFileIndex(self.urls, self.cache_path)
+        self.assertEqual(index.update(self.urls), ([], [], []))
+        self.assertEqual(index.desktop_file(self.foo).value('Name'), 'Foo')
+        self.assertEqual(
+            [x.url for x in index.desktop_files], self.urls)
+
+    def test_cache_rebuilt_after_a_change(self) -> None:
+        parser.DesktopFileIndex(self.urls, self.cache_path)
+        _write(self.foo, _entry('Foo Two'))
+        os.remove(self.bar)
+
+        index = parser.DesktopFileIndex([self.foo], self.cache_path)
+        self.assertEqual(
+            index.desktop_file(self.foo).value('Name'), 'Foo Two')
+        self.assertIsNone(index.desktop_file(self.bar))
+
+        # The next index reads the saved changes
+        new_url = _write(
+            os.path.join(self.directory, 'baz.desktop'), _entry('Baz'))
+        self.assertEqual(
+            index.update([self.foo, new_url]), ([new_url], [], []))
+        index = parser.DesktopFileIndex([self.foo, new_url], self.cache_path)
+        self.assertEqual(index.update([self.foo, new_url]), ([], [], []))
+        self.assertEqual(
+            index.desktop_file(self.foo).value('Name'), 'Foo Two')
+
+    def test_find_by_exec_and_category(self) -> None:
+        index = parser.DesktopFileIndex(self.urls, self.cache_path)
+        self.assertEqual(
+            [x.url for x in index.find_by_exec('foo')], [self.foo])
+        self.assertEqual(
+            [x.url for x in index.find_by_exec('/usr/local/bin/bar')],
+            [self.bar])
+        self.assertEqual(
+            [x.url for x in index.find_by_category('network')], [self.foo])
+        self.assertEqual(
+            [x.url for x in index.find_by_category('WebBrowser')],
+            [self.foo])
+        self.assertEqual(index.find_by_exec('env'), [])
+        self.assertEqual(index.find_by_category('Game'), [])
+
+
+@unittest.skipIf(parser is None, 'PySide6 is not installed')
+class TestLoadAll(unittest.TestCase):
+    """Bulk loading gives the same entries with any executor"""
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.urls = [
+            _write(
+                os.path.join(self.directory, f'app{number}.desktop'),
+                _entry(f'App {number}', Categories=f'Cat{number % 3};'))
+            for number in range(9)]
+        self.urls.append(os.path.join(self.directory, 'missing.desktop'))
+        self.expected = {
+            url: parser.DesktopFile(url).content for url in self.urls[:-1]}
+
+    def assert_loaded(self, desktop_files: dict) -> None:
+        self.assertEqual(list(desktop_files), list(self.expected))
+        self.assertEqual(
+            {url: x.content for url, x in desktop_files.items()},
+            self.expected)
+
+    def test_sequential(self) -> None:
+        self.assert_loaded(parser.load_all(self.urls, chunk_size=100))
+
+    def test_threads(self) -> None:
+        self.assert_loaded(parser.load_all(
+            self.urls, chunk_size=2, max_workers=3))
+
+    def test_processes(self) -> None:
+        self.assert_loaded(parser.load_all(
+            self.urls, chunk_size=2, max_workers=2, use_processes=True))
+
+    def test_iter_load_all_yields_each_url_once(self) -> None:
+        urls = [url for url, _ in parser.iter_load_all(
+            self.urls, chunk_size=2, max_workers=3)]
+        self.assertEqual(sorted(urls), sorted(self.expected))
+
+
+@unittest.skipIf(parser is None, 'PySide6 is not installed')
+class TestWatchedDesktopFileIndex(unittest.TestCase):
+    """Deltas emitted when the watched directories change"""
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.app = QtCore.QCoreApplication.instance() or (
+            QtCore.QCoreApplication([]))
+
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+        self.applications = os.path.join(
+            self.directory, 'data', 'applications')
+        os.makedirs(self.applications)
+
+        environ = {
+            'XDG_DATA_HOME': os.path.join(self.directory, 'home'),
+            'XDG_DATA_DIRS': os.path.join(self.directory, 'data')}
+        old_environ = {name: os.environ.get(name) for name in environ}
+        os.environ.update(environ)
+        self.addCleanup(self.__restore_environ, old_environ)
+        self.addCleanup(shutil.rmtree, self.directory)
+
+        self.index = parser.WatchedDesktopFileIndex(
+            cache_path=os.path.join(self.directory, 'cache', 'index.cache'),
+            watch_files=True, delay=10)
+        self.deltas = []
+        self.index.index_changed_signal.connect(self.deltas.append)
+
+    def wait_for_delta(self) -> dict:
+        deadline = time.monotonic() + 5
+        while not self.deltas and time.monotonic() < deadline:
+            self.app.process_events(QtCore.QEventLoop.AllEvents, 50)
+            time.sleep(0.01)
+        self.assertTrue(self.deltas, 'No delta was emitted')
+        return self.deltas.pop(0)
+
+    def test_create_edit_and_remove(self) -> None:
+        url = _write(
+            os.path.join(self.applications, 'foo.desktop'), _entry('Foo'))
+        self.assertEqual(
+            self.wait_for_delta(),
+            {'added': [url], 'removed': [], 'modified': []})
+        self.assertEqual(
+            self.index.index.desktop_file(url).value('Name'), 'Foo')
+
+        # Edited in place, the size changes too
+        _write(url, _entry('Foo Bar'))
+        self.assertEqual(
+            self.wait_for_delta(),
+            {'added': [], 'removed': [], 'modified': [url]})
+        self.assertEqual(
+            self.index.index.desktop_file(url).value('Name'), 'Foo Bar')
+
+        os.remove(url)
+        self.assertEqual(
+            self.wait_for_delta(),
+            {'added': [], 'removed': [url], 'modified': []})
+        self.assertIsNone(self.index.index.desktop_file(url))
+
+    @staticmethod
+    def __restore_environ(environ: dict) -> None:
+        for name, value in environ.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+import unittest
+
+try:
+    from PySide6 import QtCore
+    from __feature__ import snake_case
+    from xside.adds.stats import (
+        HISTOGRAM_BUCKETS, StageHistogram, TextureStats)
+except ImportError:
+    TextureStats = None
+
+
+@unittest.skipIf(TextureStats is None, 'PySide6 is not installed')
+class TestStageHistogram(unittest.TestCase):
+    """..."""
+    def test_bucket_boundaries(self) -> None:
+        histogram = StageHistogram()
+        for milliseconds in (0.0, 1.0, 1.01, 2.0, 5.0, 1000.0, 1000.5):
+            histogram.add(milliseconds)
+
+        buckets = histogram.as_dict()['buckets']
+        self.assertEqual(buckets['<=1'], 2)
+        self.assertEqual(buckets['<=2'], 2)
+        self.assertEqual(buckets['<=5'], 1)
+        self.assertEqual(buckets['<=1000'], 1)
+        self.assertEqual(buckets['>1000'], 1)
+        self.assertEqual(
+            list(buckets),
+            [f'<={x}' for x in HISTOGRAM_BUCKETS] + ['>1000'])
+        self.assertEqual(sum(buckets.values()), 7)
+
+    def test_empty(self) -> None:
+        self.assertEqual(StageHistogram().as_dict(), {
+            'count': 0, 'total_ms': 0.0, 'mean_ms': 0.0, 'max_ms': 0.0,
+            'buckets': dict.fromkeys(
+                [f'<={x}' for x in HISTOGRAM_BUCKETS] + ['>1000'], 0)})
+
+
+@unittest.skipIf(TextureStats is None, 'PySide6 is not installed')
+class TestTextureStats(unittest.TestCase):
+    """..."""
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.app = QtCore.QCoreApplication.instance() or (
+            QtCore.QCoreApplication([]))
+
+    def test_as_dict(self) -> None:
+        stats = TextureStats()
+        stats.add_timings({'blur': 40.0, 'crop': 1.5})
+        stats.add_timing('blur', 20.0)
+        stats.count('updates')
+        stats.count('updates')
+        stats.count('bytes_written', 1024)
+
+        snapshot = stats.as_dict()
+        self.assertEqual(
+            set(snapshot), {'seconds', 'stages', 'counters'})
+        self.assertGreaterEqual(snapshot['seconds'], 0)
+        self.assertEqual(
+            snapshot['counters'], {'updates': 2, 'bytes_written': 1024})
+
+        blur = snapshot['stages']['blur']
+        self.assertEqual(blur['count'], 2)
+        self.assertEqual(blur['total_ms'], 60.0)
+        self.assertEqual(blur['mean_ms'], 30.0)
+        self.assertEqual(blur['max_ms'], 40.0)
+        self.assertEqual(blur['buckets']['<=20'], 1)
+        self.assertEqual(blur['buckets']['<=50'], 1)
+        self.assertEqual(snapshot['stages']['crop']['buckets']['<=2'], 1)
+
+    def test_reset(self) -> None:
+        stats = TextureStats()
+        stats.add_timing('blur', 40.0)
+        stats.count('updates')
+        stats.reset()
+
+        snapshot = stats.as_dict()
+        self.assertEqual(snapshot['stages'], {})
+        self.assertEqual(snapshot['counters'], {})
+
+    def test_log_interval(self) -> None:
+        stats = TextureStats()
+        self.assertEqual(stats.log_interval(), 0)
+        stats.set_log_interval(5)
+        self.assertEqual(stats.log_interval(), 5)
+        stats.set_log_interval(0)
+        self.assertEqual(stats.log_interval(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
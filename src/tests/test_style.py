@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+import unittest
+
+try:
+    from xside.modules.style import Style, StyleParser
+except ImportError:
+    StyleParser = None
+
+
+@unittest.skipIf(StyleParser is None, 'PySide6 is not installed')
+class TestStyleParser(unittest.TestCase):
+    """..."""
+    def test_braces_in_quoted_url(self) -> None:
+        parser = StyleParser(
+            'A { background: url("a{b}.png"); color: red; }')
+        self.assertEqual(
+            parser.widget_scope('A'),
+            'background: url("a{b}.png"); color: red;')
+
+    def test_braces_in_unquoted_url(self) -> None:
+        parser = StyleParser('A { background: url(a{b};.png); }')
+        self.assertEqual(
+            parser.widget_scope('A'), 'background: url(a{b};.png);')
+
+    def test_comments_with_braces(self) -> None:
+        parser = StyleParser(
+            '/* B { color: blue; } */ A { /* } */ color: red; }')
+        self.assertEqual(parser.widget_scope('A'), 'color: red;')
+        self.assertEqual(parser.widget_scope('B'), '')
+        self.assertEqual(len(parser.rules()), 1)
+
+    def test_id_selectors(self) -> None:
+        parser = StyleParser(
+            '#ContextMenu { color: red; } QFrame#Panel { color: blue; }')
+        self.assertEqual(parser.widget_scope('ContextMenu'), 'color: red;')
+        self.assertEqual(parser.widget_scope('QFrame'), 'color: blue;')
+
+    def test_pseudo_state_lookup(self) -> None:
+        parser = StyleParser(
+            'A:hover { color: blue; } A { color: red; } '
+            'A:hover:!pressed { color: green; }')
+        self.assertEqual(parser.widget_scope('A'), 'color: red;')
+        self.assertEqual(parser.widget_scope('A', 'hover'), 'color: blue;')
+        self.assertEqual(
+            parser.widget_scope('A', 'hover:!pressed'), 'color: green;')
+        self.assertEqual(parser.widget_scope('A', 'pressed'), '')
+
+    def test_exact_widget_match(self) -> None:
+        parser = StyleParser(
+            'Button { color: red; } ButtonLabel { color: blue; } '
+            'Frame Button { color: green; } Button::indicator { a: b; }')
+        self.assertEqual(parser.widget_scope('Button'), 'color: red;')
+
+    def test_nested_blocks_are_skipped(self) -> None:
+        parser = StyleParser('A { color: red; B { color: blue; } a: b; }')
+        self.assertEqual(parser.widget_scope('A'), 'color: red; a: b;')
+        self.assertEqual(parser.widget_scope('B'), '')
+
+    def test_redeclared_property_wins(self) -> None:
+        parser = StyleParser('A { color: red; margin: 1px; color: blue; }')
+        self.assertEqual(
+            parser.widget_scope('A'), 'margin: 1px; color: blue;')
+
+    def test_merge_override_order(self) -> None:
+        parser = StyleParser('A { color: red; margin: 1px; } B { a: b; }')
+        parser.merge('A { color: blue; } C { c: d; }')
+        self.assertEqual(
+            parser.widget_scope('A'), 'margin: 1px; color: blue;')
+        self.assertEqual(
+            parser.style_sheet(),
+            'A {margin: 1px; color: blue;} B {a: b;} C {c: d;} ')
+
+    def test_merge_matches_full_parse(self) -> None:
+        parser = StyleParser('A { color: red; } A:hover { color: blue; }')
+        parser.merge('A:hover { color: green; margin: 0; }')
+        full = StyleParser(
+            'A { color: red; } A:hover { color: blue; } '
+            'A:hover { color: green; margin: 0; }')
+        self.assertEqual(parser.style_sheet(), full.style_sheet())
+        self.assertEqual(parser.rules(), full.rules())
+
+
+@unittest.skipIf(StyleParser is None, 'PySide6 is not installed')
+class TestFullscreenAdaptedStyle(unittest.TestCase):
+    """..."""
+    style = 'MainWindow { color: red; border-radius: 8px; } A { color: blue; }'
+
+    def test_style_sheet_string(self) -> None:
+        style = Style.fullscreen_adapted_style(self.style)
+        self.assertTrue(style.startswith(self.style))
+        self.assertEqual(
+            StyleParser(style).widget_scope('MainWindow'),
+            'color: red; border-radius: 0px; border: 0px;')
+
+    def test_style_parser(self) -> None:
+        parser = StyleParser(self.style)
+        self.assertEqual(
+            Style.fullscreen_adapted_style(parser),
+            Style.fullscreen_adapted_style(parser.style_sheet()))
+
+
+if __name__ == '__main__':
+    unittest.main()
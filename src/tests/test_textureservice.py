@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+try:
+    from PIL import Image
+    from PySide6 import QtGui
+    from __feature__ import snake_case
+    from xside.adds import textureservice
+except ImportError:
+    textureservice = None
+
+
+def _frame(color: tuple, size: tuple = (64, 32)) -> 'Image.Image':
+    # Solid RGBA frame
+    return Image.new('RGBA', size, color=color)
+
+
+def _free_display() -> int:
+    # First display number without an X server lock or socket
+    for number in range(90, 200):
+        if not os.path.exists(f'/tmp/.X{number}-lock') and not (
+                os.path.exists(f'/tmp/.X11-unix/X{number}')):
+            return number
+    raise RuntimeError('No free X display number')
+
+
+@unittest.skipIf(textureservice is None, 'PySide6 or Pillow is not installed')
+class TestTextureServiceFrames(unittest.TestCase):
+    """Frames published by the writer, as seen by the reader"""
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'texture-test.shm')
+        self.writer = textureservice.TextureServiceWriter(self.path)
+        self.reader = textureservice.TextureServiceReader(self.path)
+
+    def tearDown(self) -> None:
+        self.reader.close()
+        self.writer.close()
+        shutil.rmtree(self.directory)
+
+    def assert_region_color(self, image, color: tuple) -> None:
+        for x, y in ((0, 0), (image.width() - 1, image.height() - 1)):
+            self.assertEqual(image.pixel_color(x, y).get_rgb(), color)
+
+    def test_no_frame(self) -> None:
+        self.assertFalse(self.reader.is_available())
+        self.assertEqual(self.reader.sequence(), 0)
+        self.assertIsNone(self.reader.region((0, 0, 8, 8)))
+
+    def test_sequence_and_contents_across_slot_swaps(self) -> None:
+        colors = [
+            (255, 0, 0, 255), (0, 255, 0, 255),
+            (0, 0, 255, 255), (10, 20, 30, 255)]
+        for number, color in enumerate(colors, 1):
+            self.writer.publish(_frame(color))
+            self.assertTrue(self.reader.is_available())
+            self.assertEqual(self.reader.sequence(), number)
+
+            region = self.reader.region((4, 2, 16, 8))
+            self.assertEqual((region.width(), region.height()), (16, 8))
+            self.assert_region_color(region, color)
+
+    def test_regions_are_copies(self) -> None:
+        self.writer.publish(_frame((255, 0, 0, 255)))
+        region = self.reader.region((0, 0, 8, 8))
+        for color in ((0, 255, 0, 255), (0, 0, 255, 255)):
+            self.writer.publish(_frame(color))
+
+        # Both slots were written again after the region was read
+        self.assert_region_color(region, (255, 0, 0, 255))
+        self.assert_region_color(
+            self.reader.region((0, 0, 8, 8)), (0, 0, 255, 255))
+
+    def test_region_of_the_same_frame_is_reused(self) -> None:
+        self.writer.publish(_frame((255, 0, 0, 255)))
+        region = self.reader.region((0, 0, 8, 8))
+        self.assertIs(self.reader.region((0, 0, 8, 8)), region)
+        self.assertIsNot(self.reader.region((1, 1, 8, 8)), region)
+
+    def test_region_outside_the_frame(self) -> None:
+        self.writer.publish(_frame((255, 0, 0, 255)))
+        self.assertIsNone(self.reader.region((60, 0, 8, 8)))
+        self.assertIsNone(self.reader.region((-1, 0, 8, 8)))
+
+    def test_resized_frames_replace_the_file(self) -> None:
+        self.writer.publish(_frame((255, 0, 0, 255)))
+        self.reader.region((0, 0, 8, 8))
+        self.writer.publish(_frame((0, 255, 0, 255), size=(128, 64)))
+
+        # The reader opens the new file, the sequence keeps counting
+        region = self.reader.region((100, 50, 20, 10))
+        self.assert_region_color(region, (0, 255, 0, 255))
+        self.assertEqual(self.reader.sequence(), 2)
+
+
+@unittest.skipIf(textureservice is None, 'PySide6 or Pillow is not installed')
+class TestTextureServiceMain(unittest.TestCase):
+    """The service process on the offscreen platform, without X"""
+    def setUp(self) -> None:
+        self.runtime_directory = tempfile.mkdtemp()
+        os.chmod(self.runtime_directory, 0o700)
+        self.addCleanup(
+            shutil.rmtree, self.runtime_directory, ignore_errors=True)
+
+    def test_main_publishes_frames(self) -> None:
+        env = dict(
+            os.environ, XDG_RUNTIME_DIR=self.runtime_directory,
+            PYTHONPATH=os.pathsep.join(sys.path), QT_QPA_PLATFORM='offscreen')
+        service = subprocess.Popen(
+            [sys.executable, '-m', 'xside.adds.textureservice',
+             '--display', ':77', '--interval', '50'],
+            env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        self.addCleanup(service.wait, 10)
+        self.addCleanup(service.terminate)
+
+        path = os.path.join(
+            self.runtime_directory, 'xside',
+            textureservice.service_name(':77') + '.shm')
+        reader = textureservice.TextureServiceReader(path)
+        self.addCleanup(reader.close)
+        deadline = time.monotonic() + 20
+        while time.monotonic() < deadline and service.poll() is None:
+            if reader.is_available() and reader.sequence() >= 2:
+                break
+            time.sleep(0.05)
+
+        self.assertIsNone(service.poll(), 'The service exited')
+        self.assertGreaterEqual(reader.sequence(), 2)
+
+
+@unittest.skipIf(textureservice is None, 'PySide6 or Pillow is not installed')
+@unittest.skipIf(shutil.which('Xvfb') is None, 'Xvfb is not installed')
+class TestTextureServiceXvfb(unittest.TestCase):
+    """The service process on a local Xvfb display"""
+    def setUp(self) -> None:
+        self.runtime_directory = tempfile.mkdtemp()
+        os.chmod(self.runtime_directory, 0o700)
+        self.display = f':{_free_display()}'
+        self.env = dict(
+            os.environ, XDG_RUNTIME_DIR=self.runtime_directory,
+            PYTHONPATH=os.pathsep.join(sys.path))
+        self.env.pop('QT_QPA_PLATFORM', None)
+        self.xvfb = subprocess.Popen(
+            ['Xvfb', self.display, '-screen', '0', '320x240x24', '-nolisten',
+             'tcp'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        self.service = None
+        self.addCleanup(self.__stop)
+
+        socket_path = f'/tmp/.X11-unix/X{self.display[1:]}'
+        for _ in range(100):
+            if os.path.exists(socket_path):
+                break
+            time.sleep(0.05)
+
+    def test_service_publishes_frames(self) -> None:
+        self.service = subprocess.Popen(
+            [sys.executable, '-m', 'xside.adds.textureservice',
+             '--display', self.display, '--interval', '100'],
+            env=self.env, stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL)
+
+        old_runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+        os.environ['XDG_RUNTIME_DIR'] = self.runtime_directory
+        try:
+            path = textureservice.service_path(self.display)
+        finally:
+            if old_runtime_dir is None:
+                del os.environ['XDG_RUNTIME_DIR']
+            else:
+                os.environ['XDG_RUNTIME_DIR'] = old_runtime_dir
+
+        reader = textureservice.TextureServiceReader(path)
+        self.addCleanup(reader.close)
+        sequences = []
+        deadline = time.monotonic() + 20
+        while time.monotonic() < deadline and len(set(sequences)) < 3:
+            if reader.is_available():
+                sequences.append(reader.sequence())
+            time.sleep(0.05)
+
+        self.assertGreaterEqual(len(set(sequences)), 3)
+        self.assertEqual(sequences, sorted(sequences))
+        region = reader.region((0, 0, 320, 240))
+        self.assertEqual((region.width(), region.height()), (320, 240))
+
+    def __stop(self) -> None:
+        for process in (self.service, self.xvfb):
+            if process:
+                process.terminate()
+                process.wait(10)
+        shutil.rmtree(self.runtime_directory, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+import os
+import shutil
+import subprocess
+import time
+import unittest
+
+try:
+    from Xlib import X, Xatom, display
+    from xside.adds import windowstack
+except ImportError:
+    display = None
+
+
+def _free_display() -> int:
+    # First display number without an X server lock or socket
+    for number in range(90, 200):
+        if not os.path.exists(f'/tmp/.X{number}-lock') and not (
+                os.path.exists(f'/tmp/.X11-unix/X{number}')):
+            return number
+    raise RuntimeError('No free X display number')
+
+
+@unittest.skipIf(display is None, 'python-xlib is not installed')
+@unittest.skipIf(shutil.which('Xvfb') is None, 'Xvfb is not installed')
+class TestXlibWindowStack(unittest.TestCase):
+    """Windows of a local Xvfb display, listed with python-xlib"""
+    def setUp(self) -> None:
+        self.display_name = f':{_free_display()}'
+        self.xvfb = subprocess.Popen(
+            ['Xvfb', self.display_name, '-screen', '0', '320x240x24',
+             '-nolisten', 'tcp'],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        self.addCleanup(self.xvfb.wait, 10)
+        self.addCleanup(self.xvfb.terminate)
+
+        deadline = time.monotonic() + 10
+        while True:
+            try:
+                self.display = display.Display(self.display_name)
+                break
+            except Exception:
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.05)
+        self.addCleanup(self.display.close)
+        self.root = self.display.screen().root
+
+    def create_window(
+            self, title: str, geometry: tuple, desktop: int,
+            mapped: bool = True):
+        # A client window in a frame, with the properties that a
+        # reparenting window manager would set
+        x, y, width, height = geometry
+        frame = self.root.create_window(
+            x, y, width, height, 0, X.CopyFromParent)
+        client = frame.create_window(
+            0, 0, width, height, 0, X.CopyFromParent)
+        client.change_property(
+            self.display.intern_atom('_NET_WM_NAME'),
+            self.display.intern_atom('UTF8_STRING'), 8, title.encode())
+        client.change_property(
+            self.display.intern_atom('_NET_WM_DESKTOP'),
+            Xatom.CARDINAL, 32, [desktop])
+        frame.map()
+        if mapped:
+            client.map()
+        return frame, client
+
+    def test_windows(self) -> None:
+        _, bottom = self.create_window('Bottom', (10, 20, 100, 50), 0)
+        _, hidden = self.create_window(
+            'Hidden', (0, 0, 30, 30), 0, mapped=False)
+        top_frame, top = self.create_window(
+            'Tóp', (40, 30, 60, 70), 0xFFFFFFFF)
+        self.root.change_property(
+            self.display.intern_atom('_NET_CLIENT_LIST_STACKING'),
+            Xatom.WINDOW, 32, [bottom.id, hidden.id, top.id])
+        self.display.sync()
+
+        stack = windowstack.window_stack(self.display_name)
+        self.addCleanup(stack.close)
+        self.assertIsInstance(stack, windowstack.XlibWindowStack)
+
+        windows = [
+            (x.id_, x.type_, x.x, x.y, x.w, x.h, x.title)
+            for x in stack.windows()]
+        self.assertEqual(windows, [
+            (windowstack.window_id(bottom.id), 0, 10, 20, 100, 50, 'Bottom'),
+            (windowstack.window_id(top.id), -1, 40, 30, 60, 70, 'Tóp')])
+        self.assertEqual(stack.forks(), 0)
+
+        # Closed windows are left out
+        top_frame.destroy()
+        self.display.sync()
+        self.assertEqual(
+            [x.id_ for x in stack.windows()],
+            [windowstack.window_id(bottom.id)])
+
+
+if __name__ == '__main__':
+    unittest.main()
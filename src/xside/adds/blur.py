@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+import math
+import os
+import time
+
+from PIL import Image, ImageFilter
+
+# Quality tier: (downscale factor, box blur passes)
+# Zero passes means an exact Gaussian blur at full resolution
+BLUR_QUALITY_TIERS = {
+	'high': (1, 0),
+	'medium': (2, 3),
+	'low': (4, 2),
+}
+
+
+class Blur(object):
+	"""Downscale, blur and upscale pipeline for textures
+
+	The image is reduced by the factor of the quality tier, blurred with a
+	few box blur passes that approximate the Gaussian blur of the radius,
+	and resized back. A blurred texture has no fine detail to lose, so the
+	lower tiers look almost the same and cost a fraction of the time.
+	"""
+	def __init__(self, radius: float = 10, quality: str = 'medium') -> None:
+		"""
+		:param radius: Standard deviation of the Gaussian blur, in pixels
+		:param quality: One of the 'BLUR_QUALITY_TIERS' keys
+		"""
+		self.__radius = radius
+		self.__quality = None
+		self.set_quality(quality)
+
+	def apply(self, image: Image.Image) -> Image.Image:
+		"""Blurred copy of the image"""
+		factor, passes = BLUR_QUALITY_TIERS[self.__quality]
+		if not passes:
+			return image.filter(ImageFilter.GaussianBlur(radius=self.__radius))
+
+		small = image
+		if factor > 1 and image.width >= factor and image.height >= factor:
+			small = image.reduce(factor)
+
+		# Box width for 'passes' boxes with the variance of the Gaussian
+		sigma = self.__radius * small.width / image.width
+		box_radius = (math.sqrt(12 * sigma ** 2 / passes + 1) - 1) / 2
+		for _ in range(passes):
+			small = small.filter(ImageFilter.BoxBlur(box_radius))
+
+		if small.size != image.size:
+			small = small.resize(image.size, Image.Resampling.BILINEAR)
+		return small
+
+	def factor(self) -> int:
+		"""Downscale factor of the current quality tier"""
+		return BLUR_QUALITY_TIERS[self.__quality][0]
+
+	def quality(self) -> str:
+		"""..."""
+		return self.__quality
+
+	def radius(self) -> float:
+		"""..."""
+		return self.__radius
+
+	def set_quality(self, quality: str) -> None:
+		"""..."""
+		if quality not in BLUR_QUALITY_TIERS:
+			raise ValueError(
+				f'Unknown blur quality "{quality}", use one of: '
+				f'{", ".join(BLUR_QUALITY_TIERS)}')
+		self.__quality = quality
+
+	def set_radius(self, radius: float) -> None:
+		"""..."""
+		self.__radius = radius
+
+
+def benchmark(
+		sizes: tuple = ((1920, 1080), (3840, 2160)),
+		radius: float = 15,
+		repeat: int = 3) -> dict:
+	"""Best time, in milliseconds, of each blur for each image size
+
+	'pil' is the full resolution 'ImageFilter.GaussianBlur' used before
+	the blur stage existed. Run it with: python -m xside.adds.blur
+
+	:param sizes: Image sizes, like: ((1920, 1080),)
+	:param radius: Blur radius
+	:param repeat: Runs of each blur, the fastest one is reported
+	"""
+	results = {}
+	for width, height in sizes:
+		image = Image.frombytes(
+			'RGBA', (width, height), os.urandom(width * height * 4))
+		blurs = {'pil': lambda img: img.filter(
+			ImageFilter.GaussianBlur(radius=radius))}
+		for quality in BLUR_QUALITY_TIERS:
+			blurs[quality] = Blur(radius, quality).apply
+
+		results[(width, height)] = {}
+		for name, blur in blurs.items():
+			timings = []
+			for _ in range(repeat):
+				start = time.perf_counter()
+				blur(image)
+				timings.append((time.perf_counter() - start) * 1000)
+			results[(width, height)][name] = min(timings)
+
+	return results
+
+
+if __name__ == '__main__':
+	for size, timings in benchmark().items():
+		print(f'{size[0]}x{size[1]}: ' + ', '.join(
+			f'{name} {ms:.1f} ms' for name, ms in timings.items()))
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+import collections
+import hashlib
+
+from PIL import Image
+
+
+class LRUCache(object):
+	"""Mapping that only keeps the most recently used items"""
+	def __init__(self, max_size: int = 4) -> None:
+		"""
+		:param max_size: Number of items kept. The least recently used item
+			is dropped when a new one is added past this size
+		"""
+		self.__max_size = max_size
+		self.__items = collections.OrderedDict()
+
+	def __contains__(self, key) -> bool:
+		return key in self.__items
+
+	def __len__(self) -> int:
+		return len(self.__items)
+
+	def clear(self) -> None:
+		"""Drop all the items"""
+		self.__items.clear()
+
+	def get(self, key, default=None):
+		"""The item of the key, marked as the most recently used"""
+		if key not in self.__items:
+			return default
+
+		self.__items.move_to_end(key)
+		return self.__items[key]
+
+	def put(self, key, value) -> None:
+		"""Add or replace the item of the key"""
+		self.__items[key] = value
+		self.__items.move_to_end(key)
+		while len(self.__items) > self.__max_size:
+			self.__items.popitem(last=False)
+
+
+def image_digest(image: Image.Image, factor: int = 4) -> bytes:
+	"""Content hash of a downscaled copy of the image
+
+	Small changes, like a blinking cursor, can be missed with a large
+	factor. That is fine for a blurred texture.
+
+	:param image: Image to hash
+	:param factor: Downscale factor applied before hashing
+	"""
+	if factor > 1 and image.width >= factor and image.height >= factor:
+		image = image.reduce(factor)
+	return hashlib.blake2b(image.tobytes(), digest_size=16).digest()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+from PIL import Image
+from PySide6 import QtGui
+from __feature__ import snake_case
+
+from xside.adds.windowstack import Window
+
+
+def window_region(window: Window, rect: tuple) -> tuple | None:
+	"""Part of the window inside the rect
+
+	:param window: Window with root coordinates
+	:param rect: (x, y, width, height) in root coordinates
+	:return: (x, y, width, height) in root coordinates, or None if the
+		window is outside the rect
+	"""
+	x = max(window.x, rect[0])
+	y = max(window.y, rect[1])
+	right = min(window.x + window.w, rect[0] + rect[2])
+	bottom = min(window.y + window.h, rect[1] + rect[3])
+	if right <= x or bottom <= y:
+		return None
+	return x, y, right - x, bottom - y
+
+
+def visible_regions(windows: list, rect: tuple) -> list:
+	"""Windows that can be seen inside the rect
+
+	A window is skipped when it is outside the rect, or when its part
+	inside the rect is fully covered by a window above it.
+
+	:param windows: Windows in stacking order, from the bottom to the top
+	:param rect: (x, y, width, height) in root coordinates
+	:return: List of (window, region) tuples, from the bottom to the top
+	"""
+	visible = []
+	regions_above = []
+	for window in reversed(windows):
+		region = window_region(window, rect)
+		if not region:
+			continue
+
+		x, y, w, h = region
+		covered = any(
+			ax <= x and ay <= y and ax + aw >= x + w and ay + ah >= y + h
+			for ax, ay, aw, ah in regions_above)
+		if covered:
+			continue
+
+		visible.insert(0, (window, region))
+		regions_above.append(region)
+
+	return visible
+
+
+class WindowCapture(object):
+	"""In-memory captures of window regions
+
+	Windows are grabbed through 'QScreen.grab_window', which reads the
+	pixels from the X server directly. Nothing is encoded or written to the
+	disk. Qt only allows grabbing from the GUI thread.
+	"""
+	def __init__(self, screen: QtGui.QScreen) -> None:
+		"""..."""
+		self.__screen = screen
+
+	def capture(self, window: Window, region: tuple) -> Image.Image | None:
+		"""RGBA image of a region of the window
+
+		:param window: Window to grab
+		:param region: (x, y, width, height) in root coordinates, like the
+			one returned by 'window_region'
+		"""
+		x, y, width, height = region
+		pixmap = self.__screen.grab_window(
+			int(window.id_, 16), x - window.x, y - window.y, width, height)
+		if pixmap.is_null():
+			return None
+
+		image = pixmap.to_image().convert_to_format(
+			QtGui.QImage.Format_RGBA8888)
+		return Image.frombuffer(
+			'RGBA', (image.width(), image.height()),
+			bytes(image.const_bits()), 'raw', 'RGBA',
+			image.bytes_per_line(), 1)
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+import collections
+
+from PySide6 import QtCore
+from __feature__ import snake_case
+
+# Quality tier: (blur quality, blur radius scale, minimum milliseconds
+# between updates). From the best to the cheapest
+QUALITY_TIERS = {
+	'high': ('high', 1.0, 0),
+	'medium': ('medium', 1.0, 0),
+	'low': ('low', 0.75, 0),
+	'minimal': ('low', 0.5, 1000),
+}
+
+
+class QualityGovernor(QtCore.QObject):
+	"""Adapts the texture quality to a time budget
+
+	The stage times of each update are recorded. When the last updates all
+	took longer than the budget, the governor drops to the next cheaper
+	tier: lower blur resolution, smaller radius, and then less frequent
+	updates. When they all took less than half the budget, it goes back
+	up, but never above the tier that was set.
+	"""
+	quality_tier_changed_signal = QtCore.Signal(str)
+
+	def __init__(
+			self,
+			budget: float = 100.0,
+			samples: int = 3,
+			tier: str = 'medium',
+			*args, **kwargs) -> None:
+		"""
+		:param budget: Milliseconds an update may take
+		:param samples: Number of updates that decide a tier change
+		:param tier: Best tier to use, one of the 'QUALITY_TIERS' keys
+		"""
+		super().__init__(*args, **kwargs)
+		self.__budget = budget
+		self.__timings = collections.deque(maxlen=samples)
+		self.__last_timings = {}
+		self.__enabled = True
+		self.__tiers = list(QUALITY_TIERS)
+		self.__max_tier = None
+		self.__tier = None
+		self.set_tier(tier)
+
+	def blur_quality(self) -> str:
+		"""Blur quality of the current tier"""
+		return QUALITY_TIERS[self.__tier][0]
+
+	def budget(self) -> float:
+		"""..."""
+		return self.__budget
+
+	def is_enabled(self) -> bool:
+		"""..."""
+		return self.__enabled
+
+	def last_timings(self) -> dict:
+		"""Milliseconds of each stage of the last recorded update"""
+		return dict(self.__last_timings)
+
+	def min_interval(self) -> int:
+		"""Minimum milliseconds between updates in the current tier"""
+		return QUALITY_TIERS[self.__tier][2]
+
+	def radius_scale(self) -> float:
+		"""Blur radius scale of the current tier"""
+		return QUALITY_TIERS[self.__tier][1]
+
+	def record(self, timings: dict) -> None:
+		"""Record the times of an update, and adapt the tier to them
+
+		:param timings: Milliseconds of each stage, like:
+			{'capture': 12.0, 'composite': 3.5, 'blur': 40.1}
+		"""
+		self.__last_timings = dict(timings)
+		self.__timings.append(sum(timings.values()))
+		if not self.__enabled or len(self.__timings) < self.__timings.maxlen:
+			return
+
+		index = self.__tiers.index(self.__tier)
+		if all(x > self.__budget for x in self.__timings):
+			if index < len(self.__tiers) - 1:
+				self.__change_tier(self.__tiers[index + 1])
+
+		elif all(x < self.__budget / 2 for x in self.__timings):
+			if index > self.__tiers.index(self.__max_tier):
+				self.__change_tier(self.__tiers[index - 1])
+
+	def set_budget(self, budget: float) -> None:
+		"""..."""
+		self.__budget = budget
+		self.__timings.clear()
+
+	def set_enabled(self, enabled: bool) -> None:
+		"""When disabled, the tier that was set is always used"""
+		self.__enabled = enabled
+		if not enabled:
+			self.__change_tier(self.__max_tier)
+
+	def set_tier(self, tier: str) -> None:
+		"""Best tier to use, one of the 'QUALITY_TIERS' keys"""
+		if tier not in QUALITY_TIERS:
+			raise ValueError(
+				f'Unknown quality tier "{tier}", use one of: '
+				f'{", ".join(QUALITY_TIERS)}')
+		self.__max_tier = tier
+		self.__change_tier(tier)
+
+	def tier(self) -> str:
+		"""Current quality tier"""
+		return self.__tier
+
+	def __change_tier(self, tier: str) -> None:
+		# ...
+		self.__timings.clear()
+		if tier != self.__tier:
+			self.__tier = tier
+			self.quality_tier_changed_signal.emit(tier)
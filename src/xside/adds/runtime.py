@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+import getpass
+import logging
+import os
+import stat
+import tempfile
+
+# Directory used when the shared fallback directory is not safe to use
+_private_fallback_dir = None
+
+
+def runtime_dir() -> str:
+	"""Per-user directory for the runtime files of xside
+
+	'$XDG_RUNTIME_DIR/xside', or a private 'xside-<user>' directory in the
+	temporary directory when $XDG_RUNTIME_DIR is not set. The directory is
+	created if it does not exist.
+
+	An existing 'xside-<user>' directory is only used when it is a real
+	directory owned by the user with mode 0o700. Otherwise, a new private
+	directory is created with 'tempfile.mkdtemp()' and used for the rest of
+	the process. Processes then no longer share it.
+	"""
+	global _private_fallback_dir
+
+	if os.environ.get('XDG_RUNTIME_DIR'):
+		path = os.path.join(os.environ['XDG_RUNTIME_DIR'], 'xside')
+		os.makedirs(path, mode=0o700, exist_ok=True)
+		return path
+
+	if _private_fallback_dir:
+		return _private_fallback_dir
+
+	path = os.path.join(tempfile.gettempdir(), f'xside-{getpass.getuser()}')
+	try:
+		os.mkdir(path, 0o700)
+		os.chmod(path, 0o700)
+	except FileExistsError:
+		pass
+
+	if _is_private_dir(path):
+		return path
+
+	logging.warning(
+		f'"{path}" is not a private directory of the user, '
+		'using a new temporary directory instead')
+	_private_fallback_dir = tempfile.mkdtemp(prefix='xside-')
+	return _private_fallback_dir
+
+
+def _is_private_dir(path: str) -> bool:
+	# A real directory, not a symlink, owned by the user and only
+	# accessible by them
+	try:
+		info = os.lstat(path)
+	except OSError:
+		return False
+
+	return (
+		stat.S_ISDIR(info.st_mode) and info.st_uid == os.getuid() and
+		stat.S_IMODE(info.st_mode) == 0o700)
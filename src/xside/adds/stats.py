@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+import logging
+import time
+
+from PySide6 import QtCore
+from __feature__ import snake_case
+
+# Upper bounds, in milliseconds, of the histogram buckets. Slower times go
+# to the last bucket
+HISTOGRAM_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+
+class StageHistogram(object):
+	"""Distribution of the times of a pipeline stage"""
+	def __init__(self) -> None:
+		"""..."""
+		self.__buckets = [0] * (len(HISTOGRAM_BUCKETS) + 1)
+		self.__count = 0
+		self.__total = 0.0
+		self.__max = 0.0
+
+	def add(self, milliseconds: float) -> None:
+		"""..."""
+		index = len(HISTOGRAM_BUCKETS)
+		for i, bound in enumerate(HISTOGRAM_BUCKETS):
+			if milliseconds <= bound:
+				index = i
+				break
+
+		self.__buckets[index] += 1
+		self.__count += 1
+		self.__total += milliseconds
+		self.__max = max(self.__max, milliseconds)
+
+	def as_dict(self) -> dict:
+		"""Count, total, mean and max times, and the count of each bucket
+
+		Buckets are named by their bounds, like: '<=5' or '>1000'
+		"""
+		buckets = {
+			f'<={bound}': count
+			for bound, count in zip(HISTOGRAM_BUCKETS, self.__buckets)}
+		buckets[f'>{HISTOGRAM_BUCKETS[-1]}'] = self.__buckets[-1]
+		return {
+			'count': self.__count,
+			'total_ms': self.__total,
+			'mean_ms': self.__total / self.__count if self.__count else 0.0,
+			'max_ms': self.__max,
+			'buckets': buckets,
+		}
+
+
+class TextureStats(object):
+	"""Stage times and counters of the texture pipeline
+
+	Only meant to be used from the GUI thread: stages that run in the worker
+	report their times with the result of the job.
+	"""
+	def __init__(self, name: str = 'texture') -> None:
+		"""
+		:param name: Name used in the log lines
+		"""
+		self.__name = name
+		self.__stages = {}
+		self.__counters = {}
+		self.__started = time.monotonic()
+		self.__log_timer = QtCore.QTimer()
+		self.__log_timer.timeout.connect(self.__log_timer_signal)
+
+	def add_timing(self, stage: str, milliseconds: float) -> None:
+		"""Add a time to the histogram of the stage"""
+		if stage not in self.__stages:
+			self.__stages[stage] = StageHistogram()
+		self.__stages[stage].add(milliseconds)
+
+	def add_timings(self, timings: dict) -> None:
+		"""Add the times of a dict like: {'blur': 40.1, 'crop': 1.2}"""
+		for stage, milliseconds in timings.items():
+			self.add_timing(stage, milliseconds)
+
+	def as_dict(self) -> dict:
+		"""Snapshot of the histograms and counters
+
+		{'seconds': 12.5, 'stages': {'blur': {...}}, 'counters': {...}}
+		"""
+		return {
+			'seconds': time.monotonic() - self.__started,
+			'stages': {
+				stage: histogram.as_dict()
+				for stage, histogram in self.__stages.items()},
+			'counters': dict(self.__counters),
+		}
+
+	def count(self, counter: str, value: int = 1) -> None:
+		"""Add the value to the counter"""
+		self.__counters[counter] = self.__counters.get(counter, 0) + value
+
+	def log_interval(self) -> int:
+		"""Seconds between log lines, 0 when logging is disabled"""
+		if not self.__log_timer.is_active():
+			return 0
+		return self.__log_timer.interval() // 1000
+
+	def reset(self) -> None:
+		"""Drop all the times and counters"""
+		self.__stages.clear()
+		self.__counters.clear()
+		self.__started = time.monotonic()
+
+	def set_log_interval(self, seconds: int) -> None:
+		"""Log the snapshot with 'logging.info' every few seconds
+
+		:param seconds: Seconds between log lines. 0 disables logging
+		"""
+		if seconds > 0:
+			self.__log_timer.start(seconds * 1000)
+		else:
+			self.__log_timer.stop()
+
+	def __log_timer_signal(self) -> None:
+		# ...
+		logging.info(f'{self.__name} stats: {self.as_dict()}')
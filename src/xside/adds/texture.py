@@ -1,28 +1,24 @@
 #!/usr/bin/env python3
-import logging
+import functools
 import os
-import pathlib
-import subprocess
-import sys
+import re
 import time
-import threading
 
-from PIL import Image, ImageFilter, ImageEnhance
-from PySide6 import QtCore
+from PIL import Image
+from PySide6 import QtCore, QtGui
 from __feature__ import snake_case
 
-from xside import widgets, modules
-
-
-class Window(object):
-	def __init__(self):
-		self.id_ = 'Window'
-
-	def __str__(self) -> str:
-		return f'<Window: {self.id_}>'
-
-	def __repr__(self) -> str:
-		return f'<Window: {self.id_}>'
+from xside import modules
+from xside.adds.blur import Blur
+from xside.adds.cache import LRUCache, image_digest
+from xside.adds.capture import WindowCapture, visible_regions
+from xside.adds.governor import QualityGovernor
+from xside.adds.runtime import runtime_dir
+from xside.adds.stats import TextureStats
+from xside.adds.textureservice import (
+	TextureServiceReader, register_client, service_path, unregister_client)
+from xside.adds.windowstack import Window, window_id, window_stack
+from xside.adds.worker import TextureWorker
 
 
 class Desktop(object):
@@ -46,29 +42,52 @@ class Texture(object):
 		self.__alpha = alpha
 		# Flags
 		self.__enable_texture = False
-		self.__updating = False
 		self.__is_using_texture = False
 		# Properties
-		self.__path = pathlib.Path(__file__).resolve().parent
 		self.__desktop = Desktop()
 		self.__desktop_windows = []
-		self.__toplevel_id = hex(self.__toplevel.win_id()).replace('0x', '0x0')
-		self.__style_sheet = self.__toplevel.style_sheet()
-		self.__style_parser = modules.style.StyleParser(self.__style_sheet)
-		self.__textures_path = os.path.join(self.__path, 'tmp')
-		self.__texture_url = os.path.join(self.__textures_path, 'texture.png')
+		self.__window_stack = window_stack()
+		self.__window_capture = WindowCapture(self.__toplevel.screen())
+		self.__blur_radius = 10
+		self.__blur_engine = Blur(self.__blur_radius, 'medium')
+		self.__texture_rect = (0, 0, 0, 0)
+		self.__capture_rect = (0, 0, 0, 0)
+		self.__frame = None
+		self.__frame_blurred = None
+		self.__texture_cache = LRUCache(4)
+		self.__worker = TextureWorker()
+		self.__quality_governor = QualityGovernor(tier='medium')
+		self.__last_update = 0.0
+		self.__update_timer = QtCore.QTimer()
+		self.__update_timer.set_single_shot(True)
+		self.__service_reader = None
+		self.__service_registered = False
+		self.__toplevel_id = window_id(self.__toplevel.win_id())
+		self.__stats = TextureStats(f'Texture {self.__toplevel_id}')
+		self.__capture_timings = {}
+		self.__style_parser = modules.style.StyleParser(
+			self.__toplevel.style_sheet())
 		self.__texture_image = None
+		self.__texture_qimage = None
 		self.__background_color = None
-		self.__background_style = self.__get_normal_style()
+		self.__get_background_color()
 		# Sigs
-		self.__toplevel.set_style_signal.connect(self.__set_style_signal)
-		self.__toplevel.reset_style_signal.connect(self.__set_style_signal)
+		self.__toplevel.connect_style_scope(
+			self.__set_style_signal, 'MainWindow')
 		self.__toplevel.event_filter_signal.connect(self.__event_filter_signal)
+		self.__toplevel.destroyed.connect(self.__destroyed_signal)
+		self.__worker.job_finished_signal.connect(
+			self.__job_finished_signal)
+		self.__update_timer.timeout.connect(self.update)
 
 	def background_color(self) -> tuple:
 		"""..."""
 		return self.__background_color
 
+	def blur_quality(self) -> str:
+		"""Quality tier of the blur in use: 'high', 'medium' or 'low'"""
+		return self.__blur_engine.quality()
+
 	def enabled(self) -> bool:
 		"""..."""
 		return self.__enable_texture
@@ -77,126 +96,280 @@ class Texture(object):
 		"""..."""
 		return self.__is_using_texture
 
+	def quality_governor(self) -> QualityGovernor:
+		"""Governor that lowers the quality when updates are too slow
+
+		Its 'quality_tier_changed_signal' reports the tier in use.
+		"""
+		return self.__quality_governor
+
 	def remove(self) -> None:
-		self.__toplevel.set_style_sheet(self.__background_style)
+		self.__worker.cancel()
+		self.__update_timer.stop()
+		self.__toplevel.central_widget().set_background_image(None)
 		self.__is_using_texture = False
 
+	def save_texture(self, path: str | None = None) -> str | None:
+		"""Save the current texture as a PNG file
+
+		The texture is painted from memory, a file is only needed to use it
+		outside the window, like in a style sheet 'url()'.
+
+		:param path: File path. Default is a file in the per-user runtime
+			directory, never in the package directory
+		:return: The file path, or None when there is no texture
+		"""
+		if self.__texture_qimage is None:
+			return None
+
+		if not path:
+			path = os.path.join(
+				runtime_dir(), f'texture-{self.__toplevel_id}.png')
+		start = time.perf_counter()
+		self.__texture_qimage.save(path, 'PNG')
+		self.__stats.add_timing('save', (time.perf_counter() - start) * 1000)
+		self.__stats.count('bytes_written', os.path.getsize(path))
+		return path
+
+	def service_enabled(self) -> bool:
+		"""If the texture is taken from the texture service when it runs"""
+		return self.__service_reader is not None
+
+	def set_blur_quality(self, quality: str) -> None:
+		"""Best quality tier: 'high', 'medium', 'low' or 'minimal'
+
+		'high' is a full resolution Gaussian blur. The other tiers blur a
+		downscaled copy and are much faster on large windows. The quality
+		governor may use a lower tier when updates are too slow.
+		"""
+		self.__quality_governor.set_tier(quality)
+
 	def set_enable(self, enable: bool) -> None:
 		"""..."""
 		self.__enable_texture = enable
 
+	def set_stats_log_interval(self, seconds: int) -> None:
+		"""Log the 'stats()' dict with 'logging.info' every few seconds
+
+		:param seconds: Seconds between log lines. 0 disables logging
+		"""
+		self.__stats.set_log_interval(seconds)
+
+	def set_service_enabled(self, enable: bool) -> None:
+		"""Take the texture from the per-session texture service
+
+		When the service ('python -m xside.adds.textureservice') is running,
+		the window copies its part of the shared texture instead of capturing
+		and blurring the desktop by itself. Otherwise, it works as usual.
+		"""
+		if enable and not self.__service_reader:
+			self.__service_reader = TextureServiceReader(service_path())
+		elif not enable and self.__service_reader:
+			self.__unregister_service_client()
+			if self.__is_using_texture:
+				self.remove()
+			self.__service_reader.close()
+			self.__service_reader = None
+
+	def stats(self) -> dict:
+		"""Stage times and counters of the texture pipeline
+
+		'stages' has a histogram of the milliseconds of each stage:
+		'windows' (window stack), 'capture', 'composite', 'blur', 'crop'
+		(with the QImage conversion), 'apply', 'service' and 'save'.
+		'counters' has 'updates', 'deferred_updates', 'cache_hits',
+		'forks' (processes of the command line window stack),
+		'service_frames' and 'bytes_written'.
+		"""
+		return self.__stats.as_dict()
+
 	def texture_image(self) -> Image:
-		"""..."""
+		"""The texture, None when it comes from the texture service"""
 		return self.__texture_image
 
+	def texture_qimage(self) -> QtGui.QImage | None:
+		"""The texture as painted in the window"""
+		return self.__texture_qimage
+
 	def update(self) -> None:
 		"""..."""
-		if not self.__updating:
-			self.__updating = True
-			thread = threading.Thread(
-				target=self.__insert_texture_into_window_background)
-			thread.start()
-
-	def __build_texture(self) -> bool:
-		url = os.path.join(self.__textures_path, self.__desktop.id_ + '.png')
-		if self.__create_the_texture_screens() and os.path.isfile(url):
-			imgdesk = Image.open(url)
-
-			for win in self.__desktop_windows:
-				urlfile = os.path.join(self.__textures_path, win.id_ + '.png')
-				if os.path.isfile(urlfile) and win.type_ != '-1':
-					if win.id_ != self.__toplevel_id:
-						imgwin = Image.open(urlfile)
-						imgdesk.paste(imgwin, (int(win.x), int(win.y)))
-
-			self.__desktop_windows.reverse()
-			for wd in self.__desktop_windows:
-				if wd.id_ == self.__toplevel_id:
-					x, y, w, h = int(wd.x), int(wd.y), int(wd.w), int(wd.h)
-					out = imgdesk.crop((x, y, x + w, y + h)).convert('RGBA')
-					out = self.__composite_background_color(out)
-					if out[1]:
-						radius = 15 if self.__toplevel.is_dark() else 10
-						out = out[0].filter(
-							ImageFilter.GaussianBlur(radius=radius))
-						# out = ImageEnhance.Brightness(out).enhance(0.97)
-						out.save(self.__texture_url, 'PNG', quality=1)
-						self.__texture_image = out
-						return True
-					else:
-						return False
-
-	@staticmethod
-	def __cli_output_by_args(args: list) -> str | None:
-		"""output of command arguments
-
-		by_args(['echo', '$HOME']) -> "/home/user"
-
-		:param args: list args like: ['ls', '-l']
-		"""
-		try:
-			command = subprocess.Popen(
-				args, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-			stdout, stderr = command.communicate()
-		except ValueError as er:
-			print(er)
-			print(f'Error in command args: "{command_args}"')
-			return None
-		else:
-			if not stderr.decode():
-				return stdout.decode().strip().strip("'").strip()
+		if not self.__enable_texture:
+			return
+
+		# Slow tiers limit how often the texture is updated, the last
+		# request is delayed instead of dropped
+		elapsed = (time.monotonic() - self.__last_update) * 1000
+		interval = self.__quality_governor.min_interval()
+		if elapsed < interval:
+			self.__update_timer.start(int(interval - elapsed))
+			self.__stats.count('deferred_updates')
+			return
+		self.__last_update = time.monotonic()
+		self.__stats.count('updates')
+
+		# Qt only grabs windows from the GUI thread, so the windows are
+		# captured here and only the compositing runs in the worker
+		radius = 15 if self.__toplevel.is_dark() else 10
+		self.__blur_radius = max(
+			round(radius * self.__quality_governor.radius_scale()), 1)
+		self.__blur_engine.set_radius(self.__blur_radius)
+		self.__blur_engine.set_quality(
+			self.__quality_governor.blur_quality())
+		self.__texture_rect = (
+			self.__toplevel.x(), self.__toplevel.y(),
+			self.__toplevel.width(), self.__toplevel.height())
+		if self.__service_reader and self.__update_from_service():
+			return
+
+		start = time.perf_counter()
+		forks = self.__window_stack.forks()
+		self.__capture_rect = self.__get_capture_rect()
+		self.__desktop_windows = self.__get_windows()
+		listed = time.perf_counter()
+		self.__stats.count('forks', self.__window_stack.forks() - forks)
+
+		captures = self.__capture_windows()
+		self.__capture_timings = {
+			'windows': (listed - start) * 1000,
+			'capture': (time.perf_counter() - listed) * 1000}
+		self.__stats.add_timings(self.__capture_timings)
+		if not captures:
+			return
+
+		settings = (
+			self.__capture_rect, self.__texture_rect, self.__blur_radius,
+			self.__blur_engine.quality(), self.__background_color)
+		self.__worker.request(
+			functools.partial(self.__build_texture, settings, captures))
+
+	def __blur(
+			self, canvas: Image.Image, frame: tuple, blur: Blur
+			) -> Image.Image:
+		# Only the regions of the windows that changed since the last frame
+		# are blurred again, when the rect and the settings are the same.
+		# Runs in the worker thread with the blur of the job, never with
+		# the engine that the GUI thread changes
+		if not self.__frame or self.__frame[0] != frame[0]:
+			return blur.apply(canvas)
+
+		changed = self.__frame[1].symmetric_difference(frame[1])
+		if not changed:
+			return self.__frame_blurred
+
+		x, y, _, _ = frame[0][0]
+		left = min(region[0] for _, region, _ in changed) - x
+		top = min(region[1] for _, region, _ in changed) - y
+		right = max(region[0] + region[2] for _, region, _ in changed) - x
+		bottom = max(region[1] + region[3] for _, region, _ in changed) - y
+
+		# The blur needs the pixels around the changed area. The area starts
+		# on the downscale grid of the whole canvas, so there are no seams
+		margin = round(blur.radius() * 2)
+		factor = blur.factor()
+		area = (
+			max(left - margin, 0) // factor * factor,
+			max(top - margin, 0) // factor * factor,
+			min(right + margin, canvas.width),
+			min(bottom + margin, canvas.height))
+		blurred_area = blur.apply(canvas.crop(area))
+
+		blurred = self.__frame_blurred.copy()
+		blurred.paste(
+			blurred_area.crop((
+				left - area[0], top - area[1],
+				right - area[0], bottom - area[1])),
+			(left, top))
+		return blurred
+
+	def __build_texture(
+			self, settings: tuple, captures: list, is_cancelled: callable
+			) -> tuple | None:
+		# Runs in the worker thread, so it only uses its arguments and the
+		# frame state, that only the worker touches. The blur is built from
+		# the settings of the job.
+		# Compositing and blur work on the toplevel rect plus the blur
+		# radius, so the edges are blurred with what is around them.
+		# Stage times are only returned for rebuilt textures, a cached
+		# texture says nothing about the cost of the quality tier
+		capture_rect, texture_rect, radius, quality, background_color = (
+			settings)
+
+		# A frame is the rect and settings plus the content of the windows
+		frame = (settings, frozenset(
+			(id_, region, image_digest(image))
+			for id_, image, region in captures))
+
+		texture = self.__texture_cache.get(frame)
+		if texture is not None:
+			return texture_rect, texture, None
+
+		start = time.perf_counter()
+		x, y, w, h = capture_rect
+		canvas = Image.new('RGBA', (w, h))
+		for _, image, region in captures:
+			canvas.paste(image, (region[0] - x, region[1] - y))
+
+		if background_color:
+			canvas = Image.alpha_composite(canvas, Image.new(
+				'RGBA', canvas.size, color=background_color))
+		if is_cancelled():
 			return None
+		composited = time.perf_counter()
 
-	def __composite_background_color(self, img) -> tuple:
-		if self.__background_color:
-			if img.width == self.__toplevel.width(
-					) and img.height == self.__toplevel.height():
-				imgcolor = Image.new(
-					'RGBA', (
-						self.__toplevel.width(),
-						self.__toplevel.height()),
-					color=self.__background_color)
-				img = Image.alpha_composite(img, imgcolor)
-			else:
-				t = threading.Thread(target=self.__update_thread, args=(1.0,))
-				t.start()
-				return None, False
-		return img, True
-
-	def __create_the_texture_screens(self) -> bool:
-		"""..."""
-		if self.__desktop_windows:
-			for window in self.__desktop_windows:
-				try:
-					self.__cli_output_by_args([
-						'import', '-window', window.id_, '-quality', '1',
-						os.path.join(
-							self.__textures_path, window.id_ + '.png')])
-				except Exception as err:
-					logging.error(err)
-			return True
-		else:
-			return False
-
-	@staticmethod
-	def __create_window_object_by_wmctrl_string(
-			window_str: str) -> Window | None:
-		try:
-			id_, type_, x, y, width, height, _, *title = window_str.split()
-			window = Window()
-			window.id_ = id_
-			window.type_ = type_
-			window.x = x
-			window.y = y
-			window.w = width
-			window.h = height
-			window.title = ' '.join(title)
-		except Exception as err:
-			logging.error(err)
-			print(err)
+		blurred = self.__blur(canvas, frame, Blur(radius, quality))
+		self.__frame = frame
+		self.__frame_blurred = blurred
+		if is_cancelled():
 			return None
-		else:
-			return window
+		blurred_at = time.perf_counter()
+
+		# out = ImageEnhance.Brightness(out).enhance(0.97)
+		tx, ty, tw, th = texture_rect
+		out = blurred.crop((tx - x, ty - y, tx - x + tw, ty - y + th))
+
+		# QImage is safe to build outside the GUI thread, QPixmap is not
+		qimage = QtGui.QImage(
+			out.tobytes(), out.width, out.height, out.width * 4,
+			QtGui.QImage.Format_RGBA8888).copy()
+		texture = (out, qimage)
+		self.__texture_cache.put(frame, texture)
+
+		timings = {
+			'composite': (composited - start) * 1000,
+			'blur': (blurred_at - composited) * 1000,
+			'crop': (time.perf_counter() - blurred_at) * 1000}
+		return texture_rect, texture, timings
+
+	def __capture_windows(self) -> list:
+		# Only the parts of the windows under the toplevel are grabbed, and
+		# windows covered by the ones above them are not grabbed at all
+		if self.__desktop.id_ == 'Desktop':
+			return []
+
+		screen = self.__toplevel.screen().geometry()
+		windows = [Window(
+			self.__desktop.id_, -1, screen.x(), screen.y(),
+			screen.width(), screen.height())]
+		windows += [
+			win for win in self.__desktop_windows
+			if win.type_ != -1 and win.id_ != self.__toplevel_id]
+
+		captures = []
+		for window, region in visible_regions(windows, self.__capture_rect):
+			image = self.__window_capture.capture(window, region)
+			if image:
+				captures.append((window.id_, image, region))
+			elif window.type_ == -1:
+				# The desktop is the base of the texture
+				return []
+
+		return captures
+
+	def __destroyed_signal(self, _: QtCore.QObject) -> None:
+		# Stops the background thread of the worker
+		self.__update_timer.stop()
+		self.__worker.close()
+		self.__unregister_service_client()
 
 	def __event_filter_signal(self, event):
 		if not self.__toplevel.is_server_side_decorated():
@@ -209,31 +382,32 @@ class Texture(object):
 					self.update()
 
 			elif event.type() == QtCore.QEvent.HoverLeave:
+				# Also cancels a texture that is still being built
 				if self.__enable_texture:
-					if self.__is_using_texture:
-						self.remove()
-					else:
-						time.sleep(1)
-						self.remove()
+					self.remove()
 
 			elif event.type() == QtCore.QEvent.Type.Move:
-				if self.__enable_texture and self.__is_using_texture:
-					self.remove()
+				if self.__enable_texture:
+					self.__worker.cancel()
+					if self.__is_using_texture:
+						self.remove()
 
 			elif event.type() == QtCore.QEvent.Resize:
-				if self.__enable_texture and self.__is_using_texture:
-					self.remove()
+				if self.__enable_texture:
+					self.__worker.cancel()
+					if self.__is_using_texture:
+						self.remove()
 
 				if self.__toplevel.is_maximized(
 						) or self.__toplevel.is_full_screen():
 					if self.__enable_texture and not self.__is_using_texture:
-						t = threading.Thread(target=self.__update_thread)
-						t.start()
+						QtCore.QTimer.single_shot(
+							200, self.__toplevel, self.update)
 
 			elif event.type() == QtCore.QEvent.Close:
-				for texture in os.listdir(self.__textures_path):
-					if texture != 'tmp':
-						os.remove(os.path.join(self.__textures_path, texture))
+				self.__worker.cancel()
+				self.__update_timer.stop()
+				self.__unregister_service_client()
 
 	def __get_background_color(self) -> str:
 		toplevel_style = self.__style_parser.widget_scope('MainWindow')
@@ -268,83 +442,88 @@ class Texture(object):
 				return 'background: url();' + bg_color
 		return 'background: url();'
 
-	def __get_normal_style(self) -> str:
-		toplevel_style = self.__style_parser.widget_scope('MainWindow')
-		if toplevel_style:
-			toplevel_style += self.__get_background_color()
-			style = self.__style_sheet + (
-				'MainWindow {' f'{toplevel_style}' '}')
-			self.__style_parser.set_style_sheet(style)
-		return self.__style_parser.style_sheet()
-
-	def __get_windows(self):
-		# wmctrl_lg: marks windows that are not windows using an '-1'
-		windows_and_components_list = self.__cli_output_by_args(
-			['wmctrl', '-lG']).split('\n')
-
-		id_to_remove = []
+	def __get_background_shape(self) -> tuple:
+		# Corner radii and margins of the 'MainWindow' scope, in pixels
+		scope = self.__style_parser.widget_scope('MainWindow') or ''
+		values = {}
+		for declaration in scope.split(';'):
+			if ':' in declaration:
+				name, value = declaration.split(':', 1)
+				values[name.strip()] = [
+					round(float(x))
+					for x in re.findall(r'-?\d+(?:\.\d+)?', value)]
+
+		radii = tuple(
+			(values.get(f'border-{corner}-radius') or
+			 values.get('border-radius') or [0])[0]
+			for corner in (
+				'top-left', 'top-right', 'bottom-right', 'bottom-left'))
+
+		# CSS order is top, right, bottom, left. Missing values repeat
+		margin = (values.get('margin') or [0])[:4]
+		if len(margin) == 1:
+			margin *= 4
+		elif len(margin) == 2:
+			margin *= 2
+		elif len(margin) == 3:
+			margin.append(margin[1])
+		top, right, bottom, left = margin
+		return radii, (left, top, right, bottom)
+
+	def __get_capture_rect(self) -> tuple:
+		# Toplevel rect plus the blur radius, inside the screen
+		screen = self.__toplevel.screen().geometry()
+		x, y, w, h = self.__texture_rect
+		left = max(x - self.__blur_radius, screen.x())
+		top = max(y - self.__blur_radius, screen.y())
+		right = min(x + w + self.__blur_radius, screen.x() + screen.width())
+		bottom = min(
+			y + h + self.__blur_radius, screen.y() + screen.height())
+		return left, top, right - left, bottom - top
+
+	def __get_windows(self) -> list:
+		# Windows on all desktops ('-1') are not real windows, except for
+		# the desktop itself, that is the size of the screen
+		screen_size = self.__toplevel.screen().size()
+
 		valid_windows_list = []
-		if windows_and_components_list:
-			for item in windows_and_components_list:
-				window = self.__create_window_object_by_wmctrl_string(item)
-
-				if not self.__is_window_minimized(window):
-					if window.type_ == '-1':
-						screen_w = str(
-							self.__toplevel.screen().size().width())
-						screen_h = str(
-							self.__toplevel.screen().size().height())
-
-						if window.w == screen_w and window.h == screen_h:
-							self.__desktop.id_ = window.id_
-							valid_windows_list.append(window)
-						else:
-							id_to_remove.append(
-								window.id_)
-					else:
-						valid_windows_list.append(window)
-
-		return self.__windows_in_the_correct_order(
-			valid_windows_list, id_to_remove)
-
-	def __insert_texture_into_window_background(self) -> None:
-		if self.__enable_texture:
-			self.__desktop_windows = self.__get_windows()
-			if self.__build_texture():
-				scope = self.__style_parser.widget_scope("MainWindow")
-				if scope:
-					self.__style_parser.set_style_sheet(
-						'MainWindow {'
-						f'{scope}'
-						f'background: url({self.__texture_url}) no-repeat;'
-						'}')
-					self.__toplevel.set_style_sheet(
-						self.__style_parser.style_sheet())
-					self.__is_using_texture = True
-
-		self.__updating = False
-
-	def __is_window_minimized(self, window: Window) -> bool:
-		try:
-			minimized_state = [
-				x for x in self.__cli_output_by_args(
-					['xwininfo', '-id', window.id_, '-stats']
-				).split('\n') if 'Map State: IsUnMapped' in x]
-		except Exception as err:
-			logging.error(err)
-			print('"xwininfo" command error:')
-			print(err)
-			return False
-		else:
-			return True if minimized_state else False
+		for window in self.__window_stack.windows():
+			if window.type_ == -1:
+				if (window.w == screen_size.width() and
+						window.h == screen_size.height()):
+					self.__desktop.id_ = window.id_
+					valid_windows_list.append(window)
+			else:
+				valid_windows_list.append(window)
 
-	def __is_window_the_desktop(self, window: Window) -> bool:
+		return self.__keep_only_windows_below(valid_windows_list)
 
-		if window.w == str(
-				self.__toplevel.screen().size().width()
-				) and window.h == self.__toplevel.screen().size().height():
-			return True
-		return False
+	def __job_finished_signal(self, result: tuple) -> None:
+		# Texture built by the worker, delivered in the GUI thread
+		texture_rect, texture, timings = result
+		if timings:
+			self.__stats.add_timings(timings)
+			self.__quality_governor.record(
+				dict(self.__capture_timings, **timings))
+		else:
+			self.__stats.count('cache_hits')
+		if not self.__enable_texture:
+			return
+
+		if texture_rect[2:] != (
+				self.__toplevel.width(), self.__toplevel.height()):
+			# The window was resized while the texture was built
+			QtCore.QTimer.single_shot(1000, self.__toplevel, self.update)
+			return
+
+		# Painted by the window frame, without touching the style sheet
+		start = time.perf_counter()
+		self.__texture_image, self.__texture_qimage = texture
+		radii, margins = self.__get_background_shape()
+		self.__toplevel.central_widget().set_background_image(
+			self.__texture_qimage, radii, margins)
+		self.__is_using_texture = True
+		self.__stats.add_timing('apply', (time.perf_counter() - start) * 1000)
 
 	def __keep_only_windows_below(self, windows_in_order) -> list:
 		topwin = self.__toplevel_window()
@@ -354,9 +533,9 @@ class Texture(object):
 		new_windows = []
 		for item in range(len(windows_in_order) - 2, -1, -1):
 			win = windows_in_order[item]
-			if win.id_ != topwin.id_ and win.type_ != '-1':
-				winx, winy = int(win.x), int(win.y)
-				winw, winh = int(win.w), int(win.h)
+			if win.id_ != topwin.id_ and win.type_ != -1:
+				winx, winy = win.x, win.y
+				winw, winh = win.w, win.h
 
 				x = winx if winx < topwin.x else x
 				y = winy if winy < topwin.y else y
@@ -378,47 +557,54 @@ class Texture(object):
 		new_windows.append(topwin)
 		return new_windows
 
-	def __set_style_signal(self) -> None:
-		# ...
+	def __set_style_signal(self, scope: str) -> None:
+		# Only called when the 'MainWindow' scope changes
 		self.__style_parser.set_style_sheet(self.__toplevel.style_sheet())
-		self.__style_sheet = self.__style_parser.style_sheet()
-		self.__background_style = self.__get_normal_style()
+		self.__get_background_color()
 
 	def __toplevel_window(self) -> Window:
-		window = Window()
-		window.id_ = self.__toplevel_id
-		window.type_ = '0'
-		window.x = self.__toplevel.x()
-		window.y = self.__toplevel.y()
-		window.w = self.__toplevel.width()
-		window.h = self.__toplevel.height()
-		window.title = self.__toplevel.window_title()
-		return window
-
-	def __update_thread(self, step: float = 0.2):
-		time.sleep(step)
-		self.update()
-
-	def __windows_in_the_correct_order(
-			self, valid_windows_list: list, id_to_remove: list) -> list:
-
-		# Puts all valid windows in xprop order
-		# xprop_root: list windows in order (z-index)
-		windows_in_order = [
-			x.split()[-1].replace('0x', '0x0') for x in [
-				x for x in self.__cli_output_by_args(
-					['xprop', '-root']).split('\n')
-				if '_NET_CLIENT_LIST_STACKING(WINDOW)' in x][0].split(',')]
-
-		valid_windows_in_order = []
-		for xprop_id in windows_in_order:
-			if xprop_id not in id_to_remove:
-				for item in valid_windows_list:
-					if item.id_ == xprop_id:
-						valid_windows_in_order.append(item)
-
-		# windows_in_order.append(self.__toplevel_window())
-		valid_windows_in_order = self.__keep_only_windows_below(
-			valid_windows_in_order)
-
-		return valid_windows_in_order
+		return Window(
+			self.__toplevel_id, 0,
+			self.__toplevel.x(), self.__toplevel.y(),
+			self.__toplevel.width(), self.__toplevel.height(),
+			self.__toplevel.window_title())
+
+	def __unregister_service_client(self) -> None:
+		# ...
+		if self.__service_registered:
+			unregister_client(self.__toplevel_id)
+			self.__service_registered = False
+
+	def __update_from_service(self) -> bool:
+		# Copies the region of the window from the shared texture. The
+		# background color is painted over it, instead of being blurred in
+		# the worker. The window is only registered as a client while the
+		# service runs, so no client files are left behind without it
+		start = time.perf_counter()
+		if not self.__service_reader.is_available():
+			self.__unregister_service_client()
+			return False
+
+		if not self.__service_registered:
+			register_client(self.__toplevel_id)
+			self.__service_registered = True
+
+		image = self.__service_reader.region(self.__texture_rect)
+		if image is None:
+			return False
+
+		self.__worker.cancel()
+		self.__texture_image = None
+		self.__texture_qimage = image
+		overlay = None
+		if self.__background_color:
+			overlay = QtGui.QColor(*self.__background_color)
+
+		radii, margins = self.__get_background_shape()
+		self.__toplevel.central_widget().set_background_image(
+			self.__texture_qimage, radii, margins, overlay=overlay)
+		self.__is_using_texture = True
+		self.__stats.add_timing(
+			'service', (time.perf_counter() - start) * 1000)
+		self.__stats.count('service_frames')
+		return True
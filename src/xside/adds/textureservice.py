@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+import argparse
+import mmap
+import os
+import struct
+import sys
+import time
+
+from PIL import Image
+from PySide6 import QtCore, QtGui
+from __feature__ import snake_case
+
+from xside.adds.blur import Blur, BLUR_QUALITY_TIERS
+from xside.adds.cache import image_digest
+from xside.adds.capture import WindowCapture, visible_regions
+from xside.adds.runtime import runtime_dir
+from xside.adds.windowstack import window_stack
+
+# magic, version, sequence, width, height, stride, timestamp, active slot
+HEADER = struct.Struct('<4sIQIIIdI')
+HEADER_SIZE = 64
+MAGIC = b'XSTX'
+VERSION = 1
+
+
+def service_name(display_name: str | None = None) -> str:
+	"""Name of the service files of the display, like: 'texture-0'"""
+	display_name = display_name or os.environ.get('DISPLAY', ':0')
+	return 'texture-' + ''.join(
+		x if x.isalnum() else '-' for x in display_name.lstrip(':'))
+
+
+def service_path(display_name: str | None = None) -> str:
+	"""Memory-mapped file of the service of the display"""
+	return os.path.join(runtime_dir(), service_name(display_name) + '.shm')
+
+
+def clients_path(display_name: str | None = None) -> str:
+	"""Directory with one empty file per client window id"""
+	path = os.path.join(
+		runtime_dir(), service_name(display_name) + '-clients')
+	os.makedirs(path, mode=0o700, exist_ok=True)
+	return path
+
+
+def register_client(window_id: str, display_name: str | None = None) -> None:
+	"""Leave the client window out of the published texture
+
+	A client needs what is behind its window, not the window itself.
+	"""
+	open(os.path.join(clients_path(display_name), window_id), 'w').close()
+
+
+def unregister_client(
+		window_id: str, display_name: str | None = None) -> None:
+	"""..."""
+	try:
+		os.remove(os.path.join(clients_path(display_name), window_id))
+	except FileNotFoundError:
+		pass
+
+
+class TextureServiceWriter(object):
+	"""Publishes blurred frames in the memory-mapped file
+
+	The file has a header and two frame slots. Each frame is written to
+	the slot that readers are not using, and then the header points them
+	to it.
+	"""
+	def __init__(self, path: str) -> None:
+		"""..."""
+		self.__path = path
+		self.__mmap = None
+		self.__size = (0, 0)
+		self.__active = 0
+		self.__sequence = 0
+
+	def close(self) -> None:
+		"""Close and remove the file"""
+		if self.__mmap:
+			self.__mmap.close()
+			self.__mmap = None
+		try:
+			os.remove(self.__path)
+		except FileNotFoundError:
+			pass
+
+	def publish(self, image: Image.Image) -> None:
+		"""Write the RGBA image as the current frame"""
+		if image.size != self.__size:
+			self.__create(image.size)
+
+		width, height = self.__size
+		frame_size = width * 4 * height
+		slot = 1 - self.__active
+		offset = HEADER_SIZE + slot * frame_size
+		self.__mmap[offset:offset + frame_size] = image.tobytes()
+
+		self.__active = slot
+		self.__sequence += 1
+		self.__write_header()
+
+	def __create(self, size: tuple) -> None:
+		# A new file replaces the old one, so readers that still map the
+		# old file are not affected and can see that it changed
+		width, height = size
+		temp_path = self.__path + '.new'
+		with open(temp_path, 'wb') as file:
+			file.truncate(HEADER_SIZE + width * 4 * height * 2)
+		os.chmod(temp_path, 0o600)
+
+		if self.__mmap:
+			self.__mmap.close()
+		with open(temp_path, 'r+b') as file:
+			self.__mmap = mmap.mmap(file.fileno(), 0)
+		os.replace(temp_path, self.__path)
+
+		self.__size = size
+		self.__active = 0
+
+	def __write_header(self) -> None:
+		width, height = self.__size
+		HEADER.pack_into(
+			self.__mmap, 0, MAGIC, VERSION, self.__sequence,
+			width, height, width * 4, time.time(), self.__active)
+
+
+class TextureServiceReader(object):
+	"""Reads the frames published by the service
+
+	Regions are copied out of the mapped file, so they stay valid after the
+	service writes new frames. A copy is only made again when the frame
+	sequence or the rect changed.
+	"""
+	def __init__(
+			self, path: str, max_age: float = 5.0, attempts: int = 3) -> None:
+		"""
+		:param path: File of the service, like the one of 'service_path()'
+		:param max_age: Seconds after which a frame is too old, and the
+			service is considered stopped
+		:param attempts: Reads of a region before giving up, when the
+			service keeps writing over the slot that is being read
+		"""
+		self.__path = path
+		self.__max_age = max_age
+		self.__attempts = attempts
+		self.__mmap = None
+		self.__inode = None
+		self.__region = None
+
+	def close(self) -> None:
+		"""Release the map"""
+		if self.__mmap:
+			self.__mmap.close()
+		self.__mmap = None
+		self.__inode = None
+		self.__region = None
+
+	def is_available(self) -> bool:
+		"""If the service is running and publishing frames"""
+		header = self.__header()
+		return bool(header) and time.time() - header[6] <= self.__max_age
+
+	def region(self, rect: tuple) -> QtGui.QImage | None:
+		"""Copy of a part of the current frame
+
+		:param rect: (x, y, width, height) in screen coordinates
+		:return: The region, or None when the service is not available, the
+			rect is not inside the frame, or the frame kept changing while
+			it was copied
+		"""
+		for _ in range(self.__attempts):
+			header = self.__header()
+			if not header or time.time() - header[6] > self.__max_age:
+				return None
+
+			_, _, sequence, width, height, stride, _, active = header
+			if self.__region and self.__region[:2] == (sequence, rect):
+				return self.__region[2]
+
+			x, y, w, h = rect
+			if x < 0 or y < 0 or w <= 0 or h <= 0 or (
+					x + w > width or y + h > height):
+				return None
+
+			offset = (
+				HEADER_SIZE + active * stride * height + y * stride + x * 4)
+			with memoryview(self.__mmap) as view:
+				with view[offset:offset + stride * (h - 1) + w * 4] as data:
+					image = QtGui.QImage(
+						data, w, h, stride,
+						QtGui.QImage.Format_RGBA8888).copy()
+
+			# The service writes the slot that was read right after it
+			# publishes the next frame. The copy is whole if no frame was
+			# published while it was made
+			header = self.__header()
+			if header and header[2] == sequence:
+				self.__region = (sequence, rect, image)
+				return image
+		return None
+
+	def sequence(self) -> int:
+		"""Number of the current frame, 0 when there is none"""
+		header = self.__header()
+		return header[2] if header else 0
+
+	def __header(self) -> tuple | None:
+		# The file is opened again when the service replaced it, and the
+		# map of the replaced file is closed
+		try:
+			inode = os.stat(self.__path).st_ino
+		except FileNotFoundError:
+			return None
+
+		if inode != self.__inode:
+			self.close()
+			with open(self.__path, 'rb') as file:
+				self.__mmap = mmap.mmap(
+					file.fileno(), 0, access=mmap.ACCESS_READ)
+			self.__inode = inode
+
+		if len(self.__mmap) < HEADER_SIZE:
+			return None
+
+		header = HEADER.unpack_from(self.__mmap, 0)
+		if header[0] != MAGIC or header[1] != VERSION:
+			return None
+		return header
+
+
+class TextureService(QtCore.QObject):
+	"""Captures, blurs and publishes the window stack of the screen
+
+	One service per session does the capture and blur work for all the
+	xside windows: each 'Texture' that enables the service copies the part
+	it needs from the published frame.
+
+	Needs a running 'QGuiApplication'. The windows of the registered
+	clients are left out, so each client gets what is behind it.
+	"""
+	def __init__(
+			self,
+			display_name: str | None = None,
+			interval: int = 500,
+			radius: float = 15,
+			quality: str = 'medium',
+			*args, **kwargs) -> None:
+		"""
+		:param display_name: X display, like ':99'. Default is $DISPLAY
+		:param interval: Milliseconds between frames
+		:param radius: Blur radius
+		:param quality: One of the 'BLUR_QUALITY_TIERS' keys
+		"""
+		super().__init__(*args, **kwargs)
+		self.__display_name = display_name
+		self.__screen = QtGui.QGuiApplication.primary_screen()
+		self.__window_stack = window_stack(display_name)
+		self.__window_capture = WindowCapture(self.__screen)
+		self.__blur = Blur(radius, quality)
+		self.__writer = TextureServiceWriter(service_path(display_name))
+		self.__frame = None
+		self.__blurred = None
+
+		self.__timer = QtCore.QTimer()
+		self.__timer.set_interval(interval)
+		self.__timer.timeout.connect(self.__publish_frame)
+
+	def start(self) -> None:
+		"""..."""
+		self.__publish_frame()
+		self.__timer.start()
+
+	def stop(self) -> None:
+		"""Stop publishing and remove the service file"""
+		self.__timer.stop()
+		self.__window_stack.close()
+		self.__writer.close()
+
+	def __publish_frame(self) -> None:
+		# Frames are only blurred again when a window changed, but are
+		# always published, so readers know the service is running
+		geometry = self.__screen.geometry()
+		rect = (0, 0, geometry.width(), geometry.height())
+		clients = set(os.listdir(clients_path(self.__display_name)))
+
+		windows = []
+		for window in self.__window_stack.windows():
+			if window.id_ in clients:
+				continue
+			if window.type_ == -1 and (window.w, window.h) != rect[2:]:
+				continue
+			windows.append(window)
+
+		captures = []
+		for window, region in visible_regions(windows, rect):
+			image = self.__window_capture.capture(window, region)
+			if image:
+				captures.append((window.id_, image, region))
+
+		frame = frozenset(
+			(id_, region, image_digest(image))
+			for id_, image, region in captures)
+		if frame != self.__frame:
+			canvas = Image.new('RGBA', rect[2:])
+			for _, image, region in captures:
+				canvas.paste(image, region[:2])
+			self.__blurred = self.__blur.apply(canvas)
+			self.__frame = frame
+
+		self.__writer.publish(self.__blurred)
+
+
+def main(argv: list | None = None) -> int:
+	"""Run the service
+
+	python -m xside.adds.textureservice [--display :99]
+	"""
+	parser = argparse.ArgumentParser(
+		prog='python -m xside.adds.textureservice',
+		description='Shared blurred desktop texture for xside windows')
+	parser.add_argument('--display', help='X display, like :99')
+	parser.add_argument(
+		'--interval', type=int, default=500,
+		help='milliseconds between frames')
+	parser.add_argument('--radius', type=float, default=15)
+	parser.add_argument(
+		'--quality', default='medium', choices=list(BLUR_QUALITY_TIERS))
+	args = parser.parse_args(argv)
+
+	if args.display:
+		os.environ['DISPLAY'] = args.display
+
+	app = QtGui.QGuiApplication(sys.argv[:1])
+	service = TextureService(
+		args.display, args.interval, args.radius, args.quality)
+	app.aboutToQuit.connect(service.stop)
+	service.start()
+	return app.exec()
+
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+import logging
+import subprocess
+
+try:
+	from Xlib import X, Xatom, display, error
+	from Xlib.protocol import request
+except ImportError:
+	X, Xatom, display, error, request = None, None, None, None, None
+
+
+class Window(object):
+	"""A desktop window
+
+	Geometry is in root window coordinates. 'type_' is the desktop number
+	of the window, '-1' for windows on all desktops (like the desktop
+	itself).
+	"""
+	def __init__(
+			self,
+			id_: str = 'Window',
+			type_: int = 0,
+			x: int = 0,
+			y: int = 0,
+			w: int = 0,
+			h: int = 0,
+			title: str = '') -> None:
+		"""..."""
+		self.id_ = id_
+		self.type_ = type_
+		self.x = x
+		self.y = y
+		self.w = w
+		self.h = h
+		self.title = title
+
+	def __str__(self) -> str:
+		return f'<Window: {self.id_}>'
+
+	def __repr__(self) -> str:
+		return f'<Window: {self.id_}>'
+
+
+def window_id(xid: int) -> str:
+	"""Window id formatted like 'wmctrl' does: '0x03a00007'"""
+	return f'0x{xid:08x}'
+
+
+class WindowStack(object):
+	"""Desktop windows in stacking order
+
+	Backends list the windows of the window manager from the bottom to the
+	top of the stack, without the minimized (unmapped) ones.
+	"""
+	def windows(self) -> list:
+		"""Mapped windows, from the bottom to the top of the stack"""
+		return []
+
+	def close(self) -> None:
+		"""Release the resources of the backend"""
+
+	def forks(self) -> int:
+		"""Number of processes started by the backend so far"""
+		return 0
+
+
+class XlibWindowStack(WindowStack):
+	"""Window stack read from one persistent X connection
+
+	Uses 'python-xlib'. The stacking order, map state, geometry and desktop
+	of the windows are requested from the X server directly, so listing the
+	windows does not fork any process. The requests of all the windows are
+	sent before the first reply is read, so a listing takes two round trips
+	to the server, however many windows there are.
+	"""
+	def __init__(self, display_name: str | None = None) -> None:
+		"""
+		:param display_name: X display, like ':99'. Default is $DISPLAY
+		"""
+		self.__display = display.Display(display_name)
+		self.__root = self.__display.screen().root
+		self.__client_list_stacking = self.__display.intern_atom(
+			'_NET_CLIENT_LIST_STACKING')
+		self.__wm_desktop = self.__display.intern_atom('_NET_WM_DESKTOP')
+		self.__wm_name = self.__display.intern_atom('_NET_WM_NAME')
+
+	def windows(self) -> list:
+		"""..."""
+		stacking = self.__root.get_full_property(
+			self.__client_list_stacking, X.AnyPropertyType)
+		if not stacking:
+			return []
+
+		requests = [
+			(xid, self.__window_requests(xid)) for xid in stacking.value]
+		windows = []
+		for xid, window_requests in requests:
+			try:
+				window = self.__window(xid, *window_requests)
+			except error.XError as err:
+				# The window was closed while it was being read
+				logging.info(err)
+				continue
+			if window:
+				windows.append(window)
+
+		return windows
+
+	def close(self) -> None:
+		"""..."""
+		self.__display.close()
+
+	def __property_request(self, xid: int, atom: int):
+		# Deferred 'GetProperty', long enough for any desktop or title
+		return request.GetProperty(
+			display=self.__display.display, defer=True, delete=False,
+			window=xid, property=atom, type=X.AnyPropertyType,
+			long_offset=0, long_length=1024)
+
+	@staticmethod
+	def __property_value(reply):
+		# The value of a 'GetProperty' reply, None when it is not set
+		reply.reply()
+		if not reply.property_type:
+			return None
+		return reply.value[1]
+
+	def __window(
+			self, xid: int, attributes, geometry, coords, desktop,
+			net_wm_name, wm_name) -> Window | None:
+		# Same geometry as 'wmctrl -lG'. None when the window is unmapped
+		attributes.reply()
+		if attributes.map_state == X.IsUnmapped:
+			return None
+
+		geometry.reply()
+		coords.reply()
+		type_ = self.__property_value(desktop)
+		type_ = type_[0] if type_ else 0
+		type_ = -1 if type_ == 0xFFFFFFFF else type_
+
+		title = self.__property_value(net_wm_name)
+		if title is None:
+			title = self.__property_value(wm_name)
+		if isinstance(title, bytes):
+			title = title.decode(errors='replace')
+
+		return Window(
+			window_id(xid), int(type_),
+			coords.x + geometry.x, coords.y + geometry.y,
+			geometry.width, geometry.height, title or '')
+
+	def __window_requests(self, xid: int) -> tuple:
+		# Deferred requests of a window, their replies are read later.
+		# (0, 0) is translated to root coordinates, and then the geometry
+		# position is added, which is the same as translating that position
+		protocol_display = self.__display.display
+		return (
+			request.GetWindowAttributes(
+				display=protocol_display, defer=True, window=xid),
+			request.GetGeometry(
+				display=protocol_display, defer=True, drawable=xid),
+			request.TranslateCoords(
+				display=protocol_display, defer=True, src_wid=xid,
+				dst_wid=self.__root, src_x=0, src_y=0),
+			self.__property_request(xid, self.__wm_desktop),
+			self.__property_request(xid, self.__wm_name),
+			self.__property_request(xid, Xatom.WM_NAME))
+
+
+class CliWindowStack(WindowStack):
+	"""Window stack read from 'wmctrl', 'xwininfo' and 'xprop'
+
+	Fallback backend when 'python-xlib' is not installed. Each call forks
+	one 'xwininfo' process per window.
+	"""
+	def __init__(self) -> None:
+		"""..."""
+		self.__forks = 0
+
+	def forks(self) -> int:
+		"""Number of processes started by the backend so far"""
+		return self.__forks
+
+	def windows(self) -> list:
+		"""..."""
+		wmctrl_output = self.__cli_output_by_args(['wmctrl', '-lG'])
+		if not wmctrl_output:
+			return []
+
+		windows = {}
+		for item in wmctrl_output.split('\n'):
+			window = self.__create_window_object_by_wmctrl_string(item)
+			if window and not self.__is_window_minimized(window):
+				windows[window.id_] = window
+
+		return [
+			windows[xid] for xid in self.__stacking_order() if xid in windows]
+
+	def __cli_output_by_args(self, args: list) -> str | None:
+		"""output of command arguments
+
+		by_args(['echo', '$HOME']) -> "/home/user"
+
+		:param args: list args like: ['ls', '-l']
+		"""
+		self.__forks += 1
+		try:
+			command = subprocess.Popen(
+				args, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+			stdout, stderr = command.communicate()
+		except (ValueError, OSError) as er:
+			logging.error(er)
+			logging.error(f'Error in command args: "{args}"')
+			return None
+		else:
+			if not stderr.decode():
+				return stdout.decode().strip().strip("'").strip()
+			return None
+
+	@staticmethod
+	def __create_window_object_by_wmctrl_string(
+			window_str: str) -> Window | None:
+		try:
+			id_, type_, x, y, width, height, _, *title = window_str.split()
+			window = Window(
+				id_, int(type_), int(x), int(y), int(width), int(height),
+				' '.join(title))
+		except Exception as err:
+			logging.error(err)
+			return None
+		else:
+			return window
+
+	def __is_window_minimized(self, window: Window) -> bool:
+		xwininfo_output = self.__cli_output_by_args(
+			['xwininfo', '-id', window.id_, '-stats'])
+		if not xwininfo_output:
+			logging.error('"xwininfo" command error')
+			return False
+
+		return 'Map State: IsUnMapped' in xwininfo_output
+
+	def __stacking_order(self) -> list:
+		# xprop_root: list windows in order (z-index)
+		xprop_output = self.__cli_output_by_args(['xprop', '-root'])
+		if not xprop_output:
+			return []
+
+		for line in xprop_output.split('\n'):
+			if '_NET_CLIENT_LIST_STACKING(WINDOW)' in line:
+				return [
+					window_id(int(x.split()[-1], 16))
+					for x in line.split(',')]
+		return []
+
+
+def window_stack(display_name: str | None = None) -> WindowStack:
+	"""The fastest window stack backend available
+
+	An 'XlibWindowStack' when 'python-xlib' is installed and the X display
+	can be opened, otherwise a 'CliWindowStack'.
+
+	:param display_name: X display, like ':99'. Default is $DISPLAY
+	"""
+	if display:
+		try:
+			return XlibWindowStack(display_name)
+		except Exception as err:
+			logging.info(err)
+
+	return CliWindowStack()
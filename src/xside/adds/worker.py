@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+import logging
+import threading
+
+from PySide6 import QtCore
+from __feature__ import snake_case
+
+
+class TextureWorker(QtCore.QObject):
+	"""Single background thread that runs the latest texture job
+
+	Requests that arrive while a job is waiting replace it, so a burst of
+	requests ends up as one rebuild. Every request or 'cancel()' call makes
+	the job in progress stale: it can stop early by checking the
+	'is_cancelled' callable it receives, and its result is not delivered.
+
+	Results are emitted by 'job_finished_signal' from the thread of the
+	worker object (the GUI thread), never from the background thread.
+	"""
+	job_finished_signal = QtCore.Signal(object)
+	__job_done_signal = QtCore.Signal(int, object)
+
+	def __init__(self, *args, **kwargs) -> None:
+		"""..."""
+		super().__init__(*args, **kwargs)
+		self.__condition = threading.Condition()
+		self.__thread = None
+		self.__job = None
+		self.__generation = 0
+		self.__closed = False
+		self.__job_done_signal.connect(
+			self.__job_done_signal_receiver, QtCore.Qt.QueuedConnection)
+
+	def cancel(self) -> None:
+		"""Drop the waiting job and make the running one stale"""
+		with self.__condition:
+			self.__generation += 1
+			self.__job = None
+
+	def close(self) -> None:
+		"""Cancel the jobs and stop the background thread"""
+		with self.__condition:
+			self.__generation += 1
+			self.__job = None
+			self.__closed = True
+			self.__condition.notify()
+
+	def generation(self) -> int:
+		"""Number of the latest request or cancellation"""
+		return self.__generation
+
+	def request(self, job: callable) -> None:
+		"""Run 'job(is_cancelled)' in the background thread
+
+		The job returns its result, or None when there is nothing to
+		deliver.
+		"""
+		with self.__condition:
+			self.__generation += 1
+			self.__job = (self.__generation, job)
+			self.__closed = False
+			if not self.__thread or not self.__thread.is_alive():
+				self.__thread = threading.Thread(
+					target=self.__run, daemon=True)
+				self.__thread.start()
+			self.__condition.notify()
+
+	def __job_done_signal_receiver(
+			self, generation: int, result: object) -> None:
+		# Runs in the worker object thread. A request or cancellation may
+		# have happened after the job finished
+		if generation == self.__generation:
+			self.job_finished_signal.emit(result)
+
+	def __run(self) -> None:
+		while True:
+			with self.__condition:
+				while self.__job is None and not self.__closed:
+					self.__condition.wait()
+				if self.__closed:
+					return
+				generation, job = self.__job
+				self.__job = None
+
+			try:
+				result = job(lambda: generation != self.__generation)
+			except Exception as err:
+				logging.error(err)
+				continue
+
+			if result is not None and generation == self.__generation:
+				self.__job_done_signal.emit(generation, result)
@@ -1,4 +1,4 @@
-from .stylebase import EnvStyle
+from .stylebase import EnvStyle, EnvStyleSnapshot
 from .stylecinnamon import EnvStyleCinnamon
 from .stylegnome import EnvStyleGnome
 from .stylemac import EnvStyleMac
@@ -1,4 +1,5 @@
 #!/usr/bin/env python3
+import dataclasses
 import logging
 
 from PySide6 import QtGui
@@ -7,12 +8,90 @@ from __feature__ import snake_case
 import xside.modules.color as color
 
 
+@dataclasses.dataclass(frozen=True, slots=True)
+class EnvStyleSnapshot(object):
+    """Resolved environment settings
+
+    Immutable and hashable table with the values of all the 'EnvStyle'
+    getters that take no arguments. Colors are RGBA tuples, like:
+    (255, 255, 255, 255)
+    """
+    contextmenu_background_color: tuple
+    contextmenu_border_color: tuple
+    contextmenu_border_radius: int
+    contextmenu_margin: tuple
+    contextmenu_padding: tuple
+    contextmenu_separator_color: tuple
+    contextmenu_separator_margin: tuple
+    contextmenu_spacing: int
+    contextmenubutton_background_hover_color: tuple
+    contextmenubutton_border_hover_color: tuple
+    contextmenubutton_border_radius: int
+    contextmenubutton_label_hover_color: tuple
+    contextmenubutton_padding: tuple
+    contextmenugroup_padding: tuple
+    controlbuttons_margin: tuple
+    controlbuttons_order: tuple
+    controlbuttons_spacing: int
+    desktop_is_using_global_menu: bool
+    headerbar_margin: tuple
+    icon_theme_name: str | None
+    label_color: tuple
+    label_context_color: tuple
+    label_disabled_color: tuple
+    window_accent_color: tuple
+    window_background_color: tuple
+    window_background_darker_color: tuple
+    window_background_lighter_color: tuple
+    window_border: int
+    window_border_color: tuple
+    window_border_radius: tuple
+    window_is_dark: bool
+    window_margin: tuple
+    window_icon_margin: tuple
+
+
 class EnvStyle(object):
     """Base environment settings"""
 
     def __init__(self):
         """..."""
         self.palette = QtGui.QPalette()
+        self.__palette_cache_key = self.palette.cache_key()
+        self.__snapshot = None
+
+    def snapshot(self) -> EnvStyleSnapshot:
+        """All the settings values resolved at once
+
+        The values are computed on the first call and reused until the
+        application palette changes or 'invalidate_snapshot' is called.
+        """
+        palette = QtGui.QPalette()
+        if palette.cache_key() != self.__palette_cache_key:
+            self.palette = palette
+            self.__palette_cache_key = palette.cache_key()
+            self.__snapshot = None
+
+        if not self.__snapshot:
+            self.__snapshot = self.__build_snapshot()
+        return self.__snapshot
+
+    def invalidate_snapshot(self) -> None:
+        """Discard the resolved values
+
+        Use it when the desktop config that the settings depend on changes.
+        """
+        self.__snapshot = None
+
+    def __build_snapshot(self) -> EnvStyleSnapshot:
+        # Call each getter once. QColor becomes an RGBA tuple
+        values = {}
+        for field in dataclasses.fields(EnvStyleSnapshot):
+            value = getattr(self, field.name)()
+            if isinstance(value, QtGui.QColor):
+                value = value.to_tuple()
+            values[field.name] = value
+        return EnvStyleSnapshot(**values)
 
     def contextmenu_background_color(self) -> QtGui.QColor:
         """..."""
@@ -86,10 +86,11 @@ class EnvStyleGnome(stylebase.EnvStyle):
         """
         button_layout = cli.output_by_args(
             ["gsettings", "get", "org.gnome.desktop.wm.preferences",
-             "button-layout"]).split(':')
+             "button-layout"])
 
-        if not button_layout:
+        if not button_layout or ':' not in button_layout:
             return (3,), (0, 1, 2)
+        button_layout = button_layout.split(':')
 
         d = {'close': 2, 'maximize': 1, 'minimize': 0}
         left = []
@@ -110,7 +111,7 @@ class EnvStyleGnome(stylebase.EnvStyle):
 
     def icon_theme_name(self) -> str | None:
         """..."""
-        icon_theme = self.cli.output_by_args(
+        icon_theme = cli.output_by_args(
             ['gsettings', 'get', 'org.gnome.desktop.interface', 'icon-theme'])
         return icon_theme if icon_theme else None
 
@@ -144,6 +144,7 @@ class EnvStylePlasma(stylebase.EnvStyle):
         group, key = '[Windows]', 'BorderlessMaximizedWindows'
         if group in self.__kwinrc and key in self.__kwinrc[group]:
             return True if self.__kwinrc[group][key] == 'true' else False
+        return False
 
     @staticmethod
     def headerbar_margin() -> tuple:
@@ -1,9 +1,21 @@
 #!/usr/bin/env python3
+import threading
+
 import xside.modules.desktopstyles as desktopstyles
 
 
 class GuiEnv(object):
-    """..."""
+    """GUI environment settings
+
+    The 'EnvStyle' settings object is shared by the whole process. All the
+    'GuiEnv' instances created with the same operational system, desktop
+    environment and 'follow_platform' values use the same settings object,
+    which is only built (and for some desktops, has its config files read)
+    the first time it is requested.
+    """
+    __settings_registry = {}
+    __settings_registry_lock = threading.Lock()
+
     def __init__(
             self,
             operational_system: str,
@@ -13,11 +25,51 @@ class GuiEnv(object):
         self.__operational_system = operational_system
         self.__desktop_environment = desktop_environment
         self.__follow_platform = follow_platform
-        self.__gui_env_settings = self.__get_gui_env_settings()
+        self.__registry_key = (
+            self.__operational_system,
+            self.__desktop_environment,
+            self.__follow_platform)
 
     def settings(self) -> desktopstyles.EnvStyle:
-        """..."""
-        return self.__gui_env_settings
+        """The shared settings object for this environment"""
+        gui_env_settings = GuiEnv.__settings_registry.get(self.__registry_key)
+        if gui_env_settings is not None:
+            return gui_env_settings
+
+        with GuiEnv.__settings_registry_lock:
+            if self.__registry_key not in GuiEnv.__settings_registry:
+                GuiEnv.__settings_registry[self.__registry_key] = (
+                    self.__get_gui_env_settings())
+            return GuiEnv.__settings_registry[self.__registry_key]
+
+    def reload(self) -> desktopstyles.EnvStyle:
+        """Rebuild the shared settings object for this environment
+
+        The desktop config files are read again. Every 'GuiEnv' with the same
+        environment will get the new object on the next 'settings()' call.
+        """
+        with GuiEnv.__settings_registry_lock:
+            GuiEnv.__settings_registry[self.__registry_key] = (
+                self.__get_gui_env_settings())
+            return GuiEnv.__settings_registry[self.__registry_key]
+
+    @staticmethod
+    def invalidate(
+            operational_system: str | None = None,
+            desktop_environment: str | None = None,
+            follow_platform: bool | None = None) -> None:
+        """Discard the shared settings objects
+
+        Objects are built again the next time they are requested. Arguments
+        that are 'None' match any value, so 'GuiEnv.invalidate()' discards
+        all of them.
+        """
+        with GuiEnv.__settings_registry_lock:
+            for key in list(GuiEnv.__settings_registry):
+                if all(arg is None or arg == value for arg, value in zip(
+                        (operational_system, desktop_environment,
+                         follow_platform), key)):
+                    del GuiEnv.__settings_registry[key]
 
     def __get_gui_env_settings(self) -> desktopstyles.EnvStyle:
         # ...
@@ -36,7 +88,7 @@ class GuiEnv(object):
                 if self.__desktop_environment == 'mate':
                     return desktopstyles.EnvStyleMate()
 
-                return EnvStyleGnome()
+                return desktopstyles.EnvStyleGnome()
 
             if self.__operational_system == 'mac':
                 return desktopstyles.EnvStyleMac()
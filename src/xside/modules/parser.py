@@ -3,12 +3,16 @@
 #   www.freedesktop.org/wiki/Specifications/
 #   www.freedesktop.org/wiki/Specifications/basedir-spec/
 #   www.freedesktop.org/wiki/Specifications/desktop-entry-spec/
+import concurrent.futures
 import logging
+import marshal
 import os
-import re
-import subprocess
+import tempfile
 # from subprocess import getoutput
 
+from PySide6 import QtCore
+from __feature__ import snake_case
+
 
 class DesktopFileLocates(object):
     """Desktop files location object.
@@ -19,16 +23,33 @@ class DesktopFileLocates(object):
 
     Follows the specification from freedesktop.org:
         www.freedesktop.org/wiki/Specifications/basedir-spec/
+
+    Subdirectories of the "applications" directories are also searched. A
+    file in a subdirectory has a desktop file ID with the subdirectory as
+    prefix, like: "applications/kde4/konsole.desktop" is
+    "kde4-konsole.desktop".
     """
-    def __init__(self) -> None:
+    def __init__(self, paths: list | None = None) -> None:
         """Class constructor
 
         Initialize class properties.
+
+        :param paths:
+            "applications" directories in order of priority. Default is the
+            ones of $XDG_DATA_HOME and $XDG_DATA_DIRS
         """
-        self.__paths = self.__find_paths()
+        self.__paths = paths if paths is not None else self.__find_paths()
         self.__ulrs_by_priority = None
         self.__ulrs = None
 
+    @property
+    def desktop_file_ids(self) -> dict:
+        """Desktop file IDs and their ulrs, in order of priority
+
+        Like: {'firefox.desktop': '/usr/share/applications/firefox.desktop'}
+        """
+        return dict(self.iter_ulrs_by_priority())
+
     @property
     def paths(self) -> list:
         """All desktop file paths
@@ -48,8 +69,8 @@ class DesktopFileLocates(object):
         "/usr/local/share" take precedence over files in "/usr/share".
         """
         if not self.__ulrs_by_priority:
-            self.__ulrs_by_priority = (
-                self.__find_urls_by_priority())
+            self.__ulrs_by_priority = [
+                url for _, url in self.iter_ulrs_by_priority()]
         return self.__ulrs_by_priority
 
     @property
@@ -61,60 +82,77 @@ class DesktopFileLocates(object):
         "files_ulr_by_priority" property.
         """
         if not self.__ulrs:
-            self.__ulrs = (
-                self.__find_urls())
+            self.__ulrs = [url for _, url in self.iter_ulrs()]
         return self.__ulrs
 
-    @staticmethod
-    def __find_paths() -> list:
-        desktop_file_dirs = [
-            os.path.join(
-                os.environ.get(
-                    'XDG_DATA_HOME',
-                    os.path.join(os.environ['HOME'], '.local', 'share')),
-                'applications')]
-
-        xdg_data_dirs_stdout = os.environ.get('XDG_DATA_DIRS')
-        if xdg_data_dirs_stdout:
-            for data_dir in xdg_data_dirs_stdout.split(':'):
-                if 'applications' in os.listdir(data_dir):
-                    desktop_file_dirs.append(
-                        os.path.join(data_dir, 'applications'))
-        else:
-            desktop_file_dirs += [
-                '/usr/local/share/applications', '/usr/share/applications']
+    def iter_ulrs(self):
+        """Iterate over all the desktop file IDs and ulrs
 
-        return desktop_file_dirs
-
-    def __find_urls_by_priority(self) -> list:
-        # Get url in order of precedence
-
-        checked_file_names = []
-        desktop_files = []
+        Yield tuples like:
+            ('kde4-konsole.desktop', '/path/kde4/konsole.desktop')
+        The same ID may come from more than one path.
+        """
         for desktop_dir in self.__paths:
-            for desktop_file in os.listdir(desktop_dir):
+            yield from self.__scan_dir(desktop_dir)
 
-                if desktop_file not in checked_file_names:
-                    checked_file_names.append(desktop_file)
+    def iter_ulrs_by_priority(self):
+        """Iterate over the desktop file IDs and ulrs in order of priority
 
-                    if ('~' not in desktop_file
-                            and desktop_file.endswith('.desktop')):
-                        desktop_files.append(
-                            os.path.join(desktop_dir, desktop_file))
+        Like "iter_ulrs", but files shadowed by a file with the same ID in
+        a path of higher priority are skipped.
+        """
+        seen_ids = set()
+        for desktop_file_id, url in self.iter_ulrs():
+            if desktop_file_id not in seen_ids:
+                seen_ids.add(desktop_file_id)
+                yield desktop_file_id, url
 
-        return desktop_files
+    @staticmethod
+    def __find_paths() -> list:
+        data_dirs = [
+            os.environ.get('XDG_DATA_HOME') or
+            os.path.join(os.environ['HOME'], '.local', 'share')]
+        data_dirs += (
+            os.environ.get('XDG_DATA_DIRS') or
+            '/usr/local/share:/usr/share').split(':')
+
+        desktop_file_dirs = []
+        for data_dir in data_dirs:
+            desktop_dir = os.path.join(data_dir, 'applications')
+            if (data_dir and desktop_dir not in desktop_file_dirs
+                    and os.path.isdir(desktop_dir)):
+                desktop_file_dirs.append(desktop_dir)
 
-    def __find_urls(self) -> list:
-        # Get all url
-        desktop_files = []
-        for desktop_dir in self.__paths:
-            for desktop_file in os.listdir(desktop_dir):
-                if ('~' not in desktop_file
-                        and desktop_file.endswith('.desktop')):
-                    desktop_files.append(
-                        os.path.join(desktop_dir, desktop_file))
+        return desktop_file_dirs
 
-        return desktop_files
+    @staticmethod
+    def __scan_dir(desktop_dir: str):
+        # Yield (desktop file ID, url) of the dir and its subdirectories.
+        # Visited dirs are tracked, so symlink loops end
+        visited_dirs = set()
+        dirs = [(desktop_dir, '')]
+        while dirs:
+            path, prefix = dirs.pop()
+            try:
+                stat = os.stat(path)
+                if (stat.st_dev, stat.st_ino) in visited_dirs:
+                    continue
+                visited_dirs.add((stat.st_dev, stat.st_ino))
+                entries = list(os.scandir(path))
+            except OSError as err:
+                logging.error(err)
+                continue
+
+            for entry in entries:
+                if '~' in entry.name:
+                    continue
+                try:
+                    if entry.is_dir():
+                        dirs.append((entry.path, prefix + entry.name + '-'))
+                    elif entry.name.endswith('.desktop'):
+                        yield prefix + entry.name, entry.path
+                except OSError as err:
+                    logging.error(err)
 
 
 class DesktopFile(object):
@@ -123,23 +161,36 @@ class DesktopFile(object):
     Desktop files are files with the extension '.desktop' and are used
     internally by menus to find applications. This object converts these files
     into a dictionary to provide easy access to their values.
+
+    The file is read line by line once to find where each group starts, and
+    the keys of a group are only decoded when the group is first used.
     """
-    def __init__(self, url: str) -> None:
+    def __init__(self, url: str, content: dict | None = None) -> None:
         """Class constructor
 
         Initialize class properties.
 
         :param url:
             String from a desktop file like: "/path/file.desktop"
+        :param content:
+            Already parsed content, like the one from a "DesktopFileIndex".
+            The file is only read when it is not given
         """
         self.__url = os.path.abspath(url)
-        self.__content = None
-        self.__url_basename = os.path.basename(self.__url).rstrip('.desktop')
+        self.__content = content
+        self.__groups = dict(content) if content is not None else {}
+        self.__group_offsets = None
+        self.__sort_key = None
+        self.__url_basename = os.path.basename(
+            self.__url).removesuffix('.desktop')
 
     @property
     def content(self) -> dict:
         """Contents of a desktop file as a dictionary
 
+        Values are the raw strings of the file, see "value" and "values" to
+        get them unescaped and localized.
+
         Example:
         >>> desktop_file = DesktopFile(
         ... url='/usr/share/applications/firefox.desktop')
@@ -157,10 +208,30 @@ class DesktopFile(object):
         >>> desktop_file.content['[Desktop Action new-window]']['Name']
         'Open a New Window'
         """
-        if not self.__content:
-            self.__parse_file_to_dict()
+        if self.__content is None:
+            self.__content = {
+                header: self.group(header) for header in self.groups}
         return self.__content
 
+    @property
+    def groups(self) -> list:
+        """Group headers of the file, like: ['[Desktop Entry]']"""
+        if self.__content is not None:
+            return list(self.__content)
+        return list(self.__find_group_offsets())
+
+    @property
+    def sort_key(self) -> str:
+        """Lowercase unescaped name, or file name when there is no name
+
+        Computed once, use it to sort large lists:
+        sorted(desktop_files, key=lambda x: x.sort_key)
+        """
+        if self.__sort_key is None:
+            self.__sort_key = (
+                self.value('Name', locale='') or self.__url_basename).lower()
+        return self.__sort_key
+
     @property
     def url(self) -> str:
         """URL of the desktop file
@@ -171,64 +242,624 @@ class DesktopFile(object):
         """
         return self.__url
 
-    def __parse_file_to_dict(self) -> None:
-        # Open file
-        with open(self.__url, 'r') as desktop_file:
-            desktop_file_line = desktop_file.read()
-
-        # Separate scope: "[header]key=value...", "[h]k=v...",
-        desktop_scope = [
-            x + y for x, y in zip(
-                re.findall(r'\[\S', desktop_file_line),
-                re.split(r'\[\S', desktop_file_line)[1:])]
-
-        # Create dict
-        self.__content = {}
-        for scope in desktop_scope:
-            escope_header = ''           # [Desktop Entry]
-            escope_keys_and_values = {}  # Key=Value
-
-            for index_num, scopeline in enumerate(scope.split('\n')):
-                if index_num == 0:
-                    escope_header = scopeline
-                else:
-                    if scopeline and scopeline[0] != '#' and '=' in scopeline:
-                        line_key, line_value = scopeline.split('=', 1)
-                        escope_keys_and_values[line_key] = line_value
-
-            self.__content[escope_header] = escope_keys_and_values
+    def group(self, header: str) -> dict:
+        """Raw keys and values of a group
+
+        :param header: Group header, like: "[Desktop Entry]"
+        :return: Dict like: {'Name': 'Firefox', 'Name[de]': 'Firefox'},
+            empty if the group does not exist
+        """
+        if header not in self.__groups:
+            if self.__content is not None:
+                return {}
+            offsets = self.__find_group_offsets()
+            if header not in offsets:
+                return {}
+            self.__groups[header] = self.__parse_group(offsets[header])
+        return self.__groups[header]
+
+    def value(
+            self, key: str, header: str = '[Desktop Entry]',
+            locale: str | None = None) -> str | None:
+        """Unescaped and localized value of a key
+
+        :param key: Key without locale, like: "Name"
+        :param header: Group header, like: "[Desktop Entry]"
+        :param locale: Locale like "de_DE.UTF-8@euro". Default is the one
+            of the environment. Empty string to skip localized keys
+        :return: The value, or None if the key does not exist
+        """
+        raw_value = self.__localized_raw_value(key, header, locale)
+        if raw_value is None:
+            return None
+        return self.__split_value(raw_value)[0]
+
+    def values(
+            self, key: str, header: str = '[Desktop Entry]',
+            locale: str | None = None) -> list:
+        """Unescaped and localized list value of a key
+
+        Items are separated by ";", and an escaped "\\;" is part of an item.
+
+        :param key: Key without locale, like: "Categories"
+        :param header: Group header, like: "[Desktop Entry]"
+        :param locale: Locale like "de_DE.UTF-8@euro". Default is the one
+            of the environment. Empty string to skip localized keys
+        :return: List like: ['Network', 'WebBrowser'], empty if the key
+            does not exist
+        """
+        raw_value = self.__localized_raw_value(key, header, locale)
+        if raw_value is None:
+            return []
+        return self.__split_value(raw_value, ';')
+
+    def __find_group_offsets(self) -> dict:
+        # {'[Desktop Entry]': [(start, end)]}, byte ranges of the lines of
+        # each group. A group header is a whole "[...]" line, so a value
+        # that starts with "[" is not a header
+        if self.__group_offsets is not None:
+            return self.__group_offsets
+
+        self.__group_offsets = {}
+        header = None
+        start = position = 0
+        with open(self.__url, 'rb') as desktop_file:
+            for line in desktop_file:
+                if line[:1] == b'[':
+                    stripped = line.strip()
+                    if stripped.endswith(b']') and b'=' not in stripped:
+                        if header:
+                            self.__group_offsets[header].append(
+                                (start, position))
+                        header = stripped.decode('utf-8', 'replace')
+                        self.__group_offsets.setdefault(header, [])
+                        start = position + len(line)
+                position += len(line)
+
+        if header:
+            self.__group_offsets[header].append((start, position))
+        return self.__group_offsets
+
+    def __localized_raw_value(
+            self, key: str, header: str, locale: str | None) -> str | None:
+        # Most specific localized key first: lang_COUNTRY@MODIFIER,
+        # lang_COUNTRY, lang@MODIFIER, lang, and then the key itself
+        group = self.group(header)
+        if locale is None:
+            locale = (
+                os.environ.get('LC_ALL') or os.environ.get('LC_MESSAGES') or
+                os.environ.get('LANG') or '')
+
+        lang, _, modifier = locale.partition('@')
+        lang = lang.split('.')[0]
+        lang, _, country = lang.partition('_')
+        if lang and lang not in ('C', 'POSIX'):
+            for suffix in (
+                    f'{lang}_{country}@{modifier}' if country and modifier
+                    else None,
+                    f'{lang}_{country}' if country else None,
+                    f'{lang}@{modifier}' if modifier else None,
+                    lang):
+                if suffix and f'{key}[{suffix}]' in group:
+                    return group[f'{key}[{suffix}]']
+
+        return group.get(key)
+
+    def __other_key(self, _object):
+        # Other desktop files are compared by their sort key
+        if isinstance(_object, DesktopFile):
+            return _object.sort_key
+        return _object
+
+    def __parse_group(self, offsets: list) -> dict:
+        # Keys of the byte ranges of a group. Spaces around "=" are ignored
+        keys = {}
+        with open(self.__url, 'rb') as desktop_file:
+            for start, end in offsets:
+                desktop_file.seek(start)
+                lines = desktop_file.read(end - start).decode(
+                    'utf-8', 'replace').splitlines()
+                for line in lines:
+                    if line and line[0] != '#' and '=' in line:
+                        line_key, line_value = line.split('=', 1)
+                        keys[line_key.strip()] = line_value.lstrip()
+        return keys
+
+    @staticmethod
+    def __split_value(raw_value: str, separator: str | None = None) -> list:
+        # Unescape "\s", "\n", "\t", "\r" and "\\", and split by the
+        # separator, that can be escaped too. A trailing separator is
+        # optional
+        escapes = {'s': ' ', 'n': '\n', 't': '\t', 'r': '\r', '\\': '\\'}
+        if separator:
+            escapes[separator] = separator
+
+        items, item = [], []
+        chars = iter(raw_value)
+        for char in chars:
+            if char == '\\':
+                char = next(chars, '')
+                item.append(escapes.get(char, '\\' + char))
+            elif char == separator:
+                items.append(''.join(item))
+                item = []
+            else:
+                item.append(char)
+
+        if item or not separator:
+            items.append(''.join(item))
+        return items
 
     def __gt__(self, _object) -> bool:
-        if '[Desktop Entry]' in self.content:
-            return self.content['[Desktop Entry]']['Name'].lower() > _object
-        return self.__url_basename > _object
+        return self.sort_key > self.__other_key(_object)
 
     def __lt__(self, _object) -> bool:
-        if '[Desktop Entry]' in self.content:
-            return self.content['[Desktop Entry]']['Name'].lower() < _object
-        return self.__url_basename < _object
+        return self.sort_key < self.__other_key(_object)
 
     def __eq__(self, _object) -> bool:
-        if '[Desktop Entry]' in self.content:
-            return self.content['[Desktop Entry]']['Name'].lower() == _object
-        return self.__url_basename == _object
+        return self.sort_key == self.__other_key(_object)
 
     def __ge__(self, _object) -> bool:
-        if '[Desktop Entry]' in self.content:
-            return self.content['[Desktop Entry]']['Name'].lower() >= _object
-        return self.__url_basename >= _object
+        return self.sort_key >= self.__other_key(_object)
 
     def __le__(self, _object) -> bool:
-        if '[Desktop Entry]' in self.content:
-            return self.content['[Desktop Entry]']['Name'].lower() <= _object
-        return self.__url_basename <= _object
+        return self.sort_key <= self.__other_key(_object)
 
     def __ne__(self, _object) -> bool:
-        if '[Desktop Entry]' in self.content:
-            return self.content['[Desktop Entry]']['Name'].lower() != _object
-        return self.__url_basename != _object
+        return self.sort_key != self.__other_key(_object)
 
     def __str__(self) -> str:
-        if '[Desktop Entry]' in self.content:
-            return f'<DesktopFile: {self.content["[Desktop Entry]"]["Name"]}>'
-        return f'<DesktopFile: {self.__url_basename}>'
+        name = self.value('Name', locale='') or self.__url_basename
+        return f'<DesktopFile: {name}>'
+
+
+class DesktopFileIndex(object):
+    """Persistent index of desktop files.
+
+    The parsed content of the desktop files is kept in a cache file in
+    $XDG_CACHE_HOME, with the modification time and size of each file.
+    Updating the index only parses the files that changed since the last
+    time, so a cold start reads one cache file instead of parsing every
+    desktop file.
+
+    Desktop files can be found by "Name", "Exec", "Categories" and
+    "MimeType".
+    """
+    def __init__(
+            self, urls: list | None = None, cache_path: str | None = None
+            ) -> None:
+        """Class constructor
+
+        Initialize class properties and update the index.
+
+        :param urls:
+            Desktop file urls in order of priority. Default is the
+            "ulrs_by_priority" of a "DesktopFileLocates"
+        :param cache_path:
+            Cache file, default is "$XDG_CACHE_HOME/xside/desktop-files.cache"
+        """
+        self.__cache_path = cache_path or self.__default_cache_path()
+        self.__entries = self.__load_cache()
+        self.__urls = []
+        self.__lookups = None
+        self.update(urls)
+
+    @property
+    def cache_path(self) -> str:
+        """Path of the cache file"""
+        return self.__cache_path
+
+    @property
+    def desktop_files(self) -> list:
+        """All indexed desktop files, in order of priority"""
+        return [
+            DesktopFile(url, self.__entries[url][2]) for url in self.__urls]
+
+    def desktop_file(self, url: str) -> DesktopFile | None:
+        """Indexed desktop file of the url, None if it is not indexed"""
+        url = os.path.abspath(url)
+        if url not in self.__entries:
+            return None
+        return DesktopFile(url, self.__entries[url][2])
+
+    def find_by_category(self, category: str) -> list:
+        """Desktop files with the category in "Categories", like: "Network"
+        """
+        return self.__find('Categories', category.lower())
+
+    def find_by_exec(self, command: str) -> list:
+        """Desktop files that run the command, like: "firefox"
+
+        Only the name of the program in "Exec" is compared, without its
+        directory and arguments.
+        """
+        return self.__find('Exec', os.path.basename(command).lower())
+
+    def find_by_mime_type(self, mime_type: str) -> list:
+        """Desktop files with the type in "MimeType", like: "text/html"
+        """
+        return self.__find('MimeType', mime_type.lower())
+
+    def find_by_name(self, name: str) -> list:
+        """Desktop files whose "Name" is the name, ignoring case"""
+        return self.__find('Name', name.lower())
+
+    def update(
+            self, urls: list | None = None, changed_urls: list | None = None
+            ) -> tuple:
+        """Parse the files that changed and save the cache
+
+        :param urls:
+            Desktop file urls in order of priority. Default is the
+            "ulrs_by_priority" of a new "DesktopFileLocates"
+        :param changed_urls:
+            Only check these urls for changes, the other indexed urls are
+            kept as they are. Default is to check all the urls
+        :return:
+            Tuple with the lists of the added, removed and modified urls
+        """
+        if urls is None:
+            urls = DesktopFileLocates().ulrs_by_priority
+        urls = [os.path.abspath(url) for url in urls]
+        if changed_urls is not None:
+            changed_urls = {os.path.abspath(url) for url in changed_urls}
+
+        entries = {}
+        changed = {}
+        for url in urls:
+            if (changed_urls is not None and url not in changed_urls
+                    and url in self.__entries):
+                entries[url] = self.__entries[url]
+                continue
+
+            try:
+                stat = os.stat(url)
+            except OSError as err:
+                logging.error(err)
+                continue
+
+            entry = self.__entries.get(url)
+            if entry and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+                entries[url] = entry
+            else:
+                changed[url] = (stat.st_mtime_ns, stat.st_size)
+
+        added, modified = [], []
+        for url, desktop_file in iter_load_all(list(changed)):
+            entries[url] = (*changed[url], desktop_file.content)
+            if url in self.__entries:
+                modified.append(url)
+            else:
+                added.append(url)
+
+        removed = [url for url in self.__entries if url not in entries]
+        is_changed = added or modified or removed
+        self.__entries = entries
+        self.__urls = [url for url in urls if url in entries]
+        self.__lookups = None
+        if is_changed:
+            self.__save_cache()
+
+        return added, removed, modified
+
+    def __build_lookups(self) -> dict:
+        # {'Name': {'firefox web browser': [url, ...]}, 'Exec': {...}}
+        lookups = {'Name': {}, 'Exec': {}, 'Categories': {}, 'MimeType': {}}
+        for url in self.__urls:
+            desktop_file = DesktopFile(url, self.__entries[url][2])
+
+            values = {
+                'Name': [desktop_file.value('Name', locale='') or ''],
+                'Exec': [self.__exec_name(
+                    desktop_file.value('Exec', locale='') or '')],
+                'Categories': desktop_file.values('Categories', locale=''),
+                'MimeType': desktop_file.values('MimeType', locale='')}
+            for key, key_values in values.items():
+                for value in key_values:
+                    if value:
+                        lookups[key].setdefault(value.lower(), []).append(url)
+
+        return lookups
+
+    @staticmethod
+    def __default_cache_path() -> str:
+        cache_dir = os.environ.get('XDG_CACHE_HOME') or os.path.join(
+            os.environ['HOME'], '.cache')
+        return os.path.join(cache_dir, 'xside', 'desktop-files.cache')
+
+    @staticmethod
+    def __exec_name(exec_value: str) -> str:
+        # "env VAR=1 /usr/bin/firefox %u" -> "firefox"
+        for arg in exec_value.split():
+            if arg != 'env' and '=' not in arg:
+                return os.path.basename(arg.strip('"'))
+        return ''
+
+    def __find(self, key: str, value: str) -> list:
+        if self.__lookups is None:
+            self.__lookups = self.__build_lookups()
+        return [
+            DesktopFile(url, self.__entries[url][2])
+            for url in self.__lookups[key].get(value, [])]
+
+    def __load_cache(self) -> dict:
+        # {url: (mtime_ns, size, content)}
+        try:
+            with open(self.__cache_path, 'rb') as cache_file:
+                cache = marshal.load(cache_file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, EOFError, ValueError, TypeError) as err:
+            logging.error(err)
+            return {}
+
+        if not isinstance(cache, dict) or cache.get('version') != 1:
+            return {}
+        return cache['entries']
+
+    def __save_cache(self) -> None:
+        # Written to a temporary file of this process first, so readers
+        # never see half a cache, even when other processes save it too
+        temp_path = None
+        try:
+            cache_dir = os.path.dirname(self.__cache_path)
+            os.makedirs(cache_dir, exist_ok=True)
+            temp_fd, temp_path = tempfile.mkstemp(
+                dir=cache_dir, suffix='.new')
+            with os.fdopen(temp_fd, 'wb') as cache_file:
+                marshal.dump(
+                    {'version': 1, 'entries': self.__entries}, cache_file)
+            os.replace(temp_path, self.__cache_path)
+        except OSError as err:
+            logging.error(err)
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
+
+
+class WatchedDesktopFileIndex(QtCore.QObject):
+    """Desktop file index that follows the changes of the directories.
+
+    The "applications" directories and their subdirectories are watched
+    with a "QFileSystemWatcher". When a directory changes, only that
+    "applications" directory is scanned again, and only its changed files
+    are parsed. The urls that were added, removed or modified are emitted
+    by "index_changed_signal" as a dict like:
+        {'added': [url], 'removed': [url], 'modified': [url]}
+
+    Files replaced by package managers and most editors change their
+    directory. Files edited in place are only noticed with "watch_files",
+    that uses one more watch per file.
+    """
+    index_changed_signal = QtCore.Signal(dict)
+
+    def __init__(
+            self,
+            cache_path: str | None = None,
+            watch_files: bool = False,
+            delay: int = 200,
+            *args, **kwargs) -> None:
+        """Class constructor
+
+        Initialize class properties and start watching.
+
+        :param cache_path:
+            Cache file of the "DesktopFileIndex"
+        :param watch_files:
+            Also watch each desktop file for changes in place
+        :param delay:
+            Milliseconds to wait for more changes before updating, so a
+            package install updates the index once
+        """
+        super().__init__(*args, **kwargs)
+        self.__watch_files = watch_files
+        self.__paths = DesktopFileLocates().paths
+        self.__path_ulrs = {
+            path: self.__find_path_ulrs(path) for path in self.__paths}
+        self.__index = DesktopFileIndex(self.__ulrs_by_priority(), cache_path)
+        self.__changed_paths = set()
+
+        self.__update_timer = QtCore.QTimer()
+        self.__update_timer.set_single_shot(True)
+        self.__update_timer.set_interval(delay)
+        self.__update_timer.timeout.connect(self.__update_timer_signal)
+
+        self.__watcher = QtCore.QFileSystemWatcher()
+        self.__watcher.directoryChanged.connect(self.__path_changed_signal)
+        self.__watcher.fileChanged.connect(self.__path_changed_signal)
+        self.__watch()
+
+    @property
+    def index(self) -> DesktopFileIndex:
+        """The watched index"""
+        return self.__index
+
+    def refresh(self) -> dict:
+        """Scan all the directories again
+
+        Also finds "applications" directories that were created after the
+        index, that are not watched until then.
+
+        :return: The delta, also emitted by "index_changed_signal"
+        """
+        self.__paths = DesktopFileLocates().paths
+        return self.__apply_changes(self.__paths)
+
+    def __apply_changes(self, paths: list) -> dict:
+        # Scan the paths again and update the index with their files
+        changed_ulrs = []
+        for path in paths:
+            changed_ulrs += self.__path_ulrs.get(path, {}).values()
+            self.__path_ulrs[path] = self.__find_path_ulrs(path)
+            changed_ulrs += self.__path_ulrs[path].values()
+
+        for path in list(self.__path_ulrs):
+            if path not in self.__paths:
+                changed_ulrs += self.__path_ulrs.pop(path).values()
+
+        added, removed, modified = self.__index.update(
+            self.__ulrs_by_priority(), changed_ulrs)
+        self.__watch()
+
+        delta = {'added': added, 'removed': removed, 'modified': modified}
+        if added or removed or modified:
+            self.index_changed_signal.emit(delta)
+        return delta
+
+    @staticmethod
+    def __find_dirs(path: str) -> list:
+        # The dir and its subdirectories. Symlink loops are visited once
+        dirs, found_dirs, real_paths = [path], [], set()
+        while dirs:
+            dir_path = dirs.pop()
+            real_path = os.path.realpath(dir_path)
+            if real_path in real_paths:
+                continue
+            real_paths.add(real_path)
+            found_dirs.append(dir_path)
+            try:
+                with os.scandir(dir_path) as entries:
+                    dirs += [
+                        entry.path for entry in entries
+                        if '~' not in entry.name and entry.is_dir()]
+            except OSError as err:
+                logging.error(err)
+        return found_dirs
+
+    @staticmethod
+    def __find_path_ulrs(path: str) -> dict:
+        # {desktop file ID: url} of one "applications" directory
+        if not os.path.isdir(path):
+            return {}
+        return dict(DesktopFileLocates([path]).iter_ulrs_by_priority())
+
+    def __path_changed_signal(self, path: str) -> None:
+        # A watched dir or file changed. The changes are applied after a
+        # delay, to the "applications" dir that contains the path
+        for applications_path in self.__paths:
+            if path == applications_path or path.startswith(
+                    applications_path + os.sep):
+                self.__changed_paths.add(applications_path)
+        self.__update_timer.start()
+
+    def __ulrs_by_priority(self) -> list:
+        # First url of each desktop file ID, in the order of the paths
+        seen_ids = set()
+        ulrs = []
+        for path in self.__paths:
+            for desktop_file_id, url in self.__path_ulrs[path].items():
+                if desktop_file_id not in seen_ids:
+                    seen_ids.add(desktop_file_id)
+                    ulrs.append(url)
+        return ulrs
+
+    def __update_timer_signal(self) -> None:
+        # ...
+        paths = [x for x in self.__paths if x in self.__changed_paths]
+        self.__changed_paths.clear()
+        self.__apply_changes(paths)
+
+    def __watch(self) -> None:
+        # Watch the current dirs, and files if enabled. Removed and
+        # replaced paths are dropped by the watcher, so they are added again
+        watched = set()
+        for path in self.__paths:
+            if os.path.isdir(path):
+                watched.update(self.__find_dirs(path))
+        if self.__watch_files:
+            watched.update(x.url for x in self.__index.desktop_files)
+
+        current = set(self.__watcher.directories() + self.__watcher.files())
+        if watched - current:
+            self.__watcher.add_paths(sorted(watched - current))
+        if current - watched:
+            self.__watcher.remove_paths(sorted(current - watched))
+
+
+def iter_load_all(
+        urls: list | None = None,
+        chunk_size: int = 32,
+        max_workers: int | None = None,
+        use_processes: bool = False):
+    """Iterate over desktop files as soon as they are parsed
+
+    The files are parsed in chunks by a pool of workers, and each chunk is
+    yielded when it is done, so the first results can be shown while the
+    rest are loading. Files that can not be read are skipped.
+
+    >>> for url, desktop_file in iter_load_all():
+    ...     print(desktop_file.sort_key)
+
+    :param urls:
+        Desktop file urls. Default is the "ulrs_by_priority" of a new
+        "DesktopFileLocates"
+    :param chunk_size:
+        Number of files parsed by each task. A single chunk is parsed in the
+        calling thread, without a pool
+    :param max_workers:
+        Number of workers, default is the one of "concurrent.futures"
+    :param use_processes:
+        Parse in a process pool instead of a thread pool. The parsing is
+        Python code that holds the GIL, so threads mostly overlap the file
+        reads. Processes use all the cores, but each chunk is copied
+        between processes
+    :return:
+        Generator of tuples like: ('/path/file.desktop', DesktopFile)
+    """
+    if urls is None:
+        urls = DesktopFileLocates().ulrs_by_priority
+    urls = list(urls)
+    chunks = [
+        urls[index:index + chunk_size]
+        for index in range(0, len(urls), chunk_size)]
+
+    if len(chunks) <= 1:
+        for chunk in chunks:
+            for url, content in _load_chunk(chunk):
+                yield url, DesktopFile(url, content)
+        return
+
+    executor = (
+        concurrent.futures.ProcessPoolExecutor(max_workers=max_workers)
+        if use_processes else
+        concurrent.futures.ThreadPoolExecutor(max_workers=max_workers))
+    try:
+        futures = [executor.submit(_load_chunk, chunk) for chunk in chunks]
+        for future in concurrent.futures.as_completed(futures):
+            for url, content in future.result():
+                yield url, DesktopFile(url, content)
+    finally:
+        # Also when the caller stops iterating early
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def load_all(
+        urls: list | None = None,
+        chunk_size: int = 32,
+        max_workers: int | None = None,
+        use_processes: bool = False) -> dict:
+    """Parse desktop files in parallel
+
+    Same as "iter_load_all", but waits for all the files.
+
+    :return:
+        Dict like: {'/path/file.desktop': DesktopFile}, in the order of
+        the urls
+    """
+    if urls is None:
+        urls = DesktopFileLocates().ulrs_by_priority
+    urls = list(urls)
+    desktop_files = dict(
+        iter_load_all(urls, chunk_size, max_workers, use_processes))
+    return {url: desktop_files[url] for url in urls if url in desktop_files}
+
+
+def _load_chunk(urls: list) -> list:
+    # Content of each url, runs in a worker. It is a module function, so a
+    # process pool can pickle it
+    contents = []
+    for url in urls:
+        try:
+            contents.append((url, DesktopFile(url).content))
+        except OSError as err:
+            logging.error(err)
+    return contents
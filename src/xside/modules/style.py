@@ -1,99 +1,334 @@
 #!/usr/bin/env python3
-import logging
+import dataclasses
 import os
 import pathlib
 import re
-import sys
+import string
+import weakref
 
-from PySide6 import QtGui, QtWidgets
+from PySide6 import QtWidgets
 from __feature__ import snake_case
 
-import xside.modules.color as color
+import xside.modules.desktopstyles as desktopstyles
 import xside.modules.env as env
 
 
+with open(os.path.join(
+        pathlib.Path(__file__).resolve().parent,
+        'static', 'style.qss'), 'r') as style_qss_file:
+    STATIC_STYLE = style_qss_file.read()
+
+CSD_WINDOW_TEMPLATE = string.Template(
+    'MainWindow {'
+    'background-color: $window_background_color;'
+    'border: ${window_border}px solid $window_border_color;'
+    'border-top-left-radius: $window_border_top_left_radius;'
+    'border-top-right-radius: $window_border_top_right_radius;'
+    'border-bottom-right-radius: $window_border_bottom_right_radius;'
+    'border-bottom-left-radius: $window_border_bottom_left_radius;'
+    'margin: $window_margin;'
+    '}')
+
+SSD_WINDOW_TEMPLATE = string.Template(
+    'MainWindow {'
+    'background-color: $window_background_color;'
+    '}')
+
+WIDGETS_TEMPLATE = string.Template(
+    'ContextMenu {'
+    'margin: $contextmenu_margin;'
+    'padding: $contextmenu_padding;'
+    'background-color: $contextmenu_background_color;'
+    'border: 1px solid $contextmenu_border_color;'
+    'border-radius: ${contextmenu_border_radius}px;'
+    '}'
+    'ContextMenuSeparator {'
+    'margin: $contextmenu_separator_margin;'
+    '}'
+    'ContextMenuSeparatorLine {'
+    'color: $contextmenu_separator_color;'
+    '}'
+    'ContextMenuButton {'
+    'background: transparent;'
+    'padding: $contextmenubutton_padding;'
+    'border: 1px solid rgba(0, 0, 0, 0.0);'
+    'border-radius: ${contextmenubutton_border_radius}px;'
+    '}'
+    'ContextMenuButton:hover {'
+    'color: $contextmenubutton_label_hover_color;'
+    'background-color: $contextmenubutton_background_hover_color;'
+    'border: 1px solid $contextmenubutton_border_hover_color;'
+    '}'
+    'ContextMenuButtonLabel:hover {'
+    'color: $contextmenubutton_label_hover_color;'
+    '}'
+    'ContextLabel {'
+    'color: $label_context_color;'
+    '}'
+    'ContextMenuGroup {'
+    'padding: $contextmenugroup_padding;'
+    '}'
+    'ControlButtons {'
+    'margin: $controlbuttons_margin;'
+    '}'
+    'HeaderBar {'
+    'margin: $headerbar_margin;'
+    '}'
+    'WindowIcon {'
+    'margin: $window_icon_margin;'
+    '}')
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class StyleSelector(object):
+    """A single selector of a style rule
+
+    'ContextMenuButtonLabel:hover' has 'ContextMenuButtonLabel' as widget and
+    ('hover',) as pseudo states. The widget is the type name, or the object
+    name for selectors like '#ContextMenu'. Selectors with descendant or
+    child combinators are marked as compound.
+    """
+    text: str
+    widget: str | None
+    pseudo_states: tuple
+    subcontrol: str | None
+    is_compound: bool
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class StyleRule(object):
+    """A style rule: selectors and the declarations they share
+
+    The declarations are a tuple of (property, value) pairs in the order they
+    appear in the style sheet.
+    """
+    selectors: tuple
+    declarations: tuple
+
+
 class StyleParser(object):
-    """..."""
+    """Qt style sheet parser
+
+    Parses the style sheet in a single pass into a list of 'StyleRule'. The
+    rule declarations are merged per selector and indexed by widget and
+    pseudo state, so 'widget_scope' is a dict lookup. New style fragments
+    can be merged without parsing the whole style sheet again.
+    """
     def __init__(self, style_sheet: str) -> None:
         """..."""
-        self.__stylesheet_arg = style_sheet
-        self.__scopes = self.__split_widgets_scops()
-        self.__stylesheet = None
+        self.set_style_sheet(style_sheet)
+
+    def rules(self) -> list:
+        """List of the effective 'StyleRule', one for each selector
+
+        In the order the selectors first appear, with the merged declarations.
+        """
+        return [
+            StyleRule((self.__selectors[key],), tuple(declarations.items()))
+            for key, declarations in self.__declarations.items()]
+
+    def merge(self, style_sheet: str) -> None:
+        """Merge a style fragment into the current style sheet
+
+        Only the fragment is parsed. The selectors it touches are updated in
+        place, as if the fragment had been appended to the style sheet.
+
+        :param style_sheet: string containing 'qss' style
+        """
+        for rule in self.__parse_rules(style_sheet):
+            self.__add_rule(rule)
 
     def scopes(self) -> dict:
-        """..."""
+        """Declarations of each selector, like: {'HeaderBar': 'a: b;'}"""
+        for key in self.__dirty_scopes:
+            self.__scopes[key] = self.__declarations_to_str(
+                self.__declarations[key])
+        self.__dirty_scopes.clear()
         return self.__scopes
 
     def set_style_sheet(self, style_sheet: str) -> None:
         """..."""
-        self.__stylesheet_arg = style_sheet
-        self.__scopes = self.__split_widgets_scops()
+        self.__selectors = {}
+        self.__declarations = {}
+        self.__index = {}
+        self.__scopes = {}
+        self.__dirty_scopes = set()
         self.__stylesheet = None
+        self.merge(style_sheet)
 
     def style_sheet(self, update: bool = False) -> str:
         """..."""
-        if not self.__stylesheet or update:
-            self.__stylesheet = ''
-            for scope_key, scope_value in self.__scopes.items():
-                self.__stylesheet += scope_key + ' {' + scope_value + '} '
+        if self.__stylesheet is None or self.__dirty_scopes or update:
+            self.__stylesheet = ''.join(
+                f'{key} {{{value}}} ' for key, value in self.scopes().items())
         return self.__stylesheet
 
     def widget_scope(
             self, widget_class_name: str, propertie: str = None) -> str:
-        """..."""
-        for scope_key, scope_value in self.__scopes.items():
-            if not propertie:
-                if widget_class_name == scope_key:
-                    return scope_value
-            else:
-                if widget_class_name in scope_key and propertie in scope_key:
-                    return scope_value
-        return ''
-
-    def __split_widgets_scops(self) -> dict:
-        # ...
-        cleanstyle = re.sub(r'(/\*.+\*/)|(^#.+$)', r'', self.__stylesheet_arg)
-
-        scopes = {}
-        all_scopes = cleanstyle.replace('\n', '').replace('  ', ' ').split('}')
-        for scope in all_scopes:
-            if '{' in scope:
-                scope_keys, scope_value = scope.split('{')
-
-                for scope_key in scope_keys.split(','):
-                    scope_key = self.__clean_key(scope_key)
-                    if scope_key and scope_key in scopes:
-                        scope_value = self.__join_duplicate_values(
-                            scope_value, scopes[scope_key])
-
-                    scopes[scope_key] = self.__clean_value(scope_value)
-        return scopes
-
-    def __join_duplicate_values(self, new_value: str, old: str) -> str:
-        # ...
-        new_values = [self.__clean_value(x) for x in new_value.split(';') if x]
-        old_values = [self.__clean_value(x) for x in old.split(';') if x]
-        new_keys = [self.__clean_key(self.__clean_value(x).split(':')[0])
-                    for x in new_value.split(';') if x]
-
-        for old_value in old_values:
-            old_key = self.__clean_key(old_value.split(':')[0])
-            if old_key not in new_keys:
-                new_values.insert(0, old_value)
-
-        return ' '.join(new_values)
+        """Declarations of the widget
+
+        Only exact matches are returned: 'ContextMenuButton' does not match
+        'ContextMenuButtonLabel'.
+
+        :param widget_class_name: Class or object name, like: 'HeaderBar'
+        :param propertie: Pseudo states, like: 'hover' or 'hover:!pressed'
+        """
+        pseudo_states = tuple(propertie.split(':')) if propertie else ()
+        selectors = self.__index.get((widget_class_name, pseudo_states))
+        if not selectors:
+            return ''
+
+        scopes = self.scopes()
+        return ' '.join(scopes[selector] for selector in selectors)
+
+    def __add_rule(self, rule: StyleRule) -> None:
+        # Merge the rule declarations into each selector and index it.
+        # Redeclared properties move to the end, so the last one wins
+        for selector in rule.selectors:
+            declarations = self.__declarations.get(selector.text)
+            if declarations is None:
+                declarations = self.__declarations[selector.text] = {}
+                self.__selectors[selector.text] = selector
+                self.__scopes[selector.text] = ''
+                if (selector.widget and not selector.subcontrol and
+                        not selector.is_compound):
+                    self.__index.setdefault(
+                        (selector.widget, selector.pseudo_states), []).append(
+                        selector.text)
+
+            for propertie, value in rule.declarations:
+                declarations.pop(propertie, None)
+                declarations[propertie] = value
+            self.__dirty_scopes.add(selector.text)
 
     @staticmethod
-    def __clean_value(value: str) -> str:
-        # ...
-        return value.strip().strip(';').strip().replace(',', ', ').replace(
-            ' ;', ';').replace(';', '; ').replace('  ', ' ').strip().replace(
-            ';;', ';') + ';'
+    def __declarations_to_str(declarations: dict) -> str:
+        # {'a': 'b', 'c': 'd'} -> 'a: b; c: d;'
+        return ' '.join(
+            f'{propertie}: {value};'
+            for propertie, value in declarations.items())
+
+    def __parse_rules(self, style_sheet: str) -> list:
+        # Build the rules from the tokens
+        rules = []
+        selectors = None
+        declarations = []
+        nested_blocks = 0
+        text = ''
+        for token, value in self.__tokenize(style_sheet):
+            if nested_blocks:
+                # Qt does not support nested blocks. Skip them
+                if token == '{':
+                    nested_blocks += 1
+                elif token == '}':
+                    nested_blocks -= 1
+
+            elif token == 'text':
+                text = value
+
+            elif token == '{':
+                if selectors is None:
+                    selectors = tuple(
+                        self.__parse_selector(x.strip())
+                        for x in text.split(',') if x.strip())
+                else:
+                    nested_blocks += 1
+                text = ''
+
+            elif token == ';' or token == '}':
+                if selectors is not None and ':' in text:
+                    propertie, value = text.split(':', 1)
+                    if propertie.strip() and value.strip():
+                        declarations.append(
+                            (propertie.strip(), value.strip()))
+                text = ''
+
+                if token == '}' and selectors is not None:
+                    if selectors:
+                        rules.append(
+                            StyleRule(selectors, tuple(declarations)))
+                    selectors = None
+                    declarations = []
+        return rules
+
+    @staticmethod
+    def __parse_selector(text: str) -> StyleSelector:
+        # 'QScrollBar::handle:vertical:hover' -> widget='QScrollBar',
+        # subcontrol='handle', pseudo_states=('vertical', 'hover')
+        bare = re.sub(r'\[[^\]]*\]', '', text)
+        is_compound = ' ' in bare or '>' in bare
+        compound = re.split(r'[\s>]+', bare)[-1]
+
+        subcontrol = None
+        if '::' in compound:
+            compound, subcontrol_states = compound.split('::', 1)
+            subcontrol, *subcontrol_states = subcontrol_states.split(':')
+            widget, *pseudo_states = compound.split(':')
+            pseudo_states += subcontrol_states
+        else:
+            widget, *pseudo_states = compound.split(':')
+
+        widget = widget.lstrip('.')
+        if widget.startswith('#'):
+            widget = widget[1:]
+        elif '#' in widget:
+            widget = widget.split('#')[0]
+        if widget == '*':
+            widget = None
+
+        return StyleSelector(
+            text, widget or None, tuple(x for x in pseudo_states if x),
+            subcontrol, is_compound)
 
     @staticmethod
-    def __clean_key(value: str) -> str:
-        # ...
-        return value.lstrip('#').replace(' ', '').strip()
+    def __tokenize(style_sheet: str):
+        # Single pass. Yields ('text', str), ('{', ''), ('}', '') and
+        # (';', ''). Comments are dropped and whitespace is collapsed.
+        # Braces, semicolons and quotes inside strings or "url(...)" are text
+        text = []
+        parentheses = 0
+        index, size = 0, len(style_sheet)
+        while index < size:
+            char = style_sheet[index]
+
+            if char == '/' and style_sheet.startswith('/*', index):
+                end = style_sheet.find('*/', index + 2)
+                index = size if end < 0 else end + 2
+                continue
+
+            if char == '"' or char == "'":
+                end = index + 1
+                while end < size and style_sheet[end] != char:
+                    end += 2 if style_sheet[end] == '\\' else 1
+                text.append(style_sheet[index:end + 1])
+                index = end + 1
+                continue
+
+            if char.isspace():
+                if text and text[-1] != ' ':
+                    text.append(' ')
+                index += 1
+                continue
+
+            if char == '(':
+                parentheses += 1
+            elif char == ')' and parentheses:
+                parentheses -= 1
+            elif not parentheses and char in '{};':
+                value = ''.join(text).strip()
+                if value:
+                    yield 'text', value
+                yield char, ''
+                text = []
+                index += 1
+                continue
+
+            text.append(char)
+            index += 1
+
+        value = ''.join(text).strip()
+        if value:
+            yield 'text', value
 
     def __str__(self) -> str:
         return 'StyleParser'
@@ -102,8 +337,67 @@ class StyleParser(object):
         return 'StyleParser(object)'
 
 
+class StyleScopeNotifier(object):
+    """Notifies style changes per widget scope
+
+    Receivers are connected to a widget scope, like 'ContextMenu' or
+    ('ContextMenuButtonLabel', 'hover'). After the style sheet changes,
+    'notify' compares each connected scope with its previous value and calls
+    only the receivers of the scopes that changed, passing the new scope.
+    Bound methods are held by weak reference.
+    """
+    def __init__(self, style_parser: StyleParser) -> None:
+        """..."""
+        self.__style_parser = style_parser
+        self.__receivers = {}
+        self.__scopes = {}
+
+    def connect(
+            self, receiver: callable, widget_class_name: str,
+            propertie: str = None) -> str:
+        """Connect a receiver to a widget scope
+
+        :param receiver: Called with the new scope string when it changes
+        :param widget_class_name: Class or object name, like: 'HeaderBar'
+        :param propertie: Pseudo states, like: 'hover'
+        :return: The current scope
+        """
+        key = widget_class_name, propertie
+        if key not in self.__scopes:
+            self.__scopes[key] = self.__style_parser.widget_scope(*key)
+
+        if hasattr(receiver, '__self__'):
+            reference = weakref.WeakMethod(receiver)
+        else:
+            reference = lambda: receiver
+        self.__receivers.setdefault(key, []).append(reference)
+        return self.__scopes[key]
+
+    def disconnect(self, receiver: callable) -> None:
+        """Disconnect the receiver from all widget scopes"""
+        for key, references in self.__receivers.items():
+            self.__receivers[key] = [
+                x for x in references if x() is not None and x() != receiver]
+
+    def notify(self) -> None:
+        """Call the receivers of the scopes that changed"""
+        for key, references in list(self.__receivers.items()):
+            scope = self.__style_parser.widget_scope(*key)
+            if scope == self.__scopes[key]:
+                continue
+
+            self.__scopes[key] = scope
+            self.__receivers[key] = [x for x in references if x() is not None]
+            for reference in self.__receivers[key]:
+                receiver = reference()
+                if receiver is not None:
+                    receiver(scope)
+
+
 class Style(object):
     """..."""
+    __compiled_styles = {}
+
     def __init__(self, toplevel: QtWidgets.QMainWindow) -> None:
         """..."""
         self.__toplevel = toplevel
@@ -114,202 +408,106 @@ class Style(object):
             self.__toplevel.follow_platform())
 
     def build_style(self) -> str:
-        """..."""
-        win_bg_color = self.__env.settings().background_color()
-        win_bd_radius = self.__env.settings().window_border_radius()
-        win_bd_color = self.__env.settings().window_border_color()
-        win_margin = self.__env.settings().window_margin()
+        """The default style sheet for the current environment
 
+        The style sheet is compiled once for each environment snapshot and
+        decoration mode, then reused.
+        """
         att = hasattr(self.__toplevel, 'is_server_side_decorated')
-        if att and self.__toplevel.is_server_side_decorated():
-            style_sheet = (
-                'MainWindow {'
-                'background-color: rgba('
-                f'{win_bg_color.red()},'
-                f'{win_bg_color.green()},'
-                f'{win_bg_color.blue()},'
-                f'{win_bg_color.alpha_f()});'
-                '}')
-        else:
-            style_sheet = (
-                'MainWindow {'
-                'background-color: rgba('
-                f'{win_bg_color.red()},'
-                f'{win_bg_color.green()},'
-                f'{win_bg_color.blue()},'
-                f'{win_bg_color.alpha_f()});'
-                f'border: {self.__env.settings().window_border()}px solid'
-                ' rgba('
-                f'{win_bd_color.red()},'
-                f'{win_bd_color.green()},'
-                f'{win_bd_color.blue()},'
-                f'{win_bd_color.alpha()});'
-                f'border-top-left-radius: {win_bd_radius[0]};'
-                f'border-top-right-radius: {win_bd_radius[1]};'
-                f'border-bottom-right-radius: {win_bd_radius[2]};'
-                f'border-bottom-left-radius: {win_bd_radius[3]};'
-                'margin: '
-                f' {win_margin[0]}px'
-                f' {win_margin[1]}px'
-                f' {win_margin[2]}px'
-                f' {win_margin[3]}px;'
-                '}')
-
-        cmenu_margin = self.__env.settings().contextmenu_margin()
-        cmenu_padding = self.__env.settings().contextmenu_padding()
-        cmenu_bg_color = self.__env.settings().contextmenu_background_color()
-        cmenu_bd_color = self.__env.settings().contextmenu_border_color()
-        cmenu_bd_radius = self.__env.settings().contextmenu_border_radius()
-        style_sheet += (
-            'ContextMenu {'
-            'margin:'
-            f' {cmenu_margin[0]}px'
-            f' {cmenu_margin[1]}px'
-            f' {cmenu_margin[2]}px'
-            f' {cmenu_margin[3]}px;'
-            'padding:'
-            f' {cmenu_padding[0]}px'
-            f' {cmenu_padding[1]}px'
-            f' {cmenu_padding[2]}px'
-            f' {cmenu_padding[3]}px;'
-            'background-color: rgba('
-            f' {cmenu_bg_color.red()},'
-            f' {cmenu_bg_color.green()},'
-            f' {cmenu_bg_color.blue()},'
-            f' {cmenu_bg_color.alpha()});'
-            'border: 1px solid rgba('
-            f' {cmenu_bd_color.red()},'
-            f' {cmenu_bd_color.green()},'
-            f' {cmenu_bd_color.blue()},'
-            f' {cmenu_bd_color.alpha_f()});'
-            f'border-radius: {cmenu_bd_radius}px;'
-            '}')
-
-        cmenusep_margin = self.__env.settings().contextmenu_separator_margin()
-        cmenusep_color = self.__env.settings().contextmenu_separator_color()
-        style_sheet += (
-            'ContextMenuSeparator {'
-            'margin:'
-            f' {cmenusep_margin[0]}px'
-            f' {cmenusep_margin[1]}px'
-            f' {cmenusep_margin[2]}px'
-            f' {cmenusep_margin[3]}px;'
-            '}'
-            'ContextMenuSeparatorLine {'
-            'color: rgba('
-            f' {cmenusep_color.red()},'
-            f' {cmenusep_color.green()},'
-            f' {cmenusep_color.blue()},'
-            f' {cmenusep_color.alpha()});'
-            '}')
-
-        cmenubtn_bdr = self.__env.settings().contextmenubutton_border_radius()
-        cmenubtn_pd = self.__env.settings().contextmenubutton_padding()
-        cmenubtn_bg_hover_color = self.__env.settings(
-            ).contextmenubutton_background_hover_color()
-        cmenubtn_bd_hover_color = self.__env.settings(
-            ).contextmenubutton_border_hover_color()
-        cmenubtn_lbl_hover_color = self.__env.settings(
-            ).contextmenubutton_label_hover_color()
-        style_sheet += (
-            'ContextMenuButton {'
-            'background: transparent;'
-            'padding:'
-            f' {cmenubtn_pd[0]}px'
-            f' {cmenubtn_pd[1]}px'
-            f' {cmenubtn_pd[2]}px'
-            f' {cmenubtn_pd[3]}px;'
-            'border: 1px solid rgba(0, 0, 0, 0.0);'
-            f'border-radius: {cmenubtn_bdr}px;'
-            '}'
-            'ContextMenuButton:hover {'
-            'color: rgba('
-            f' {cmenubtn_lbl_hover_color.red()},'
-            f' {cmenubtn_lbl_hover_color.green()},'
-            f' {cmenubtn_lbl_hover_color.blue()},'
-            f' {cmenubtn_lbl_hover_color.alpha()});'
-            'background-color: rgba('
-            f' {cmenubtn_bg_hover_color.red()},'
-            f' {cmenubtn_bg_hover_color.green()},'
-            f' {cmenubtn_bg_hover_color.blue()},'
-            f' {cmenubtn_bg_hover_color.alpha()});'
-            'border: 1px solid rgba('
-            f' {cmenubtn_bd_hover_color.red()},'
-            f' {cmenubtn_bd_hover_color.green()},'
-            f' {cmenubtn_bd_hover_color.blue()},'
-            f' {cmenubtn_bd_hover_color.alpha()});'
-            '}'
-            'ContextMenuButtonLabel:hover {'
-            'color: rgba('
-            f' {cmenubtn_lbl_hover_color.red()},'
-            f' {cmenubtn_lbl_hover_color.green()},'
-            f' {cmenubtn_lbl_hover_color.blue()},'
-            f' {cmenubtn_lbl_hover_color.alpha()});'
-            '}')
-
-        lbl_ctx_color = self.__env.settings().label_context_color()
-        style_sheet += (
-            'ContextLabel {'
-            'color: rgba('
-            f' {lbl_ctx_color.red()},'
-            f' {lbl_ctx_color.green()},'
-            f' {lbl_ctx_color.blue()},'
-            f' {lbl_ctx_color.alpha()});'
-            '}')
-
-        contextmenugroup_pd = self.__env.settings().contextmenugroup_padding()
-        style_sheet += (
-            'ContextMenuGroup {'
-            'padding:'
-            f' {contextmenugroup_pd[0]}px'
-            f' {contextmenugroup_pd[1]}px'
-            f' {contextmenugroup_pd[2]}px'
-            f' {contextmenugroup_pd[3]}px;'
-            '}')
-
-        controlbutton_margin = self.__env.settings().controlbuttons_margin()
-        style_sheet += (
-            'ControlButtons {'
-            f'margin:'
-            f' {controlbutton_margin[0]}px'
-            f' {controlbutton_margin[1]}px'
-            f' {controlbutton_margin[2]}px'
-            f' {controlbutton_margin[3]}px;'
-            '}')
-
-        headerbar_margin = self.__env.settings().headerbar_margin()
-        style_sheet += (
-            'HeaderBar {'
-            f'margin:'
-            f' {headerbar_margin[0]}px'
-            f' {headerbar_margin[1]}px'
-            f' {headerbar_margin[2]}px'
-            f' {headerbar_margin[3]}px;'
-            '}')
-
-        win_icon_margin = self.__env.settings().window_icon_margin()
-        style_sheet += (
-            'WindowIcon {'
-            f'margin:'
-            f' {win_icon_margin[0]}px'
-            f' {win_icon_margin[1]}px'
-            f' {win_icon_margin[2]}px'
-            f' {win_icon_margin[3]}px;'
-            '}')
-
-        with open(os.path.join(
-                pathlib.Path(__file__).resolve().parent,
-                'static', 'style.qss'), 'r') as style_qss_file:
-            file_style = style_qss_file.read()
-
-        return style_sheet + file_style
+        server_side_decorated = bool(
+            att and self.__toplevel.is_server_side_decorated())
+
+        key = self.__env.settings().snapshot(), server_side_decorated
+        if key not in Style.__compiled_styles:
+            Style.__compiled_styles[key] = self.__compile_style(*key)
+        return Style.__compiled_styles[key]
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Discard all compiled style sheets"""
+        Style.__compiled_styles.clear()
 
     @staticmethod
-    def fullscreen_adapted_style(style: str) -> str:
-        # ...
-        styleparser = StyleParser(style)
+    def fullscreen_adapted_style(style: str | StyleParser) -> str:
+        """The style sheet adapted to maximized and full screen
+
+        :param style: String containing 'qss' style, or its 'StyleParser'.
+            A parser is used as it is, without parsing the style again
+        """
+        if isinstance(style, StyleParser):
+            style_parser, style = style, style.style_sheet()
+        else:
+            style_parser = StyleParser(style)
+
         return style + (
             'MainWindow {'
-            f'{styleparser.widget_scope("MainWindow")}'
+            f'{style_parser.widget_scope("MainWindow")}'
             'border-radius: 0px;'
             'border: 0px;}')
+
+    @staticmethod
+    def __compile_style(
+            settings: desktopstyles.EnvStyleSnapshot,
+            server_side_decorated: bool) -> str:
+        # Fill the templates slots with the snapshot values
+        rgba, rgba_f, box = Style.__rgba, Style.__rgba_f, Style.__box
+        win_bd_radius = settings.window_border_radius
+
+        if server_side_decorated:
+            style_sheet = SSD_WINDOW_TEMPLATE.substitute(
+                window_background_color=rgba_f(
+                    settings.window_background_color))
+        else:
+            style_sheet = CSD_WINDOW_TEMPLATE.substitute(
+                window_background_color=rgba_f(
+                    settings.window_background_color),
+                window_border=settings.window_border,
+                window_border_color=rgba(settings.window_border_color),
+                window_border_top_left_radius=win_bd_radius[0],
+                window_border_top_right_radius=win_bd_radius[1],
+                window_border_bottom_right_radius=win_bd_radius[2],
+                window_border_bottom_left_radius=win_bd_radius[3],
+                window_margin=box(settings.window_margin))
+
+        style_sheet += WIDGETS_TEMPLATE.substitute(
+            contextmenu_margin=box(settings.contextmenu_margin),
+            contextmenu_padding=box(settings.contextmenu_padding),
+            contextmenu_background_color=rgba(
+                settings.contextmenu_background_color),
+            contextmenu_border_color=rgba_f(settings.contextmenu_border_color),
+            contextmenu_border_radius=settings.contextmenu_border_radius,
+            contextmenu_separator_margin=box(
+                settings.contextmenu_separator_margin),
+            contextmenu_separator_color=rgba(
+                settings.contextmenu_separator_color),
+            contextmenubutton_padding=box(settings.contextmenubutton_padding),
+            contextmenubutton_border_radius=(
+                settings.contextmenubutton_border_radius),
+            contextmenubutton_label_hover_color=rgba(
+                settings.contextmenubutton_label_hover_color),
+            contextmenubutton_background_hover_color=rgba(
+                settings.contextmenubutton_background_hover_color),
+            contextmenubutton_border_hover_color=rgba(
+                settings.contextmenubutton_border_hover_color),
+            label_context_color=rgba(settings.label_context_color),
+            contextmenugroup_padding=box(settings.contextmenugroup_padding),
+            controlbuttons_margin=box(settings.controlbuttons_margin),
+            headerbar_margin=box(settings.headerbar_margin),
+            window_icon_margin=box(settings.window_icon_margin))
+
+        return style_sheet + STATIC_STYLE
+
+    @staticmethod
+    def __box(values: tuple) -> str:
+        # (1, 2, 3, 4) -> "1px 2px 3px 4px"
+        return ' '.join(f'{value}px' for value in values)
+
+    @staticmethod
+    def __rgba(rgba: tuple) -> str:
+        # (255, 255, 255, 255) -> "rgba(255, 255, 255, 255)"
+        return f'rgba({rgba[0]}, {rgba[1]}, {rgba[2]}, {rgba[3]})'
+
+    @staticmethod
+    def __rgba_f(rgba: tuple) -> str:
+        # (255, 255, 255, 255) -> "rgba(255, 255, 255, 1.0)"
+        return f'rgba({rgba[0]}, {rgba[1]}, {rgba[2]}, {rgba[3] / 255})'
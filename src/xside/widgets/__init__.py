@@ -1,5 +1,6 @@
 from .applicationwindow import ApplicationWindow
 from .applicationwindowsideview import ApplicationWindowSideView
+from .connections import UniqueConnections
 from .contextmenu import ContextMenu
 from .controlbutton import ControlButton
 from .controlbuttons import ControlButtons
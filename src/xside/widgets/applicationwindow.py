@@ -5,7 +5,7 @@ from __feature__ import snake_case
 from xside.modules import color
 from xside.modules.env import GuiEnv
 from xside.modules.platform import Platform
-from xside.modules.style import Style, StyleParser
+from xside.modules.style import Style, StyleParser, StyleScopeNotifier
 from xside.widgets.core import BaseWindow
 
 
@@ -51,6 +51,12 @@ class ApplicationWindow(BaseWindow):
             QtGui.QPalette().color(QtGui.QPalette.Window).to_tuple())
 
         self.__timer = QtCore.QTimer()
+        self.__timer.set_single_shot(True)
+        self.__timer.timeout.connect(self.__hide_shadow_on_condition)
+
+        # Style applied to the central widget
+        self.__applied_style_sheet = None
+        self.__restyle_count = {'applied': 0, 'skipped': 0}
 
         # Style
         self.__dynamic_style = Style(self)
@@ -58,16 +64,37 @@ class ApplicationWindow(BaseWindow):
 
         self.__style_parser = StyleParser(self.__style_sheet)
         self.__style_sheet = self.__style_parser.style_sheet()
+        self.__style_notifier = StyleScopeNotifier(self.__style_parser)
 
         self.__style_sheet_fullscreen = (
             self.__dynamic_style.fullscreen_adapted_style(
-                self.__style_sheet))
+                self.__style_parser))
 
         self.__set_window_decoration()
 
         # Events
         self.install_event_filter(self)
 
+    def connect_style_scope(
+            self, receiver: callable, widget_class_name: str,
+            propertie: str = None) -> str:
+        """Connect a receiver to changes of a widget style scope
+
+        The receiver is called with the new scope only when the style of
+        that widget changes, after 'set_style_sheet' or 'reset_style'.
+
+        :param receiver: Called with the new scope string, like: 'a: b;'
+        :param widget_class_name: Class or object name, like: 'ContextMenu'
+        :param propertie: Pseudo states, like: 'hover'
+        :return: The current scope
+        """
+        return self.__style_notifier.connect(
+            receiver, widget_class_name, propertie)
+
+    def disconnect_style_scope(self, receiver: callable) -> None:
+        """Disconnect the receiver from all widget style scopes"""
+        self.__style_notifier.disconnect(receiver)
+
     def follow_platform(self) -> bool:
         """..."""
         return self.__follow_platform
@@ -89,13 +116,21 @@ class ApplicationWindow(BaseWindow):
         self.__reset_style_properties()
 
         if self.is_maximized() or self.is_full_screen():
-            self.central_widget().set_style_sheet(
-                self.__style_sheet_fullscreen)
+            self.__apply_style_sheet(self.__style_sheet_fullscreen)
         else:
-            self.central_widget().set_style_sheet(self.__style_sheet)
+            self.__apply_style_sheet(self.__style_sheet)
 
+        self.__style_notifier.notify()
         self.reset_style_signal.emit(0)
 
+    def restyle_count(self) -> dict:
+        """Count of applied and skipped central widget restyles
+
+        A restyle is skipped when the style sheet is already applied, like:
+        {'applied': 3, 'skipped': 120}
+        """
+        return dict(self.__restyle_count)
+
     def set_style_sheet(self, style: str) -> None:
         """Set the application style sheet
 
@@ -104,22 +139,22 @@ class ApplicationWindow(BaseWindow):
 
         :param style: string containing 'qss' style
         """
-        self.__style_parser.set_style_sheet(self.__style_sheet + style)
+        self.__style_parser.merge(style)
         self.__style_sheet = self.__style_parser.style_sheet()
 
         self.__style_sheet_fullscreen = (
             self.__dynamic_style.fullscreen_adapted_style(
-                self.__style_sheet))
+                self.__style_parser))
 
         if self.__is_server_side_decorated:
             self.__style_sheet = self.__style_sheet_fullscreen
 
         if self.is_maximized() or self.is_full_screen():
-            self.central_widget().set_style_sheet(
-                self.__style_sheet_fullscreen)
+            self.__apply_style_sheet(self.__style_sheet_fullscreen)
         else:
-            self.central_widget().set_style_sheet(self.__style_sheet)
+            self.__apply_style_sheet(self.__style_sheet)
 
+        self.__style_notifier.notify()
         self.set_style_signal.emit(0)
 
     def shadow_size(self) -> int:
@@ -133,11 +168,24 @@ class ApplicationWindow(BaseWindow):
         """
         return self.__style_sheet
 
+    def __apply_style_sheet(self, style_sheet: str) -> None:
+        # Qt re-parses and re-polishes the whole widget tree on every
+        # 'set_style_sheet' call, so skip it when nothing has changed
+        if style_sheet == self.__applied_style_sheet:
+            self.__restyle_count['skipped'] += 1
+            return
+
+        self.central_widget().set_style_sheet(style_sheet)
+        self.__applied_style_sheet = style_sheet
+        self.__restyle_count['applied'] += 1
+
     def __reset_style_properties(self) -> None:
         # ...
-        self.__style_sheet = self.__dynamic_style.build_style()
+        self.__style_parser.set_style_sheet(self.__dynamic_style.build_style())
+        self.__style_sheet = self.__style_parser.style_sheet()
         self.__style_sheet_fullscreen = (
-            self.__dynamic_style.fullscreen_adapted_style(self.__style_sheet))
+            self.__dynamic_style.fullscreen_adapted_style(
+                self.__style_parser))
 
     def __set_window_decoration(self) -> None:
         self.set_attribute(QtCore.Qt.WA_TranslucentBackground)
@@ -260,7 +308,7 @@ class ApplicationWindow(BaseWindow):
         self.event_filter_signal.emit(event)
 
         if self.__is_server_side_decorated:
-            self.central_widget().set_style_sheet(self.__style_sheet)
+            self.__apply_style_sheet(self.__style_sheet)
             if event.type() == QtCore.QEvent.Resize:
                 self.resize_event_signal.emit(event)
         else:
@@ -269,7 +317,6 @@ class ApplicationWindow(BaseWindow):
                 self.__update_cursor_shape()
 
             elif event.type() == QtCore.QEvent.Type.HoverEnter:
-                self.__timer.timeout.connect(self.__hide_shadow_on_condition)
                 self.__timer.start(100)
 
             elif event.type() == QtCore.QEvent.MouseButtonPress:
@@ -285,12 +332,12 @@ class ApplicationWindow(BaseWindow):
                 self.resize_event_signal.emit(0)
 
                 if self.is_maximized() or self.is_full_screen():
-                    self.central_widget().set_style_sheet(
+                    self.__apply_style_sheet(
                         self.__style_sheet_fullscreen)
 
                     self.__window_shadow_visible(False)
                 else:
-                    self.central_widget().set_style_sheet(self.__style_sheet)
+                    self.__apply_style_sheet(self.__style_sheet)
 
                     if not self.__is_server_side_decorated:
                         self.__window_shadow_visible(True)
@@ -4,14 +4,13 @@ import os
 import pathlib
 import sys
 
-from PIL import Image
 from PySide6 import QtCore, QtGui, QtWidgets
 from __feature__ import snake_case
 
 from xside.modules import color
 from xside.modules.env import GuiEnv
-from xside.modules.style import StyleParser
 from xside.widgets.applicationwindow import ApplicationWindow
+from xside.widgets.core import BackgroundImageFrame
 from xside.widgets.headerbar import HeaderBar
 
 
@@ -29,7 +28,8 @@ class OverlaySideView(QtWidgets.QFrame):
         # Properties
         self.__sideview_widget_box = self.__sideview_widget.parent().layout()
         self.__toplevel = self.__sideview_widget.parent().window()
-        self.__style_parser = StyleParser(self.__toplevel.style_sheet())
+        self.__mainwindow_scope = self.__toplevel.connect_style_scope(
+            self.__set_mainwindow_scope_signal, 'MainWindow')
 
         # Anim
         self.anim_open = QtCore.QPropertyAnimation(self, b"size")
@@ -38,6 +38,8 @@ class OverlaySideView(QtWidgets.QFrame):
         self.anim_close_group = QtCore.QSequentialAnimationGroup()
 
         self.__close_timer = QtCore.QTimer()
+        self.__close_timer.set_single_shot(True)
+        self.__close_timer.timeout.connect(self.__close)
 
         # Main layout
         self.__main_box = QtWidgets.QHBoxLayout()
@@ -46,7 +48,7 @@ class OverlaySideView(QtWidgets.QFrame):
         self.set_layout(self.__main_box)
 
         # Side view
-        self.__sideview_background = QtWidgets.QWidget()
+        self.__sideview_background = BackgroundImageFrame()
         self.__sideview_background.set_fixed_width(
             self.__sideview_widget.width())
         self.__sideview_background.set_contents_margins(0, 0, 0, 0)
@@ -97,7 +99,6 @@ class OverlaySideView(QtWidgets.QFrame):
         self.anim_close_group.add_animation(self.anim_close)
         self.anim_close_group.start()
 
-        self.__close_timer.timeout.connect(self.__close)
         self.__close_timer.start(100)
 
     def __close(self):
@@ -133,27 +134,21 @@ class OverlaySideView(QtWidgets.QFrame):
 
     def __update_style(self) -> None:
         # ...
-        self.__style_parser.set_style_sheet(self.__toplevel.style_sheet())
-        base_style = self.__style_parser.widget_scope('MainWindow')
-
-        url = None
-        for x in base_style.split(';'):
-            if x.replace(' ', '').startswith('background:url('):
-                url = x.strip().split('(')[1].split(')')[0]
-            if url:
-                break
-        if url:
-            sideview_texture = Image.open(url)
-            sideview_texture.putalpha(245)
-            url = url.replace('.png', 'sideview.png')
-            sideview_texture.save(url)
-
-        background = f'background: url({url});'
+        base_style = self.__mainwindow_scope
+
+        # The window texture, if any, without the right corners
+        mainwindow = self.__toplevel.central_widget()
+        radii = mainwindow.background_radii()
+        self.__sideview_background.set_background_image(
+            mainwindow.background_image(),
+            (radii[0], 0, 0, radii[3]),
+            mainwindow.background_margins(), 245 / 255,
+            mainwindow.background_overlay())
+
         self.__sideview_background.set_style_sheet(
             f'{self.__toplevel.style_sheet()}'
             '#__sideviewbgstyle {'
             f'{base_style}'
-            f'{background}'
             'border-right: 0px; '
             'border-top-right-radius: 0;'
             'border-bottom-right-radius: 0;'
@@ -178,6 +173,10 @@ class OverlaySideView(QtWidgets.QFrame):
             'border-top-left-radius: 0;'
             'border-bottom-left-radius: 0;}')
 
+    def __set_mainwindow_scope_signal(self, scope: str) -> None:
+        # ...
+        self.__mainwindow_scope = scope
+
     def __resize_sig(self) -> None:
         self.resize(self.__toplevel.width(), self.__toplevel.height())
 
@@ -218,8 +217,8 @@ class ApplicationWindowSideView(ApplicationWindow):
         self.__is_sideview_headerbar_left_control_set_as_visible = True
         self.__is_sideview_close_button_set_as_visible = False
         self.__sideview_width = 250
-        self.__sideview_color = self.__gui_env.settings(
-            ).background_darker_color().to_tuple()
+        self.__sideview_color = self.__gui_env.settings().snapshot(
+            ).window_background_darker_color
 
         # Settings
         self.set_window_title('MPX Application Window')
@@ -273,6 +272,8 @@ class ApplicationWindowSideView(ApplicationWindow):
         self.__sideview_box.set_contents_margins(
             self.__border_size, 0, self.__border_size, self.__border_size)
         self.__sideview_main_box.add_layout(self.__sideview_box)
+        self.__mainwindow_scope = self.connect_style_scope(
+            self.__set_mainwindow_scope_signal, 'MainWindow')
         self.__color_sideview()
 
         # Frame view
@@ -305,8 +306,6 @@ class ApplicationWindowSideView(ApplicationWindow):
 
         # Signals
         self.resize_event_signal.connect(self.__resize_event)
-        self.set_style_signal.connect(lambda _: self.__color_sideview())
-        self.reset_style_signal.connect(lambda _: self.__color_sideview())
 
     def close_sideview(self) -> None:
         """..."""
@@ -392,8 +391,8 @@ class ApplicationWindowSideView(ApplicationWindow):
     def set_sideview_color(self, rgba_color: tuple | None) -> None:
         """..."""
         if not rgba_color:
-            self.__sideview_color = self.__gui_env.settings(
-                ).background_darker_color().to_tuple()
+            self.__sideview_color = self.__gui_env.settings().snapshot(
+                ).window_background_darker_color
         else:
             self.__sideview_color = rgba_color
 
@@ -421,10 +420,9 @@ class ApplicationWindowSideView(ApplicationWindow):
 
     def __color_sideview(self) -> None:
         """..."""
-        basestyle = StyleParser(self.style_sheet()).widget_scope('MainWindow')
         sideview_style_sheet = (
             '#__panelwidthstyle {'
-            f'{basestyle}'
+            f'{self.__mainwindow_scope}'
             'background: url();'
             'background-color: rgba('
             f'{self.__sideview_color[0]}, {self.__sideview_color[1]}, '
@@ -447,7 +445,8 @@ class ApplicationWindowSideView(ApplicationWindow):
 
     def __fullscreen_maximized_and_windowed_modes_adjusts(self) -> None:
         if self.is_maximized():
-            if self.__gui_env.settings().desktop_is_using_global_menu():
+            if (self.__gui_env.settings().snapshot()
+                    .desktop_is_using_global_menu):
                 self.__sideview_headerbar.set_left_control_buttons_visible(
                     False)
                 self.__color_sideview()
@@ -470,6 +469,11 @@ class ApplicationWindowSideView(ApplicationWindow):
                         True)
             self.__color_sideview()
 
+    def __set_mainwindow_scope_signal(self, scope: str) -> None:
+        # ...
+        self.__mainwindow_scope = scope
+        self.__color_sideview()
+
     def __initial_width(self) -> int:
         if self.screen().size().width() < self.__sideview_width < 500:
             return self.__minimum_width
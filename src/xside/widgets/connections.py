@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+from PySide6 import QtCore
+from __feature__ import snake_case
+
+
+class UniqueConnections(object):
+    """Named signal connections
+
+    Each name holds at most one connection. Connecting a name again replaces
+    the previous connection instead of adding another receiver, so a slot
+    that is connected from an event handler is not called once per event.
+
+    connections = UniqueConnections()
+    connections.connect('clicked', button.clicked, on_maximize)
+    connections.connect('clicked', button.clicked, on_restore)  # Replaces
+    """
+    def __init__(self) -> None:
+        """..."""
+        self.__connections = {}
+
+    def connect(
+            self, name: str, signal: QtCore.SignalInstance,
+            slot: callable) -> None:
+        """Connect the slot, replacing the connection with the same name
+
+        :param name: Connection name, like: 'clicked'
+        :param signal: The signal, like: button.clicked
+        :param slot: The callable to connect
+        """
+        self.disconnect(name)
+        self.__connections[name] = signal.connect(slot)
+
+    def disconnect(self, name: str) -> None:
+        """Disconnect the connection with this name, if any"""
+        connection = self.__connections.pop(name, None)
+        if connection is not None:
+            QtCore.QObject.disconnect(connection)
+
+    def disconnect_all(self) -> None:
+        """Disconnect all connections"""
+        for name in list(self.__connections):
+            self.disconnect(name)
+
+    def is_connected(self, name: str) -> bool:
+        """If there is a connection with this name"""
+        return name in self.__connections
+
+    def __len__(self) -> int:
+        return len(self.__connections)
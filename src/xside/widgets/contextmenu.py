@@ -1,4 +1,6 @@
 #!/usr/bin/env python3
+import dataclasses
+import functools
 import logging
 import os
 import pathlib
@@ -6,9 +8,7 @@ import pathlib
 from PySide6 import QtCore, QtGui, QtWidgets
 from __feature__ import snake_case
 
-from xside.modules import color
 from xside.modules.env import GuiEnv
-from xside.modules.style import StyleParser
 from xside.widgets.applicationwindow import ApplicationWindow
 from xside.widgets.contextlabel import ContextLabel
 from xside.widgets.tooltip import Tooltip
@@ -68,25 +68,31 @@ class ContextMenuButton(QtWidgets.QFrame):
         """..."""
         super().__init__(*args, **kwargs)
         self.__toplevel = toplevel
-        self.__contextmenu = context_menu
-        self.__text = text
-        self.__receiver = receiver
-        self.__icon = icon
-        self.__shortcut = shortcut
-        self.__shortcut_txt = shortcut.to_string() if shortcut else ' '
-        self.__is_quick_action = is_quick_action
-        self.__quick_action_label_as_tooltip = quick_action_label_as_tooltip
+        self.__contextmenu = None
+        self.__text = None
+        self.__receiver = None
+        self.__icon = None
+        self.__shortcut = None
+        self.__shortcut_txt = ' '
+        self.__is_quick_action = False
+        self.__quick_action_label_as_tooltip = True
         self.__tooltip = None
         self.__is_tooltip_open = False
         self.__tooltip_timer = QtCore.QTimer()
+        self.__tooltip_timer.set_single_shot(True)
+        self.__tooltip_timer.timeout.connect(self.__tooltip_exec)
 
         self.__env = GuiEnv(
             self.__toplevel.platform().operational_system(),
             self.__toplevel.platform().desktop_environment())
 
-        self.__style_parser = StyleParser(self.__toplevel.style_sheet())
-        self.__normal_style = self.__updated_normal_style()
-        self.__hover_style = self.__updated_hover_style()
+        self.__normal_style = self.__updated_normal_style(
+            self.__toplevel.connect_style_scope(
+                self.__set_normal_style_signal, 'ContextMenuButtonLabel'))
+        self.__hover_style = self.__updated_hover_style(
+            self.__toplevel.connect_style_scope(
+                self.__set_hover_style_signal,
+                'ContextMenuButtonLabel', 'hover'))
         self.__main_box = QtWidgets.QHBoxLayout()
         self.__main_box.set_contents_margins(0, 0, 0, 0)
         self.__main_box.set_spacing(0)
@@ -97,38 +103,71 @@ class ContextMenuButton(QtWidgets.QFrame):
         self.__left_box.set_alignment(QtCore.Qt.AlignLeft)
         self.__main_box.add_layout(self.__left_box)
 
+        self.__icon_label = QtWidgets.QLabel()
+        self.__icon_label.set_alignment(
+            QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter)
+        self.__left_box.add_widget(self.__icon_label)
+
+        self.__text_label = ContextMenuButtonLabel()
+        self.__text_label.set_alignment(QtCore.Qt.AlignLeft)
+        self.__left_box.add_widget(self.__text_label)
+
+        self.__shortcut_label = ContextLabel()
+        self.__shortcut_label.set_contents_margins(20, 0, 0, 0)
+        self.__shortcut_label.set_alignment(QtCore.Qt.AlignRight)
+        self.__main_box.add_widget(self.__shortcut_label)
+
+        self.set_action(
+            context_menu, text, receiver, icon, shortcut,
+            is_quick_action, quick_action_label_as_tooltip)
+
+    def set_action(
+            self,
+            context_menu: QtWidgets.QWidget,
+            text: str,
+            receiver: callable,
+            icon: QtGui.QIcon | None = None,
+            shortcut: QtGui.QKeySequence | None = None,
+            is_quick_action: bool = False,
+            quick_action_label_as_tooltip: bool = True) -> None:
+        """Configure the button for a new action
+
+        The same button widget can be reused by another action or another
+        context menu of the same toplevel, instead of building a new one.
+        """
+        self.__contextmenu = context_menu
+        self.__text = text
+        self.__receiver = receiver
+        self.__icon = icon
+        self.__shortcut = shortcut
+        self.__shortcut_txt = shortcut.to_string() if shortcut else ' '
+        self.__is_quick_action = is_quick_action
+        self.__quick_action_label_as_tooltip = quick_action_label_as_tooltip
+        self.__close_tooltip()
+
         self.__configure_icon()
-        icon_label = QtWidgets.QLabel()
-        icon_label.set_alignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter)
         if self.__is_quick_action:
             self.set_minimum_height(22)
             self.set_contents_margins(0, 1, 0, 1)
-            icon_label.set_minimum_height(18)
-
-        # Fix: Initial height is cutting the icon
-        icon_label.set_pixmap(self.__icon.pixmap(QtCore.QSize(16, 16)))
-        if self.__is_quick_action:
-            icon_label.set_contents_margins(0, 2, 0, 2)
-
-        self.__left_box.add_widget(icon_label)
-
-        self.__text_label = ContextMenuButtonLabel(self.__text)
-        self.__text_label.set_alignment(QtCore.Qt.AlignLeft)
-        if not self.__is_quick_action:
-            self.__left_box.add_widget(self.__text_label)
+            self.__icon_label.set_minimum_height(18)
+            # Fix: Initial height is cutting the icon
+            self.__icon_label.set_contents_margins(0, 2, 0, 2)
+        else:
+            self.set_minimum_height(0)
+            self.set_contents_margins(0, 0, 0, 0)
+            self.__icon_label.set_minimum_height(0)
+            self.__icon_label.set_contents_margins(0, 0, 0, 0)
+        self.__icon_label.set_pixmap(self.__icon.pixmap(QtCore.QSize(16, 16)))
 
-        if not self.__is_quick_action:
-            shortcut_label = ContextLabel(self.__shortcut_txt)
-            shortcut_label.set_contents_margins(20, 0, 0, 0)
-            shortcut_label.set_alignment(QtCore.Qt.AlignRight)
-            self.__main_box.add_widget(shortcut_label)
+        self.__text_label.set_text(self.__text)
+        self.__text_label.set_style_sheet(self.__normal_style)
+        self.__text_label.set_visible(not self.__is_quick_action)
 
-        if self.__is_quick_action and self.__quick_action_label_as_tooltip:
-            self.__tooltip = Tooltip(
-                self.__toplevel, self, self.__text, None, self.__shortcut)
+        self.__shortcut_label.set_text(self.__shortcut_txt)
+        self.__shortcut_label.set_visible(not self.__is_quick_action)
 
-        self.__toplevel.set_style_signal.connect(self.__set_style_signal)
-        self.__toplevel.reset_style_signal.connect(self.__set_style_signal)
+        if self.__tooltip:
+            self.__tooltip.set_text(self.__text, None, self.__shortcut)
 
     def text(self) -> str:
         """..."""
@@ -137,6 +176,20 @@ class ContextMenuButton(QtWidgets.QFrame):
     def tooltip_widget(self) -> QtWidgets.QWidget | None:
         return self.__tooltip
 
+    def __build_tooltip(self) -> None:
+        # The tooltip is only built on the first hover
+        if not self.__tooltip:
+            self.__tooltip = Tooltip(
+                self.__toplevel, self, self.__text, None, self.__shortcut)
+            self.__tooltip.set_style_sheet(self.__toplevel.style_sheet())
+
+    def __close_tooltip(self) -> None:
+        # ...
+        self.__is_tooltip_open = False
+        self.__tooltip_timer.stop()
+        if self.__tooltip:
+            self.__tooltip.close()
+
     def __configure_icon(self):
         # ...
         if not self.__icon:
@@ -146,11 +199,13 @@ class ContextMenuButton(QtWidgets.QFrame):
                 '../modules', 'static', f'context-menu-item{sym}.svg')
             self.__icon = QtGui.QIcon(QtGui.QPixmap(icon_path))
 
-    def __set_style_signal(self) -> None:
+    def __set_hover_style_signal(self, scope: str) -> None:
+        # ...
+        self.__hover_style = self.__updated_hover_style(scope)
+
+    def __set_normal_style_signal(self, scope: str) -> None:
         # ...
-        self.__style_parser.set_style_sheet(self.__toplevel.style_sheet())
-        self.__normal_style = self.__updated_normal_style()
-        self.__hover_style = self.__updated_hover_style()
+        self.__normal_style = self.__updated_normal_style(scope)
         self.__text_label.set_style_sheet(self.__normal_style)
 
     def __tooltip_exec(self):
@@ -159,36 +214,33 @@ class ContextMenuButton(QtWidgets.QFrame):
             self.__tooltip_timer.stop()
             self.__is_tooltip_open = True
 
-    def __updated_hover_style(self) -> str:
+    def __updated_hover_style(self, updated_hover_style: str) -> str:
         # ...
-        updated_hover_style = self.__style_parser.widget_scope(
-            'ContextMenuButtonLabel', 'hover')
         if not updated_hover_style:
-            fg = self.__env.settings().contextmenubutton_label_hover_color()
-            return (
-                'color: rgba'
-                f'({fg.red()}, {fg.green()}, {fg.blue()}, {fg.alpha()});')
+            fg = self.__env.settings().snapshot(
+                ).contextmenubutton_label_hover_color
+            return f'color: rgba({fg[0]}, {fg[1]}, {fg[2]}, {fg[3]});'
 
         return updated_hover_style
 
-    def __updated_normal_style(self) -> str:
+    def __updated_normal_style(self, updated_normal_style: str) -> str:
         # ...
-        updated_normal_style = self.__style_parser.widget_scope(
-            'ContextMenuButtonLabel')
         if not updated_normal_style:
-            fg = self.__env.settings().label_color()
-            return (
-                'color: rgba'
-                f'({fg.red()}, {fg.green()}, {fg.blue()}, {fg.alpha()});')
+            fg = self.__env.settings().snapshot().label_color
+            return f'color: rgba({fg[0]}, {fg[1]}, {fg[2]}, {fg[3]});'
 
         return updated_normal_style
 
+    def __uses_tooltip(self) -> bool:
+        # ...
+        return self.__is_quick_action and self.__quick_action_label_as_tooltip
+
     def enter_event(self, event: QtGui.QEnterEvent) -> None:
         """..."""
         self.enter_event_signal.emit(event)
-        if self.__tooltip and self.__is_quick_action:
+        if self.__uses_tooltip():
+            self.__build_tooltip()
             if not self.__is_tooltip_open:
-                self.__tooltip_timer.timeout.connect(self.__tooltip_exec)
                 self.__tooltip_timer.start(500)
         else:
             self.__text_label.set_style_sheet(self.__hover_style)
@@ -196,19 +248,15 @@ class ContextMenuButton(QtWidgets.QFrame):
     def leave_event(self, event: QtGui.QEnterEvent) -> None:
         """..."""
         self.leave_event_signal.emit(event)
-        if self.__tooltip and self.__is_quick_action:
-            self.__is_tooltip_open = False
-            self.__tooltip.close()
-            self.__tooltip_timer.stop()
+        if self.__uses_tooltip():
+            self.__close_tooltip()
         else:
             self.__text_label.set_style_sheet(self.__normal_style)
 
     def mouse_press_event(self, event: QtGui.QMouseEvent) -> None:
         self.mouse_press_event_signal.emit(event)
-        if self.__tooltip and self.__is_quick_action:
-            self.__is_tooltip_open = False
-            self.__tooltip.close()
-            self.__tooltip_timer.stop()
+        if self.__uses_tooltip():
+            self.__close_tooltip()
 
     def mouse_release_event(self, event: QtGui.QMouseEvent) -> None:
         """..."""
@@ -219,6 +267,93 @@ class ContextMenuButton(QtWidgets.QFrame):
             self.__contextmenu.close()
 
 
+class ContextMenuButtonPool(object):
+    """Reusable context menu buttons of a toplevel
+
+    All the context menus of the same toplevel share one pool. Buttons of a
+    cleared menu are released to the pool, and the next menu that is
+    opened takes them back instead of building new widgets. A button keeps
+    its tooltip, so the tooltips are reused too.
+
+    The pool is closed when its toplevel is deleted. Then the buttons that
+    are still in menus are deleted with them, instead of being released.
+    """
+    __pools = {}
+
+    def __init__(self, toplevel: ApplicationWindow) -> None:
+        """..."""
+        self.__toplevel = toplevel
+        self.__buttons = []
+        self.__closed = False
+
+    def __len__(self) -> int:
+        return len(self.__buttons)
+
+    @staticmethod
+    def pool(toplevel: ApplicationWindow) -> 'ContextMenuButtonPool':
+        """The pool shared by the context menus of the toplevel"""
+        key = id(toplevel)
+        if key not in ContextMenuButtonPool.__pools:
+            ContextMenuButtonPool.__pools[key] = ContextMenuButtonPool(
+                toplevel)
+            toplevel.destroyed.connect(
+                lambda *_: ContextMenuButtonPool.__pools.pop(key).close())
+        return ContextMenuButtonPool.__pools[key]
+
+    def acquire(
+            self,
+            context_menu: QtWidgets.QWidget,
+            text: str,
+            receiver: callable,
+            icon: QtGui.QIcon | None = None,
+            shortcut: QtGui.QKeySequence | None = None,
+            is_quick_action: bool = False,
+            quick_action_label_as_tooltip: bool = True
+            ) -> ContextMenuButton:
+        """A released button configured for the action, or a new one"""
+        if not self.__buttons:
+            return ContextMenuButton(
+                self.__toplevel, context_menu, text, receiver, icon,
+                shortcut, is_quick_action, quick_action_label_as_tooltip)
+
+        button = self.__buttons.pop()
+        button.set_action(
+            context_menu, text, receiver, icon, shortcut,
+            is_quick_action, quick_action_label_as_tooltip)
+        return button
+
+    def close(self) -> None:
+        """Delete the released buttons and stop keeping new ones"""
+        self.__closed = True
+        for button in self.__buttons:
+            button.delete_later()
+        self.__buttons.clear()
+
+    def release(self, button: ContextMenuButton) -> None:
+        """Detach the button from its menu and keep it for reuse"""
+        if self.__closed:
+            return
+        button.set_visible(False)
+        button.set_parent(None)
+        self.__buttons.append(button)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class ContextMenuItem(object):
+    """Context menu entry, built into a widget when the menu is opened
+
+    'kind' is one of: 'action', 'group-action', 'group' or 'separator'.
+    """
+    kind: str
+    text: str | None = None
+    receiver: callable = None
+    icon: QtGui.QIcon | None = None
+    shortcut: QtGui.QKeySequence | None = None
+    is_quick_action: bool = False
+    group_id: str | None = None
+    title_on_top: bool = False
+
+
 class ContextMenuGroup(QtWidgets.QFrame):
     """..."""
     def __init__(
@@ -286,7 +421,23 @@ class ContextMenu(TopFrame):
 
         self.__quick_mode = self.__is_quick_mode()
         self.__style_saved = self.__toplevel.style_sheet()
-        self.__style_parser = StyleParser(self.__style_saved)
+        self.__style_changed = True
+        self.__contextmenu_scope = self.__toplevel.connect_style_scope(
+            self.__set_contextmenu_scope_signal, 'ContextMenu')
+        for widget_class_name, propertie in (
+                ('ContextMenuButton', None),
+                ('ContextMenuButton', 'hover'),
+                ('ContextMenuButtonLabel', None),
+                ('ContextMenuButtonLabel', 'hover'),
+                ('ContextMenuGroup', None),
+                ('ContextMenuSeparator', None),
+                ('ContextMenuSeparatorLine', None),
+                ('ContextLabel', None)):
+            self.__toplevel.connect_style_scope(
+                self.__set_style_signal, widget_class_name, propertie)
+        self.__button_pool = ContextMenuButtonPool.pool(self.__toplevel)
+        self.__items = []
+        self.__built_items = 0
         self.__context_separators = []
         self.__action_buttons = []
         self.__quick_action_buttons = []
@@ -295,6 +446,12 @@ class ContextMenu(TopFrame):
         self.__point_y = None
         self.__quick_buttons_on_top = True
 
+        # Buttons that are still in the menu when it is deleted go back to
+        # the pool too. The menu is not referenced, it is being deleted
+        self.destroyed.connect(functools.partial(
+            ContextMenu.__release_buttons, self.__button_pool,
+            self.__action_buttons))
+
         # Main layout
         self.central_widget().set_object_name('ContextMenu')
 
@@ -344,9 +501,6 @@ class ContextMenu(TopFrame):
             self.__shadow_effect.set_color(QtGui.QColor(10, 10, 10, 70))
         self.central_widget().set_graphics_effect(self.__shadow_effect)
 
-        self.__toplevel.set_style_signal.connect(self.__set_style_signal)
-        self.__toplevel.reset_style_signal.connect(self.__set_style_signal)
-
     def add_action(
             self,
             text: str,
@@ -356,22 +510,8 @@ class ContextMenu(TopFrame):
             is_quick_action: bool = False,
             ) -> None:
         """..."""
-        context_button = ContextMenuButton(
-            self.__toplevel,
-            self,
-            text, receiver, icon, shortcut,
-            False if not self.__quick_mode else is_quick_action,
-            self.__quick_action_label_as_tooltip)
-        self.__action_buttons.append(context_button)
-
-        if is_quick_action:
-            if self.__quick_mode:
-                self.__quick_actions_top_hbox.add_widget(context_button)
-            else:
-                self.__quick_actions_box.add_widget(context_button)
-            self.__quick_action_buttons.append(context_button)
-        else:
-            self.__actions_box.add_widget(context_button)
+        self.__items.append(ContextMenuItem(
+            'action', text, receiver, icon, shortcut, is_quick_action))
 
     def add_group_action(
             self,
@@ -382,44 +522,60 @@ class ContextMenu(TopFrame):
             shortcut: QtGui.QKeySequence | None = None,
             ) -> None:
         """..."""
-        context_button = ContextMenuButton(
-            self.__toplevel, self, text, receiver, icon, shortcut, True, True)
-        self.__action_buttons.append(context_button)
-        self.__group_action_box[group_id].add_widget(context_button)
+        self.__items.append(ContextMenuItem(
+            'group-action', text, receiver, icon, shortcut, True, group_id))
 
     def add_group(
             self, group_id: str, title: str = None, title_on_top: bool = False
             ) -> None:
         """..."""
-        box = ContextMenuGroup(self.__toplevel, title, group_id, title_on_top)
-        box.set_style_sheet(self.__style_saved)
-        self.__actions_box.add_widget(box)
-        self.__group_action_box[group_id] = box
+        self.__items.append(ContextMenuItem(
+            'group', title, group_id=group_id, title_on_top=title_on_top))
 
     def add_separator(self) -> None:
         """..."""
-        separator = ContextMenuSeparator()
-        self.__actions_box.add_widget(separator)
-        self.__context_separators.append(separator)
+        self.__items.append(ContextMenuItem('separator'))
+
+    def clear(self) -> None:
+        """Remove all the actions, groups and separators
+
+        The action buttons go back to the pool of the toplevel, to be reused
+        by the next context menu that is opened.
+        """
+        self.__items.clear()
+        self.__built_items = 0
+        self.__release_buttons(self.__button_pool, self.__action_buttons)
+        self.__quick_action_buttons.clear()
+
+        for widget in (list(self.__group_action_box.values()) +
+                       self.__context_separators[2:]):
+            widget.set_parent(None)
+            widget.delete_later()
+        self.__group_action_box.clear()
+        del self.__context_separators[2:]
+        self.__quick_top_separator.set_visible(False)
+        self.__quick_bottom_separator.set_visible(False)
 
     def exec(self, point: QtCore.QPoint) -> None:
         """..."""
         self.__point_x = point.x()
         self.__point_y = point.y()
 
-        self.central_widget().set_style_sheet(self.__set_style())
-        for btn in self.__action_buttons:
-            if btn.tooltip_widget():
-                btn.tooltip_widget().set_style_sheet(self.__style_saved)
-            btn.set_style_sheet(self.__style_saved)
+        if self.__style_changed:
+            # Only restyle when the context menu scopes have changed
+            self.central_widget().set_style_sheet(self.__set_style())
+            for btn in self.__action_buttons:
+                self.__set_button_style(btn)
 
-        for btn in self.__quick_action_buttons:
-            if btn.tooltip_widget():
-                btn.tooltip_widget().set_style_sheet(self.__style_saved)
-            btn.set_style_sheet(self.__style_saved)
+            for sep in self.__context_separators:
+                sep.set_style_sheet(self.__style_saved)
 
-        for sep in self.__context_separators:
-            sep.set_style_sheet(self.__style_saved)
+            for group in self.__group_action_box.values():
+                group.set_style_sheet(self.__style_saved)
+            self.__style_changed = False
+
+        # Widgets are only built for the items added since the last 'exec'
+        self.__build_items()
 
         self.move(self.__point_x - 10, self.__point_y - 10)
         self.show()
@@ -435,6 +591,66 @@ class ContextMenu(TopFrame):
         self.__force_quick_mode = force
         self.__quick_mode = self.__is_quick_mode()
 
+    def __build_action(self, item: ContextMenuItem) -> None:
+        # ...
+        context_button = self.__button_pool.acquire(
+            self, item.text, item.receiver, item.icon, item.shortcut,
+            False if not self.__quick_mode else item.is_quick_action,
+            self.__quick_action_label_as_tooltip)
+        self.__set_button_style(context_button)
+        self.__action_buttons.append(context_button)
+
+        if item.is_quick_action:
+            if self.__quick_mode:
+                self.__quick_actions_top_hbox.add_widget(context_button)
+            else:
+                self.__quick_actions_box.add_widget(context_button)
+            self.__quick_action_buttons.append(context_button)
+        else:
+            self.__actions_box.add_widget(context_button)
+        context_button.set_visible(True)
+
+    def __build_group_action(self, item: ContextMenuItem) -> None:
+        # ...
+        context_button = self.__button_pool.acquire(
+            self, item.text, item.receiver, item.icon, item.shortcut,
+            True, True)
+        self.__set_button_style(context_button)
+        self.__action_buttons.append(context_button)
+        self.__group_action_box[item.group_id].add_widget(context_button)
+        context_button.set_visible(True)
+
+    def __build_group(self, item: ContextMenuItem) -> None:
+        # ...
+        box = ContextMenuGroup(
+            self.__toplevel, item.text, item.group_id, item.title_on_top)
+        box.set_style_sheet(self.__style_saved)
+        self.__actions_box.add_widget(box)
+        self.__group_action_box[item.group_id] = box
+
+    def __build_items(self) -> None:
+        # ...
+        if len(self.__items) == self.__built_items:
+            return
+
+        for item in self.__items[self.__built_items:]:
+            if item.kind == 'action':
+                self.__build_action(item)
+            elif item.kind == 'group-action':
+                self.__build_group_action(item)
+            elif item.kind == 'group':
+                self.__build_group(item)
+            else:
+                self.__build_separator()
+        self.__built_items = len(self.__items)
+
+    def __build_separator(self) -> None:
+        # ...
+        separator = ContextMenuSeparator()
+        separator.set_style_sheet(self.__style_saved)
+        self.__actions_box.add_widget(separator)
+        self.__context_separators.append(separator)
+
     def __is_quick_mode(self) -> bool:
         if (self.__toplevel.platform().desktop_environment() == 'windows-11' or
                 self.__force_quick_mode):
@@ -463,18 +679,33 @@ class ContextMenu(TopFrame):
         self.__point_x, self.__point_y = x, y
         self.move(self.__point_x, self.__point_y)
 
-    def __set_style_signal(self) -> None:
+    @staticmethod
+    def __release_buttons(
+            button_pool: ContextMenuButtonPool, buttons: list, *_) -> None:
+        # Give the buttons back to the pool, and empty the list
+        for btn in buttons:
+            button_pool.release(btn)
+        buttons.clear()
+
+    def __set_button_style(self, button: ContextMenuButton) -> None:
+        # ...
+        if button.tooltip_widget():
+            button.tooltip_widget().set_style_sheet(self.__style_saved)
+        button.set_style_sheet(self.__style_saved)
+
+    def __set_contextmenu_scope_signal(self, scope: str) -> None:
+        # ...
+        self.__contextmenu_scope = scope
+        self.__set_style_signal(scope)
+
+    def __set_style_signal(self, scope: str) -> None:
         # ...
         self.__style_saved = self.__toplevel.style_sheet()
-        self.__style_parser.set_style_sheet(self.__style_saved)
+        self.__style_changed = True
 
     def __set_style(self) -> str:
         # ...
-        if not self.__style_saved:
-            self.__set_style_signal()
-
-        return ('#ContextMenu {'
-                f'{self.__style_parser.widget_scope("ContextMenu")}' '}')
+        return '#ContextMenu {' f'{self.__contextmenu_scope}' '}'
 
     def __toggle_quick_buttons_position(self):
         for btn in self.__quick_action_buttons:
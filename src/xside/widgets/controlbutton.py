@@ -9,6 +9,7 @@ from __feature__ import snake_case
 
 from xside.modules import color
 from xside.modules.env import GuiEnv
+from xside.widgets.connections import UniqueConnections
 
 
 class ControlButton(QtWidgets.QToolButton):
@@ -42,6 +43,7 @@ class ControlButton(QtWidgets.QToolButton):
         self.__background_color = None
         self.__is_dark = self.__is_dark_tone()
         self.__maximize_or_restore_icon = 'maximize'
+        self.__connections = UniqueConnections()
         self.__toplevel.resize_event_signal.connect(
             self.__check_maximize_and_restore_icon)
 
@@ -67,7 +69,8 @@ class ControlButton(QtWidgets.QToolButton):
                 self.set_icon(
                     QtGui.QIcon.from_theme('window-minimize-symbolic'))
 
-            self.clicked.connect(
+            self.__connections.connect(
+                'clicked', self.clicked,
                 lambda _: self.__toplevel.show_minimized())
 
         elif self.__button_id == 1:
@@ -86,14 +89,15 @@ class ControlButton(QtWidgets.QToolButton):
             if 'background: url' not in style:
                 self.set_icon(QtGui.QIcon.from_theme('window-close-symbolic'))
 
-            self.clicked.connect(
-                lambda _: self.__toplevel.close())
+            self.__connections.connect(
+                'clicked', self.clicked, lambda _: self.__toplevel.close())
 
     def __is_dark_tone(self) -> bool:
         # ...
 
-        return color.is_dark(
-            self.__gui_env.settings().background_color().to_tuple())
+        if self.__background_color:
+            return color.is_dark(self.__background_color)
+        return self.__gui_env.settings().snapshot().window_is_dark
 
     def __check_maximize_and_restore_icon(
             self, event: QtGui.QResizeEvent) -> None:
@@ -119,11 +123,14 @@ class ControlButton(QtWidgets.QToolButton):
                     self.set_icon(
                         QtGui.QIcon.from_theme('window-maximize-symbolic'))
 
+            # Resize events are frequent: replace the connection, don't add
             if self.__maximize_or_restore_icon == 'restore':
-                self.clicked.connect(
+                self.__connections.connect(
+                    'clicked', self.clicked,
                     lambda _: self.native_parent_widget().show_normal())
             else:
-                self.clicked.connect(
+                self.__connections.connect(
+                    'clicked', self.clicked,
                     lambda _: self.native_parent_widget().show_maximized())
 
     def enter_event(self, event: QtGui.QEnterEvent) -> None:
@@ -3,111 +3,226 @@ from PySide6 import QtCore, QtGui, QtWidgets
 from __feature__ import snake_case
 
 
-class MainWindow(QtWidgets.QFrame):
+class BackgroundImageFrame(QtWidgets.QFrame):
+    """Frame that can paint an image over its style sheet background
+
+    The image covers the whole window of the frame, so frames in different
+    places of the window show their own part of the same image. It is
+    painted in memory, without changing the style sheet.
+    """
+    def __init__(self, *args, **kwargs) -> None:
+        """..."""
+        super().__init__(*args, **kwargs)
+        self.__background_image = None
+        self.__background_radii = (0, 0, 0, 0)
+        self.__background_margins = (0, 0, 0, 0)
+        self.__background_opacity = 1.0
+        self.__background_overlay = None
+
+    def background_image(self) -> QtGui.QImage | None:
+        """..."""
+        return self.__background_image
+
+    def background_margins(self) -> tuple:
+        """Left, top, right and bottom margins of the background image"""
+        return self.__background_margins
+
+    def background_overlay(self) -> QtGui.QColor | None:
+        """Color painted over the background image"""
+        return self.__background_overlay
+
+    def background_radii(self) -> tuple:
+        """Top-left, top-right, bottom-right and bottom-left radii"""
+        return self.__background_radii
+
+    def set_background_image(
+            self,
+            image: QtGui.QImage | None,
+            radii: tuple = (0, 0, 0, 0),
+            margins: tuple = (0, 0, 0, 0),
+            opacity: float = 1.0,
+            overlay: QtGui.QColor | None = None) -> None:
+        """Paint the image over the style sheet background
+
+        :param image: Image the size of the window, None removes it
+        :param radii: Top-left, top-right, bottom-right and bottom-left
+            corner radii, in pixels
+        :param margins: Left, top, right and bottom margins, in pixels
+        :param opacity: Image opacity, from 0.0 to 1.0
+        :param overlay: Color painted over the image, like a tint
+        """
+        self.__background_image = image
+        self.__background_radii = radii
+        self.__background_margins = margins
+        self.__background_opacity = opacity
+        self.__background_overlay = overlay
+        self.update()
+
+    def paint_event(self, event: QtGui.QPaintEvent) -> None:
+        """..."""
+        if self.__background_image is not None:
+            left, top, right, bottom = self.__background_margins
+            rect = QtCore.QRectF(self.rect()).adjusted(
+                left, top, -right, -bottom)
+            # The image covers the whole window
+            offset = self.map_from(self.window(), QtCore.QPoint(0, 0))
+
+            painter = QtGui.QPainter(self)
+            painter.set_render_hint(QtGui.QPainter.Antialiasing)
+            painter.set_clip_path(self.__rounded_rect_path(rect))
+            painter.set_opacity(self.__background_opacity)
+            painter.draw_image(offset, self.__background_image)
+            if self.__background_overlay:
+                painter.fill_rect(rect, self.__background_overlay)
+            painter.end()
+
+        super().paint_event(event)
+
+    def __rounded_rect_path(self, rect: QtCore.QRectF) -> QtGui.QPainterPath:
+        # Rect with a different radius for each corner
+        top_left, top_right, bottom_right, bottom_left = (
+            self.__background_radii)
+        path = QtGui.QPainterPath()
+        path.move_to(rect.left() + top_left, rect.top())
+        path.line_to(rect.right() - top_right, rect.top())
+        path.arc_to(
+            rect.right() - top_right * 2, rect.top(),
+            top_right * 2, top_right * 2, 90, -90)
+        path.line_to(rect.right(), rect.bottom() - bottom_right)
+        path.arc_to(
+            rect.right() - bottom_right * 2, rect.bottom() - bottom_right * 2,
+            bottom_right * 2, bottom_right * 2, 0, -90)
+        path.line_to(rect.left() + bottom_left, rect.bottom())
+        path.arc_to(
+            rect.left(), rect.bottom() - bottom_left * 2,
+            bottom_left * 2, bottom_left * 2, 270, -90)
+        path.line_to(rect.left(), rect.top() + top_left)
+        path.arc_to(
+            rect.left(), rect.top(), top_left * 2, top_left * 2, 180, -90)
+        path.close_subpath()
+        return path
+
+
+class MainWindow(BackgroundImageFrame):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
 
-class Shadow(QtWidgets.QFrame):
-    def __init__(self, position: str, *args, **kwargs) -> None:
+class Shadow(QtWidgets.QWidget):
+    """Window shadow
+
+    Paints the shadow around its child widget. The shadow is a nine-patch
+    pixmap, rendered once for each shadow size, colors and device pixel ratio
+    and shared by all windows. The corners are painted as they are and the
+    edges and center are stretched.
+    """
+    __nine_patches = {}
+
+    def __init__(self, shadow_size: int, *args, **kwargs) -> None:
+        """..."""
         super().__init__(*args, **kwargs)
-        self.set_object_name('toplevelwindowshadow')
-        self.__shadow_color = 'rgba(0, 0, 0, 20)'
-        self.__corner_shadow_color = 'rgba(0, 0, 0, 15)'
-        self.__end_color = 'rgba(0, 0, 0, 0)'
-
-        if position == 'top-left':
-            self.set_style_sheet(
-                '#toplevelwindowshadow {'
-                'background:'
-                '  qradialgradient('
-                '  cx: 0.7, cy: 0.7, radius: 2, fx: 1.0, fy: 1.0,'
-                f' stop: 0.0 {self.__corner_shadow_color},'
-                f' stop: 0.4 {self.__end_color});'
-                '}')
-
-        elif position == 'top':
-            self.set_style_sheet(
-                '#toplevelwindowshadow {'
-                'background: qlineargradient('
-                '  x1:0 y1:0, x2:0 y2:1,'
-                f' stop:0.0 {self.__end_color},'
-                f' stop:1.0 {self.__shadow_color});'
-                '}')
-
-        elif position == 'top-right':
-            self.set_style_sheet(
-                '#toplevelwindowshadow {'
-                'background:'
-                '  qradialgradient('
-                '  cx: 0.3, cy: 0.7, radius: 2, fx: 0.0, fy: 1.0,'
-                f' stop: 0.0 {self.__corner_shadow_color},'
-                f' stop: 0.4 {self.__end_color});'
-                '}')
-
-        elif position == 'left':
-            self.set_style_sheet(
-                '#toplevelwindowshadow {'
-                'background: qlineargradient('
-                '  x1:0 y1:0, x2:1 y2:0,'
-                f' stop:0.0 {self.__end_color},'
-                f' stop:1.0 {self.__shadow_color});'
-                '}')
-
-        elif position == 'right':
-            self.set_style_sheet(
-                '#toplevelwindowshadow {'
-                'background: qlineargradient('
-                '  x1:0 y1:0, x2:1 y2:0,'
-                f' stop:0.0 {self.__shadow_color},'
-                f' stop:1.0 {self.__end_color});'
-                '}')
-
-        elif position == 'bottom-left':
-            self.set_style_sheet(
-                '#toplevelwindowshadow {'
-                'background:'
-                '  qradialgradient('
-                '  cx: 0.7, cy: 0.3, radius: 2, fx: 1.0, fy: 0.0,'
-                f' stop: 0.0 {self.__corner_shadow_color},'
-                f' stop: 0.4 {self.__end_color});'
-                '}')
-
-        elif position == 'bottom':
-            self.set_style_sheet(
-                '#toplevelwindowshadow {'
-                'background: qlineargradient('
-                '  x1:0 y1:0, x2:0 y2:1,'
-                f' stop:0.0 {self.__shadow_color},'
-                f' stop:1.0 {self.__end_color});'
-                '}')
-
-        elif position == 'bottom-right':
-            self.set_style_sheet(
-                '#toplevelwindowshadow {'
-                'background:'
-                '  qradialgradient('
-                '  cx: 0.3, cy: 0.3, radius: 2, fx: 0.0, fy: 0.0,'
-                f' stop: 0.0 {self.__corner_shadow_color},'
-                f' stop: 0.4 {self.__end_color});'
-                '}')
-        else:
-            self.set_style_sheet(
-                '#toplevelwindowshadow {'
-                f'background-color: {self.__shadow_color};'
-                '}')
-
-    def set_background_shadow_visible(self, visible: bool) -> None:
-        if visible:
-            self.set_style_sheet(
-                '#toplevelwindowshadow {'
-                f'background-color: {self.__shadow_color};'
-                '}')
-        else:
-            self.set_style_sheet(
-                '#toplevelwindowshadow {'
-                f'background-color: {self.__end_color};'
-                '}')
+        self.__shadow_size = shadow_size
+        self.__shadow_color = QtGui.QColor(0, 0, 0, 20)
+        self.__corner_shadow_color = QtGui.QColor(0, 0, 0, 15)
+        self.__end_color = QtGui.QColor(0, 0, 0, 0)
+        self.__is_shadow_visible = True
+
+        self.__box = QtWidgets.QVBoxLayout()
+        self.__box.set_contents_margins(
+            self.__shadow_size, self.__shadow_size,
+            self.__shadow_size, self.__shadow_size)
+        self.__box.set_spacing(0)
+        self.set_layout(self.__box)
+
+    def add_widget(self, widget: QtWidgets.QWidget) -> None:
+        """..."""
+        self.__box.add_widget(widget)
+
+    def set_shadow_visible(self, visible: bool) -> None:
+        """..."""
+        self.__is_shadow_visible = visible
+        margin = self.__shadow_size if visible else 0
+        self.__box.set_contents_margins(margin, margin, margin, margin)
+        self.update()
+
+    def paint_event(self, event: QtGui.QPaintEvent) -> None:
+        """..."""
+        if not self.__is_shadow_visible:
+            return
+
+        dpr = self.device_pixel_ratio_f()
+        nine_patch = self.__nine_patch(dpr)
+        size = self.__shadow_size
+        width, height = self.width(), self.height()
+        middle_w = max(0, width - size * 2)
+        middle_h = max(0, height - size * 2)
+
+        # (target x, y, w, h), (source x, y, w, h) in logical pixels
+        pieces = (
+            ((0, 0, size, size), (0, 0, size, size)),
+            ((size, 0, middle_w, size), (size, 0, 1, size)),
+            ((width - size, 0, size, size), (size + 1, 0, size, size)),
+            ((0, size, size, middle_h), (0, size, size, 1)),
+            ((size, size, middle_w, middle_h), (size, size, 1, 1)),
+            ((width - size, size, size, middle_h), (size + 1, size, size, 1)),
+            ((0, height - size, size, size), (0, size + 1, size, size)),
+            ((size, height - size, middle_w, size), (size, size + 1, 1, size)),
+            ((width - size, height - size, size, size),
+             (size + 1, size + 1, size, size)))
+
+        painter = QtGui.QPainter(self)
+        for target, source in pieces:
+            painter.draw_pixmap(
+                QtCore.QRectF(*target), nine_patch,
+                QtCore.QRectF(*[x * dpr for x in source]))
+        painter.end()
+
+    def __nine_patch(self, dpr: float) -> QtGui.QPixmap:
+        # Cached (size * 2 + 1) square: corners, 1px edges and 1px center
+        key = (
+            self.__shadow_size, self.__shadow_color.rgba(),
+            self.__corner_shadow_color.rgba(), dpr)
+        if key in Shadow.__nine_patches:
+            return Shadow.__nine_patches[key]
+
+        size = self.__shadow_size
+        side = size * 2 + 1
+        pixmap = QtGui.QPixmap(round(side * dpr), round(side * dpr))
+        pixmap.set_device_pixel_ratio(dpr)
+        pixmap.fill(QtCore.Qt.transparent)
+
+        painter = QtGui.QPainter(pixmap)
+        painter.set_pen(QtCore.Qt.NoPen)
+
+        # Edges: (gradient start, gradient end, area), from the window out
+        for start, end, area in (
+                ((0, size), (0, 0), (size, 0, 1, size)),
+                ((0, size + 1), (0, side), (size, size + 1, 1, size)),
+                ((size, 0), (0, 0), (0, size, size, 1)),
+                ((size + 1, 0), (side, 0), (size + 1, size, size, 1))):
+            gradient = QtGui.QLinearGradient(*start, *end)
+            gradient.set_color_at(0.0, self.__shadow_color)
+            gradient.set_color_at(1.0, self.__end_color)
+            painter.fill_rect(QtCore.QRectF(*area), gradient)
+
+        # Corners: (gradient center, area), centered on the window corner
+        for center, area in (
+                ((size, size), (0, 0, size, size)),
+                ((size + 1, size), (size + 1, 0, size, size)),
+                ((size, size + 1), (0, size + 1, size, size)),
+                ((size + 1, size + 1), (size + 1, size + 1, size, size))):
+            gradient = QtGui.QRadialGradient(*center, size)
+            gradient.set_color_at(0.0, self.__corner_shadow_color)
+            gradient.set_color_at(1.0, self.__end_color)
+            painter.fill_rect(QtCore.QRectF(*area), gradient)
+
+        # Center, behind the window
+        painter.fill_rect(
+            QtCore.QRectF(size, size, 1, 1), self.__shadow_color)
+        painter.end()
+
+        Shadow.__nine_patches[key] = pixmap
+        return pixmap
 
 
 class BaseWindow(QtWidgets.QMainWindow):
@@ -122,80 +237,13 @@ class BaseWindow(QtWidgets.QMainWindow):
         self.__is_shadow_has_added = True
 
         self.__border_radius = (10, 10, 0, 0)
-        self.__width = 500
-        self.__height = 500
         self.__shadow_size = 8
 
-        self.__mainwidget = QtWidgets.QWidget()
-        self.__mainwidget.set_contents_margins(0, 0, 0, 0)
-        self.set_central_widget(self.__mainwidget)
-
-        self.__main_box = QtWidgets.QVBoxLayout()
-        self.__main_box.set_contents_margins(0, 0, 0, 0)
-        self.__main_box.set_spacing(0)
-        self.__mainwidget.set_layout(self.__main_box)
-
-        # Top
-        self.__top_box = QtWidgets.QHBoxLayout()
-        self.__main_box.add_layout(self.__top_box)
-
-        self.__top_left_shadow = Shadow('top-left')
-        self.__top_left_shadow.set_fixed_width(self.__shadow_size)
-        self.__top_left_shadow.set_fixed_height(self.__shadow_size)
-        self.__top_box.add_widget(self.__top_left_shadow)
-
-        self.__top_shadow = Shadow('top')
-        self.__top_shadow.set_fixed_height(self.__shadow_size)
-        self.__top_box.add_widget(self.__top_shadow)
-
-        self.__top_right_shadow = Shadow('top-right')
-        self.__top_right_shadow.set_fixed_width(self.__shadow_size)
-        self.__top_right_shadow.set_fixed_height(self.__shadow_size)
-        self.__top_box.add_widget(self.__top_right_shadow)
-
-        # Left
-        self.__left_center_right_box = QtWidgets.QHBoxLayout()
-        self.__main_box.add_layout(self.__left_center_right_box)
-
-        self.__left_shadow = Shadow('left')
-        self.__left_shadow.set_fixed_width(self.__shadow_size)
-        self.__left_center_right_box.add_widget(self.__left_shadow)
-
-        # Center
-        self.__center_shadow = Shadow('center')
-        self.__center_shadow.resize(self.__width, self.__height)
-        self.__left_center_right_box.add_widget(self.__center_shadow)
-
-        self.__central_widget_box = QtWidgets.QVBoxLayout()
-        self.__central_widget_box.set_contents_margins(0, 0, 0, 0)
-        self.__central_widget_box.set_spacing(0)
-        self.__center_shadow.set_layout(self.__central_widget_box)
+        self.__shadow = Shadow(self.__shadow_size)
+        self.set_central_widget(self.__shadow)
 
         self.__central_widget = MainWindow()
-        self.__central_widget_box.add_widget(self.__central_widget)
-
-        # Right
-        self.__right_shadow = Shadow('right')
-        self.__right_shadow.set_fixed_width(self.__shadow_size)
-        self.__left_center_right_box.add_widget(self.__right_shadow)
-
-        # Bottom
-        self.__bottom_box = QtWidgets.QHBoxLayout()
-        self.__main_box.add_layout(self.__bottom_box)
-
-        self.__bottom_left_shadow = Shadow('bottom-left')
-        self.__bottom_left_shadow.set_fixed_width(self.__shadow_size)
-        self.__bottom_left_shadow.set_fixed_height(self.__shadow_size)
-        self.__bottom_box.add_widget(self.__bottom_left_shadow)
-
-        self.__bottom_shadow = Shadow('bottom')
-        self.__bottom_shadow.set_fixed_height(self.__shadow_size)
-        self.__bottom_box.add_widget(self.__bottom_shadow)
-
-        self.__bottom_right_shadow = Shadow('bottom-right')
-        self.__bottom_right_shadow.set_fixed_width(self.__shadow_size)
-        self.__bottom_right_shadow.set_fixed_height(self.__shadow_size)
-        self.__bottom_box.add_widget(self.__bottom_right_shadow)
+        self.__shadow.add_widget(self.__central_widget)
 
     def central_widget(self) -> QtWidgets:
         """..."""
@@ -207,37 +255,8 @@ class BaseWindow(QtWidgets.QMainWindow):
 
     def set_shadow_as_hidden(self, hide_value: bool) -> None:
         """..."""
-        if hide_value:
-            self.__center_shadow.set_background_shadow_visible(False)
-
-            self.__bottom_left_shadow.set_visible(False)
-            self.__bottom_shadow.set_visible(False)
-            self.__bottom_right_shadow.set_visible(False)
-
-            self.__top_left_shadow.set_visible(False)
-            self.__top_shadow.set_visible(False)
-            self.__top_right_shadow.set_visible(False)
-
-            self.__left_shadow.set_visible(False)
-            self.__right_shadow.set_visible(False)
-
-            self.__is_shadow_has_added = False
-
-        else:
-            self.__center_shadow.set_background_shadow_visible(True)
-
-            self.__bottom_left_shadow.set_visible(True)
-            self.__bottom_shadow.set_visible(True)
-            self.__bottom_right_shadow.set_visible(True)
-
-            self.__top_left_shadow.set_visible(True)
-            self.__top_shadow.set_visible(True)
-            self.__top_right_shadow.set_visible(True)
-
-            self.__left_shadow.set_visible(True)
-            self.__right_shadow.set_visible(True)
-
-            self.__is_shadow_has_added = True
+        self.__shadow.set_shadow_visible(not hide_value)
+        self.__is_shadow_has_added = not hide_value
 
 
 class BaseTopFrame(QtWidgets.QFrame):
@@ -254,80 +273,18 @@ class BaseTopFrame(QtWidgets.QFrame):
         self.__is_shadow_has_added = True
 
         self.__border_radius = (10, 10, 0, 0)
-        self.__width = 500
-        self.__height = 500
         self.__shadow_size = 8
 
-        # self.__mainwidget = QtWidgets.QWidget()
-        # self.__mainwidget.set_contents_margins(0, 0, 0, 0)
-        # self.set_central_widget(self.__mainwidget)
-
         self.__main_box = QtWidgets.QVBoxLayout()
         self.__main_box.set_contents_margins(0, 0, 0, 0)
         self.__main_box.set_spacing(0)
         self.set_layout(self.__main_box)
 
-        # Top
-        self.__top_box = QtWidgets.QHBoxLayout()
-        self.__main_box.add_layout(self.__top_box)
-
-        self.__top_left_shadow = Shadow('top-left')
-        self.__top_left_shadow.set_fixed_width(self.__shadow_size)
-        self.__top_left_shadow.set_fixed_height(self.__shadow_size)
-        self.__top_box.add_widget(self.__top_left_shadow)
-
-        self.__top_shadow = Shadow('top')
-        self.__top_shadow.set_fixed_height(self.__shadow_size)
-        self.__top_box.add_widget(self.__top_shadow)
-
-        self.__top_right_shadow = Shadow('top-right')
-        self.__top_right_shadow.set_fixed_width(self.__shadow_size)
-        self.__top_right_shadow.set_fixed_height(self.__shadow_size)
-        self.__top_box.add_widget(self.__top_right_shadow)
-
-        # Left
-        self.__left_center_right_box = QtWidgets.QHBoxLayout()
-        self.__main_box.add_layout(self.__left_center_right_box)
-
-        self.__left_shadow = Shadow('left')
-        self.__left_shadow.set_fixed_width(self.__shadow_size)
-        self.__left_center_right_box.add_widget(self.__left_shadow)
-
-        # Center
-        self.__center_shadow = Shadow('center')
-        self.__center_shadow.resize(self.__width, self.__height)
-        self.__left_center_right_box.add_widget(self.__center_shadow)
-
-        self.__central_widget_box = QtWidgets.QVBoxLayout()
-        self.__central_widget_box.set_contents_margins(0, 0, 0, 0)
-        self.__central_widget_box.set_spacing(0)
-        self.__center_shadow.set_layout(self.__central_widget_box)
+        self.__shadow = Shadow(self.__shadow_size)
+        self.__main_box.add_widget(self.__shadow)
 
         self.__central_widget = MainWindow()
-        self.__central_widget_box.add_widget(self.__central_widget)
-
-        # Right
-        self.__right_shadow = Shadow('right')
-        self.__right_shadow.set_fixed_width(self.__shadow_size)
-        self.__left_center_right_box.add_widget(self.__right_shadow)
-
-        # Bottom
-        self.__bottom_box = QtWidgets.QHBoxLayout()
-        self.__main_box.add_layout(self.__bottom_box)
-
-        self.__bottom_left_shadow = Shadow('bottom-left')
-        self.__bottom_left_shadow.set_fixed_width(self.__shadow_size)
-        self.__bottom_left_shadow.set_fixed_height(self.__shadow_size)
-        self.__bottom_box.add_widget(self.__bottom_left_shadow)
-
-        self.__bottom_shadow = Shadow('bottom')
-        self.__bottom_shadow.set_fixed_height(self.__shadow_size)
-        self.__bottom_box.add_widget(self.__bottom_shadow)
-
-        self.__bottom_right_shadow = Shadow('bottom-right')
-        self.__bottom_right_shadow.set_fixed_width(self.__shadow_size)
-        self.__bottom_right_shadow.set_fixed_height(self.__shadow_size)
-        self.__bottom_box.add_widget(self.__bottom_right_shadow)
+        self.__shadow.add_widget(self.__central_widget)
 
     def central_widget(self) -> QtWidgets:
         """..."""
@@ -339,34 +296,5 @@ class BaseTopFrame(QtWidgets.QFrame):
 
     def set_shadow_as_hidden(self, hide_value: bool) -> None:
         """..."""
-        if hide_value:
-            self.__center_shadow.set_background_shadow_visible(False)
-
-            self.__bottom_left_shadow.set_visible(False)
-            self.__bottom_shadow.set_visible(False)
-            self.__bottom_right_shadow.set_visible(False)
-
-            self.__top_left_shadow.set_visible(False)
-            self.__top_shadow.set_visible(False)
-            self.__top_right_shadow.set_visible(False)
-
-            self.__left_shadow.set_visible(False)
-            self.__right_shadow.set_visible(False)
-
-            self.__is_shadow_has_added = False
-
-        else:
-            self.__center_shadow.set_background_shadow_visible(True)
-
-            self.__bottom_left_shadow.set_visible(True)
-            self.__bottom_shadow.set_visible(True)
-            self.__bottom_right_shadow.set_visible(True)
-
-            self.__top_left_shadow.set_visible(True)
-            self.__top_shadow.set_visible(True)
-            self.__top_right_shadow.set_visible(True)
-
-            self.__left_shadow.set_visible(True)
-            self.__right_shadow.set_visible(True)
-
-            self.__is_shadow_has_added = True
+        self.__shadow.set_shadow_visible(not hide_value)
+        self.__is_shadow_has_added = not hide_value
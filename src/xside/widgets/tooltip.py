@@ -5,7 +5,6 @@ import os
 from PySide6 import QtCore, QtGui, QtWidgets
 from __feature__ import snake_case
 
-from xside.modules.style import StyleParser
 from xside.widgets.contextlabel import ContextLabel
 from xside.widgets.topframe import TopFrame
 
@@ -38,8 +37,11 @@ class Tooltip(TopFrame):
             QtCore.Qt.FramelessWindowHint | QtCore.Qt.ToolTip)
 
         self.__is_dark = self.__toplevel.is_dark()
-        self.__style_saved = self.__toplevel.style_sheet()
-        self.__style_parser = StyleParser(self.__style_saved)
+        self.__style_changed = True
+        self.__contextmenu_scope = self.__toplevel.connect_style_scope(
+            self.__set_contextmenu_scope_signal, 'ContextMenu')
+        self.__contextlabel_scope = self.__toplevel.connect_style_scope(
+            self.__set_contextlabel_scope_signal, 'ContextLabel')
 
         # Main layout
         self.__main_box = QtWidgets.QHBoxLayout()
@@ -63,13 +65,13 @@ class Tooltip(TopFrame):
 
         self.__shortcut_label = ContextLabel(
             self.__shortcut if self.__shortcut else '')
-        if self.__shortcut:
-            self.__label_box.add_widget(self.__shortcut_label)
+        self.__shortcut_label.set_visible(bool(self.__shortcut))
+        self.__label_box.add_widget(self.__shortcut_label)
 
         self.__complement_label = ContextLabel(
             self.__complement_text if self.__complement_text else '')
-        if self.__complement_text:
-            self.__body_box.add_widget(self.__complement_label)
+        self.__complement_label.set_visible(bool(self.__complement_text))
+        self.__body_box.add_widget(self.__complement_label)
 
         # Shadow
         self.__shadow_effect = QtWidgets.QGraphicsDropShadowEffect(self)
@@ -81,20 +83,19 @@ class Tooltip(TopFrame):
         else:
             self.__shadow_effect.set_color(QtGui.QColor(10, 10, 10, 70))
         self.central_widget().set_graphics_effect(self.__shadow_effect)
-
-        self.__toplevel.set_style_signal.connect(self.__set_style_signal)
-        self.__toplevel.reset_style_signal.connect(self.__set_style_signal)
         self.set_mouse_tracking(True)
 
     def exec(self) -> None:
         """..."""
-        self.central_widget().set_style_sheet(
-            '#QTooltip {'
-            f'{self.__style_parser.widget_scope("ContextMenu")}'
-            '}'
-            'ContextLabel {'
-            f'{self.__style_parser.widget_scope("ContextLabel")}'
-            '}')
+        if self.__style_changed:
+            self.central_widget().set_style_sheet(
+                '#QTooltip {'
+                f'{self.__contextmenu_scope}'
+                '}'
+                'ContextLabel {'
+                f'{self.__contextlabel_scope}'
+                '}')
+            self.__style_changed = False
 
         point = QtGui.QCursor.pos()
         self.show()
@@ -102,6 +103,24 @@ class Tooltip(TopFrame):
             point.x() - self.__parent.width() // 2,
             point.y() - (self.height() + 10))
 
+    def set_text(
+            self,
+            text: str,
+            complement_text: str = None,
+            shortcut: QtGui.QKeySequence | None = None) -> None:
+        """Change the texts, so the same tooltip can be reused"""
+        self.__text = text
+        self.__complement_text = complement_text
+        self.__shortcut = f'({shortcut.to_string()})' if shortcut else ''
+
+        self.__label.set_text(self.__text)
+        self.__shortcut_label.set_text(self.__shortcut)
+        self.__shortcut_label.set_visible(bool(self.__shortcut))
+        self.__complement_label.set_text(
+            self.__complement_text if self.__complement_text else '')
+        self.__complement_label.set_visible(bool(self.__complement_text))
+        self.adjust_size()
+
     def mouse_move_event(self, event: QtGui.QMouseEvent) -> None:
         logging.info(event)
         self.close()
@@ -121,7 +140,12 @@ class Tooltip(TopFrame):
 
         self.move(x, y)
 
-    def __set_style_signal(self) -> None:
+    def __set_contextlabel_scope_signal(self, scope: str) -> None:
+        # ...
+        self.__contextlabel_scope = scope
+        self.__style_changed = True
+
+    def __set_contextmenu_scope_signal(self, scope: str) -> None:
         # ...
-        self.__style_saved = self.__toplevel.style_sheet()
-        self.__style_parser.set_style_sheet(self.__style_saved)
+        self.__contextmenu_scope = scope
+        self.__style_changed = True
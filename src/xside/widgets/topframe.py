@@ -34,7 +34,7 @@ class TopFrame(BaseTopFrame):
 
     def set_style_sheet(self, style: str) -> None:
         """..."""
-        self.__style_parser.set_style_sheet(self.__style_sheet + style)
+        self.__style_parser.merge(style)
         self.__style_sheet = self.__style_parser.style_sheet()
 
         self.central_widget().set_style_sheet(self.__style_sheet)